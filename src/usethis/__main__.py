@@ -7,6 +7,8 @@ import typer
 import usethis._interface.badge
 import usethis._interface.browse
 import usethis._interface.ci
+import usethis._interface.fleet
+import usethis._interface.pre_commit
 import usethis._interface.show
 import usethis._interface.tool
 from usethis._config import quiet_opt, usethis_config
@@ -28,6 +30,7 @@ app = typer.Typer(
 app.add_typer(usethis._interface.badge.app, name="badge")
 app.add_typer(usethis._interface.browse.app, name="browse")
 app.add_typer(usethis._interface.ci.app, name="ci")
+app.add_typer(usethis._interface.pre_commit.app, name="pre-commit")
 app.add_typer(usethis._interface.show.app, name="show")
 app.add_typer(usethis._interface.tool.app, name="tool")
 
@@ -48,6 +51,14 @@ def readme(
                 add_pre_commit_badge()
 
 
+app.command(
+    help=(
+        "Run a usethis command in many projects in parallel, e.g. "
+        "'usethis fleet --repo a --repo b -- tool ruff'."
+    )
+)(usethis._interface.fleet.fleet)
+
+
 @app.command(help="Display the version of usethis.")
 def version() -> None:
     if __version__ is not None:
@@ -1,47 +1,162 @@
 import re
-from pathlib import Path
 
+from usethis._config import usethis_config
+from usethis._files import exists
 from usethis._integrations.bitbucket.anchor import ScriptItemAnchor
+from usethis._integrations.bitbucket.condition import (
+    LOCKFILE_PATHS,
+    PYPROJECT_PATHS,
+    PYTHON_PATHS,
+    get_changeset_condition,
+)
 from usethis._integrations.bitbucket.schema import Script, Step
+from usethis._integrations.bitbucket.settings import get_bitbucket_settings
 from usethis._integrations.bitbucket.steps import (
-    add_bitbucket_step_in_default,
+    get_pytest_step_name,
     get_steps_in_default,
-    remove_bitbucket_step_from_default,
+    remove_bitbucket_steps_from_default,
+    update_bitbucket_steps_in_default,
 )
+from usethis._integrations.pytest.junit import get_test_file_durations, get_test_files
+from usethis._integrations.pytest.shards import get_balanced_shards
 from usethis._integrations.uv.python import get_supported_major_python_versions
 
+_PYTEST_STEP_NAME_REGEX = re.compile(r"^Test on 3\.\d+( \(shard \d+/\d+\))?$")
+_FIND_TEST_FILES = "find tests -name 'test_*.py' -o -name '*_test.py' | sort"
+
 
 def is_bitbucket_used() -> bool:
-    return (Path.cwd() / "bitbucket-pipelines.yml").exists()
+    return exists(usethis_config.cpd() / "bitbucket-pipelines.yml")
 
 
 def update_bitbucket_pytest_steps() -> None:
+    steps = get_bitbucket_pytest_steps()
+    # Any old steps which are not in the matrix are removed in the same edit, e.g. for
+    # an unsupported Python version or a different number of shards. Shards with an
+    # outdated script are replaced too, e.g. when they are rebalanced for new timings.
+    script_by_name = {step.name: step.script.root[1:] for step in steps}
+    old_steps = [
+        step
+        for step in get_steps_in_default()
+        if step.name is not None
+        and (match := _PYTEST_STEP_NAME_REGEX.match(step.name)) is not None
+        and (
+            step.name not in script_by_name
+            or (
+                match.group(1) is not None
+                and step.script.root[1:] != script_by_name[step.name]
+            )
+        )
+    ]
+    update_bitbucket_steps_in_default(add=steps, remove=old_steps)
+
+
+def remove_bitbucket_pytest_steps() -> None:
+    remove_bitbucket_steps_from_default(
+        [
+            step
+            for step in get_steps_in_default()
+            if step.name is not None and _PYTEST_STEP_NAME_REGEX.match(step.name)
+        ]
+    )
+
+
+def get_bitbucket_pytest_steps() -> list[Step]:
+    """The steps which run the tests, for each supported Python version.
+
+    The steps all share the 'uv' cache, so every shard reuses the same downloads. It's
+    pruned at the end of each step, so that only the wheels which are slow to build
+    are saved, rather than ones which are quicker to download again.
+    """
     matrix = get_supported_major_python_versions()
-    for version in matrix:
-        add_bitbucket_step_in_default(
-            Step(
-                name=f"Test on 3.{version}",
-                caches=["uv"],
-                script=Script(
-                    [
-                        ScriptItemAnchor(name="install-uv"),
-                        f"uv run --python 3.{version} pytest -x --junitxml=test-reports/report.xml",
-                    ]
+    settings = get_bitbucket_settings()
+    shards = settings.pytest_shards
+
+    files_by_shard = None
+    if shards > 1:
+        files_by_shard = _get_timed_shards(settings.junit_reports, shards=shards)
+
+    return [
+        _get_bitbucket_pytest_step(
+            version, shard=shard, shards=shards, files_by_shard=files_by_shard
+        )
+        for version in matrix
+        for shard in range(1, shards + 1)
+    ]
+
+
+def _get_timed_shards(reports: list[str], *, shards: int) -> list[list[str]] | None:
+    durations = get_test_file_durations(reports)
+    if not durations:
+        return None
+
+    # Test files without any timings yet are assumed to take an average time.
+    mean = sum(durations.values()) / len(durations)
+    for file in get_test_files():
+        durations.setdefault(file, mean)
+
+    return get_balanced_shards(durations, shards=shards)
+
+
+def _get_bitbucket_pytest_step(
+    version: int,
+    *,
+    shard: int,
+    shards: int,
+    files_by_shard: list[list[str]] | None = None,
+) -> Step:
+    pytest_cmd = (
+        f"uv run --python 3.{version} pytest -x --junitxml=test-reports/report.xml"
+    )
+    if shards == 1:
+        script = Script(
+            [ScriptItemAnchor(name="install-uv"), pytest_cmd, "uv cache prune --ci"]
+        )
+    else:
+        # A shard without any files is skipped, since pytest would otherwise run every
+        # test.
+        script = Script(
+            [
+                ScriptItemAnchor(name="install-uv"),
+                _get_shard_files_cmd(
+                    shard=shard, shards=shards, files_by_shard=files_by_shard
                 ),
-            ),
+                f'if [ -n "$SHARD_FILES" ]; then {pytest_cmd} $SHARD_FILES; fi',
+                "uv cache prune --ci",
+            ]
         )
-    # We also need to remove any old steps that are not in the matrix
-    for step in get_steps_in_default():
-        if step.name is not None:
-            match = re.match(r"^Test on 3\.(\d+)$", step.name)
-            if match:
-                version = int(match.group(1))
-                if version not in matrix:
-                    remove_bitbucket_step_from_default(step)
 
+    return Step(
+        name=get_pytest_step_name(version, shard=shard, shards=shards),
+        caches=["uv", "pytest"],
+        script=script,
+        condition=get_changeset_condition(
+            [*PYTHON_PATHS, *PYPROJECT_PATHS, *LOCKFILE_PATHS]
+        ),
+    )
 
-def remove_bitbucket_pytest_steps() -> None:
-    # Remove any with pattern "^Test on 3.\d+$"
-    for step in get_steps_in_default():
-        if step.name is not None and re.match(r"^Test on 3.\d+$", step.name):
-            remove_bitbucket_step_from_default(step)
+
+def _get_shard_files_cmd(
+    *, shard: int, shards: int, files_by_shard: list[list[str]] | None
+) -> str:
+    if files_by_shard is None:
+        # Without timings, deal out the test files to the shards in turn.
+        return (
+            f"SHARD_FILES=$({_FIND_TEST_FILES} "
+            f"| awk 'NR % {shards} == {shard % shards}')"
+        )
+
+    # The test files are still found when the step runs, so that test files which
+    # have since been deleted are skipped, and new ones go in the first shard.
+    if shard == 1:
+        files = [file for files in files_by_shard[1:] for file in files]
+        grep = "grep -vxF"
+    else:
+        files = files_by_shard[shard - 1]
+        grep = "grep -xF"
+
+    if not files:
+        return f"SHARD_FILES=$({_FIND_TEST_FILES})" if shard == 1 else "SHARD_FILES="
+
+    patterns = " ".join(f"-e {file}" for file in files)
+    return f"SHARD_FILES=$({_FIND_TEST_FILES} | {grep} {patterns} || true)"
@@ -1,16 +1,79 @@
 from collections.abc import Generator
 from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
 
 import typer
 from pydantic import BaseModel
 
 
-class UsethisConfig(BaseModel):
-    """Global-state for command options which affect low level behaviour."""
+class _Options(BaseModel, frozen=True):
+    """The command options in effect for one project.
 
-    offline: bool
-    quiet: bool
+    Attributes:
+        offline: Whether to disable network access.
+        quiet: Whether to suppress output.
+        frozen: Whether to leave the virtual environment and lockfile unchanged.
+        dry_run: Whether to show changes without making them.
+        project_dir: The root directory of the project. If None, the current working
+                     directory is used.
+    """
+
+    offline: bool = False
+    quiet: bool = False
     frozen: bool = False
+    dry_run: bool = False
+    project_dir: Path | None = None
+
+
+_options: ContextVar[_Options] = ContextVar("usethis_options", default=_Options())
+
+
+class UsethisConfig:
+    """Command options which affect low level behaviour, including the project root.
+
+    The options are held in a context variable rather than as global state, so each
+    thread or asyncio task can work on its own project with its own options.
+    """
+
+    @property
+    def offline(self) -> bool:
+        return _options.get().offline
+
+    @offline.setter
+    def offline(self, value: bool) -> None:
+        _options.set(_options.get().model_copy(update={"offline": value}))
+
+    @property
+    def quiet(self) -> bool:
+        return _options.get().quiet
+
+    @quiet.setter
+    def quiet(self, value: bool) -> None:
+        _options.set(_options.get().model_copy(update={"quiet": value}))
+
+    @property
+    def frozen(self) -> bool:
+        return _options.get().frozen
+
+    @frozen.setter
+    def frozen(self, value: bool) -> None:
+        _options.set(_options.get().model_copy(update={"frozen": value}))
+
+    @property
+    def dry_run(self) -> bool:
+        return _options.get().dry_run
+
+    @dry_run.setter
+    def dry_run(self, value: bool) -> None:
+        _options.set(_options.get().model_copy(update={"dry_run": value}))
+
+    def cpd(self) -> Path:
+        """The current project directory."""
+        project_dir = _options.get().project_dir
+        if project_dir is None:
+            return Path.cwd()
+        return project_dir
 
     @contextmanager
     def set(
@@ -19,34 +82,32 @@ class UsethisConfig(BaseModel):
         offline: bool | None = None,
         quiet: bool | None = None,
         frozen: bool | None = None,
+        dry_run: bool | None = None,
+        project_dir: Path | str | None = None,
     ) -> Generator[None, None, None]:
-        """Temporarily change command options."""
-        old_offline = self.offline
-        old_quiet = self.quiet
-        old_frozen = self.frozen
-
-        if offline is None:
-            offline = old_offline
-        if quiet is None:
-            quiet = old_quiet
-        if frozen is None:
-            frozen = old_frozen
-
-        self.offline = offline
-        self.quiet = quiet
-        self.frozen = frozen
-        yield
-        self.offline = old_offline
-        self.quiet = old_quiet
-        self.frozen = old_frozen
+        """Temporarily change command options, in the current context only."""
+        updates = {
+            "offline": offline,
+            "quiet": quiet,
+            "frozen": frozen,
+            "dry_run": dry_run,
+            "project_dir": None if project_dir is None else Path(project_dir).resolve(),
+        }
+        options = _options.get().model_copy(
+            update={key: value for key, value in updates.items() if value is not None}
+        )
+
+        token = _options.set(options)
+        try:
+            yield
+        finally:
+            _options.reset(token)
 
 
 _OFFLINE_DEFAULT = False
 _QUIET_DEFAULT = False
 
-usethis_config = UsethisConfig(
-    offline=_OFFLINE_DEFAULT, quiet=_QUIET_DEFAULT, frozen=False
-)
+usethis_config = UsethisConfig()
 
 offline_opt = typer.Option(_OFFLINE_DEFAULT, "--offline", help="Disable network access")
 quiet_opt = typer.Option(_QUIET_DEFAULT, "--quiet", help="Suppress output")
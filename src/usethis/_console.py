@@ -11,6 +11,13 @@ sys.stdout = codecs.getwriter("utf-8")(sys.stdout.buffer)
 console = Console()
 
 
+def plain_print(msg: str | Exception) -> None:
+    msg = str(msg)
+
+    if not usethis_config.quiet:
+        console.print(msg, markup=False, highlight=False, soft_wrap=True)
+
+
 def tick_print(msg: str | Exception) -> None:
     msg = str(msg)
 
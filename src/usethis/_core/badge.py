@@ -5,8 +5,10 @@ from pathlib import Path
 from pydantic import BaseModel
 from typing_extensions import Self
 
+from usethis._config import usethis_config
 from usethis._console import err_print, tick_print, warn_print
 from usethis._core.readme import add_readme, get_readme_path
+from usethis._files import read_text, write_text
 from usethis._integrations.pyproject.errors import (
     PyProjectTOMLError,
 )
@@ -47,7 +49,7 @@ def get_pypi_badge() -> Badge:
         # So a second-best heuristic is the name of the current directory.
         # Note that we need to filter out invalid characters
         # https://packaging.python.org/en/latest/specifications/name-normalization/#name-format
-        name = re.sub(r"[^a-zA-Z0-9._-]", "", Path.cwd().stem)
+        name = re.sub(r"[^a-zA-Z0-9._-]", "", usethis_config.cpd().stem)
     return Badge(
         markdown=f"[![PyPI Version](<https://img.shields.io/pypi/v/{name}.svg>)](<https://pypi.python.org/pypi/{name}>)"
     )
@@ -100,7 +102,7 @@ def add_badge(badge: Badge) -> None:
             break
         prerequisites.append(_b)
 
-    content = path.read_text(encoding="utf-8")
+    content = read_text(path)
 
     original_lines = content.splitlines()
 
@@ -160,7 +162,7 @@ def add_badge(badge: Badge) -> None:
     if have_added:
         output = _ensure_final_newline(output)
 
-    path.write_text(output, encoding="utf-8")
+    write_text(path, output)
 
 
 def _get_markdown_readme_path() -> Path:
@@ -211,7 +213,7 @@ def _count_h1_close_tags(line: str) -> int:
 
 
 def remove_badge(badge: Badge) -> None:
-    path = Path.cwd() / "README.md"
+    path = usethis_config.cpd() / "README.md"
 
     try:
         path = _get_markdown_readme_path()
@@ -219,7 +221,7 @@ def remove_badge(badge: Badge) -> None:
         # If there's no README.md, there's nothing to remove
         return
 
-    content = path.read_text(encoding="utf-8")
+    content = read_text(path)
 
     original_lines = content.splitlines()
     if content.endswith("\n"):
@@ -256,4 +258,4 @@ def remove_badge(badge: Badge) -> None:
     if have_removed:
         output = _ensure_final_newline(output)
 
-    path.write_text(output, encoding="utf-8")
+    write_text(path, output)
@@ -1,9 +1,13 @@
 from usethis._ci import update_bitbucket_pytest_steps
-from usethis._console import box_print, info_print
+from usethis._console import box_print, info_print, tick_print
 from usethis._integrations.bitbucket.config import (
     add_bitbucket_pipeline_config,
     remove_bitbucket_pipeline_config,
 )
+from usethis._integrations.bitbucket.settings import (
+    get_bitbucket_settings,
+    set_bitbucket_pytest_shards,
+)
 from usethis._integrations.bitbucket.steps import (
     add_bitbucket_steps_in_default,
 )
@@ -17,10 +21,17 @@ from usethis._tool import (
 )
 
 
-def use_ci_bitbucket(*, remove: bool = False) -> None:
+def use_ci_bitbucket(*, remove: bool = False, shards: int | None = None) -> None:
     ensure_pyproject_toml()
 
     if not remove:
+        if shards is not None and shards != get_bitbucket_settings().pytest_shards:
+            tick_print(
+                f"Setting 'tool.usethis.bitbucket.pytest-shards' to {shards} in "
+                f"'pyproject.toml'."
+            )
+            set_bitbucket_pytest_shards(shards)
+
         use_pre_commit = PreCommitTool().is_used()
         use_pytest = PytestTool().is_used()
         use_ruff = RuffTool().is_used()
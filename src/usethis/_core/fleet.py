@@ -0,0 +1,135 @@
+"""Running usethis across many projects at once."""
+
+import contextlib
+import importlib
+import io
+import multiprocessing
+import os
+import time
+from collections.abc import Callable, Iterator
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextvars import ContextVar
+from pathlib import Path
+from threading import Semaphore
+
+from pydantic import BaseModel
+
+from usethis._config import usethis_config
+from usethis._integrations.pyproject.io_ import clear_pyproject_toml_cache
+from usethis._integrations.uv.call import limit_uv_concurrency
+
+
+class FleetResult(BaseModel):
+    """The outcome of running a task in one project.
+
+    Attributes:
+        path: The root directory of the project.
+        success: Whether the task completed without error.
+        duration: The time taken by the task, in seconds.
+        output: Everything the task printed, or the reason it failed.
+    """
+
+    path: Path
+    success: bool
+    duration: float
+    output: str
+
+
+def run_fleet(
+    paths: list[Path],
+    task: Callable[[], None],
+    *,
+    jobs: int | None = None,
+    uv_jobs: int = 4,
+    warm_modules: list[str] | None = None,
+) -> Iterator[FleetResult]:
+    """Run a task in each project directory, using a pool of worker processes.
+
+    Each worker imports the given modules once when it starts, so the cost of importing
+    usethis isn't paid again for every project. Within a worker, the task runs with
+    the project as the current project directory, i.e. `usethis_config.cpd()`.
+
+    Args:
+        paths: The root directories of the projects.
+        task: The task to run in each project. It must be picklable, e.g. a module-level
+              function. A task fails if it raises an exception or exits with a
+              non-zero code.
+        jobs: The number of worker processes. By default, the number of CPUs.
+        uv_jobs: The maximum number of uv subprocesses which can run at once across
+                 all workers, since uv contends for its cache and the network.
+        warm_modules: Modules to import in each worker when it starts.
+
+    Yields:
+        The result for each project, as soon as it finishes. This means the results
+        aren't necessarily in the same order as the paths.
+
+    Raises:
+        ValueError: If `uv_jobs` is less than 1, since no uv subprocess could run.
+    """
+    if not paths:
+        return
+
+    if uv_jobs < 1:
+        msg = f"The number of uv subprocesses must be at least 1, not {uv_jobs}."
+        raise ValueError(msg)
+
+    if jobs is None:
+        jobs = os.cpu_count() or 1
+    jobs = max(1, min(jobs, len(paths)))
+
+    uv_semaphore = multiprocessing.get_context().BoundedSemaphore(uv_jobs)
+    with ProcessPoolExecutor(
+        max_workers=jobs,
+        initializer=_init_worker,
+        initargs=(uv_semaphore, warm_modules or []),
+    ) as executor:
+        futures = [executor.submit(_run_task, task, path) for path in paths]
+        for future in as_completed(futures):
+            yield future.result()
+
+
+# The semaphore is inherited by each worker when it starts, since it can't be passed
+# along with each task.
+_uv_semaphore: ContextVar[Semaphore | None] = ContextVar(
+    "usethis_fleet_uv_semaphore", default=None
+)
+
+
+def _init_worker(uv_semaphore: Semaphore, warm_modules: list[str]) -> None:
+    _uv_semaphore.set(uv_semaphore)
+    for module in warm_modules:
+        importlib.import_module(module)
+
+
+def _run_task(task: Callable[[], None], path: Path) -> FleetResult:
+    stream = io.StringIO()
+    start = time.perf_counter()
+    try:
+        if not path.is_dir():
+            msg = f"No such directory: '{path}'"
+            raise FileNotFoundError(msg)
+
+        with (
+            usethis_config.set(project_dir=path),
+            limit_uv_concurrency(_uv_semaphore.get()),
+            contextlib.redirect_stdout(stream),
+            contextlib.redirect_stderr(stream),
+        ):
+            task()
+    except SystemExit as err:
+        success = err.code is None or err.code == 0
+    except Exception as err:
+        success = False
+        stream.write(f"{err.__class__.__name__}: {err}\n")
+    else:
+        success = True
+    finally:
+        # Cached file contents mustn't leak into the next project in this worker.
+        clear_pyproject_toml_cache()
+
+    return FleetResult(
+        path=path,
+        success=success,
+        duration=time.perf_counter() - start,
+        output=stream.getvalue(),
+    )
@@ -0,0 +1,47 @@
+import re
+
+from usethis._console import info_print, warn_print
+from usethis._integrations.github.errors import GitHubTagError
+from usethis._integrations.github.tags import get_github_latest_tags
+from usethis._integrations.pre_commit.hooks import get_uri_repos, update_repo_revs
+
+_GITHUB_URL_REGEX = re.compile(
+    r"^https://github\.com/(?P<owner>[^/]+)/(?P<repo>[^/]+?)(?:\.git)?/?$"
+)
+
+
+def update_pre_commit_revs() -> None:
+    """Update each GitHub repo in '.pre-commit-config.yaml' to its latest tag.
+
+    The latest tags are looked up concurrently, and the revs are all updated in a
+    single edit of the file. Repos whose latest tag can't be found, e.g. when offline
+    with nothing cached, keep their current rev.
+    """
+    owner_repo_by_url: dict[str, tuple[str, str]] = {}
+    current_revs: dict[str, str | None] = {}
+    for repo in get_uri_repos():
+        if repo.repo is None:
+            continue
+
+        match = _GITHUB_URL_REGEX.match(repo.repo)
+        if match is None:
+            continue
+
+        owner_repo_by_url[repo.repo] = (match.group("owner"), match.group("repo"))
+        current_revs[repo.repo] = repo.rev
+
+    if not owner_repo_by_url:
+        info_print("No GitHub repos to update in '.pre-commit-config.yaml'.")
+        return
+
+    tags = get_github_latest_tags(list(owner_repo_by_url.values()))
+
+    revs = {}
+    for url, owner_repo in owner_repo_by_url.items():
+        tag = tags[owner_repo]
+        if isinstance(tag, GitHubTagError):
+            warn_print(f"Keeping rev '{current_revs[url]}' for '{url}': {tag}")
+        else:
+            revs[url] = tag
+
+    update_repo_revs(revs)
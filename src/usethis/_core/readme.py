@@ -1,6 +1,6 @@
-from pathlib import Path
-
+from usethis._config import usethis_config
 from usethis._console import box_print, tick_print
+from usethis._files import exists, iterdir, write_text
 from usethis._integrations.pyproject.errors import PyProjectTOMLError
 from usethis._integrations.pyproject.name import get_description, get_name
 from usethis._integrations.uv.init import ensure_pyproject_toml
@@ -47,21 +47,21 @@ def add_readme() -> None:
         content = ""
 
     tick_print("Writing 'README.md'.")
-    (Path.cwd() / "README.md").write_text(content, encoding="utf-8")
+    write_text(usethis_config.cpd() / "README.md", content)
     box_print("Populate 'README.md' to help users understand the project.")
 
 
 def get_readme_path():
-    path_readme_md = Path.cwd() / "README.md"
-    path_readme = Path.cwd() / "README"
+    path_readme_md = usethis_config.cpd() / "README.md"
+    path_readme = usethis_config.cpd() / "README"
 
-    if path_readme_md.exists() and path_readme_md.is_file():
+    if exists(path_readme_md):
         return path_readme_md
-    elif path_readme.exists() and path_readme.is_file():
+    elif exists(path_readme):
         return path_readme
 
-    for path in Path.cwd().glob("README*"):
-        if path.is_file() and path.stem == "README":
+    for path in iterdir(usethis_config.cpd()):
+        if path.stem == "README" and exists(path):
             return path
 
     msg = "No README file found."
@@ -1,33 +1,47 @@
-from pathlib import Path
+from typing import Protocol
 
 from usethis._ci import (
     is_bitbucket_used,
     remove_bitbucket_pytest_steps,
     update_bitbucket_pytest_steps,
 )
-from usethis._console import box_print, tick_print
+from usethis._config import usethis_config
+from usethis._console import box_print, info_print, plain_print, tick_print
+from usethis._files import exists, is_on_disk, staged_files, unlink
 from usethis._integrations.bitbucket.steps import (
     add_bitbucket_steps_in_default,
     remove_bitbucket_steps_from_default,
 )
 from usethis._integrations.pre_commit.core import (
+    defer_pre_commit_hooks_installation,
     install_pre_commit_hooks,
+    install_pre_commit_hooks_in_background,
     remove_pre_commit_config,
+    start_pre_commit_hook_environments_download,
     uninstall_pre_commit_hooks,
 )
-from usethis._integrations.pre_commit.hooks import add_placeholder_hook, get_hook_names
+from usethis._integrations.pre_commit.hooks import (
+    add_placeholder_hook,
+    add_repos,
+    get_hook_names,
+)
 from usethis._integrations.pytest.core import add_pytest_dir, remove_pytest_dir
 from usethis._integrations.ruff.rules import (
     deselect_ruff_rules,
     ignore_ruff_rules,
     select_ruff_rules,
 )
-from usethis._integrations.uv.call import call_uv_subprocess
 from usethis._integrations.uv.deps import (
     Dependency,
     add_deps_to_group,
+    apply_deferred_dep_changes,
+    defer_dep_changes,
     remove_deps_from_group,
 )
+from usethis._integrations.uv.export import (
+    defer_requirements_txt_export,
+    export_requirements_txt,
+)
 from usethis._integrations.uv.init import ensure_pyproject_toml
 from usethis._tool import (
     ALL_TOOLS,
@@ -42,6 +56,63 @@ from usethis._tool import (
 )
 
 
+class UseToolFunc(Protocol):
+    def __call__(self, *, remove: bool) -> None: ...
+
+
+def use_tools(calls: list[tuple[UseToolFunc, bool]], *, dry_run: bool = False) -> None:
+    """Add or remove several tools together, as a single plan.
+
+    Each call is a `use_*` function paired with its `remove` argument. Duplicate calls
+    are skipped, and the calls are put into a canonical order so that tools which
+    integrate with other tools see everything configured before them.
+
+    File changes are staged in memory and written to disk together, once every call
+    has been planned. Only then do uv and pre-commit run: dependency changes are
+    applied with one uv call per dependency group, 'requirements.txt' is exported, and
+    pre-commit hooks are installed at most once. The hook environments start
+    downloading in the background as soon as the files are written, while the
+    dependencies are applied, and they are waited for before returning.
+
+    For a dry run, the file changes are instead printed as a diff and nothing is
+    written or installed. The only uv commands run are ones which don't modify the
+    project, i.e. `uv python list` to preview the Python versions for CI test steps.
+    """
+    unique_calls = list(dict.fromkeys(calls))
+    order = {use_tool: idx for idx, use_tool in enumerate(_USE_TOOL_ORDER)}
+    unique_calls.sort(key=lambda call: order.get(call[0], len(order)))
+
+    # N.B. the order matters: on exit, dependencies are applied first, then
+    # 'requirements.txt' is exported, then hooks are installed, and then the hook
+    # environments which are downloading in the background are waited for.
+    with (
+        usethis_config.set(dry_run=dry_run),
+        install_pre_commit_hooks_in_background(),
+        defer_pre_commit_hooks_installation(),
+        defer_requirements_txt_export(),
+        defer_dep_changes(),
+    ):
+        with staged_files(commit=not dry_run) as staged:
+            # A new pyproject.toml is staged along with everything else.
+            ensure_pyproject_toml()
+
+            for use_tool, remove in unique_calls:
+                use_tool(remove=remove)
+
+            if dry_run:
+                # Dependencies are written to the staged files rather than via uv.
+                apply_deferred_dep_changes()
+                diff = staged.diff()
+                if diff:
+                    plain_print(diff.rstrip("\n"))
+                else:
+                    info_print("No changes would be made.")
+
+        # The final hook configuration is on disk, so the hook environments can
+        # download while the dependencies are applied.
+        start_pre_commit_hook_environments_download()
+
+
 def use_coverage(*, remove: bool = False) -> None:
     tool = CoverageTool()
 
@@ -147,9 +218,16 @@ def use_pre_commit(*, remove: bool = False) -> None:
 
 
 def _add_all_tools_pre_commit_configs():
-    for _tool in ALL_TOOLS:
-        if _tool.is_used():
-            _tool.add_pre_commit_repo_configs()
+    # Gather the repos first, so the configuration file is only edited once.
+    repos = [
+        repo
+        for _tool in ALL_TOOLS
+        if _tool.is_used()
+        for repo in _tool.get_pre_commit_repos()
+        if repo.hooks is not None
+    ]
+    if repos:
+        add_repos(repos)
 
 
 def _add_bitbucket_linter_steps_to_default() -> None:
@@ -256,7 +334,7 @@ def use_requirements_txt(*, remove: bool = False) -> None:
 
     ensure_pyproject_toml()
 
-    path = Path.cwd() / "requirements.txt"
+    path = usethis_config.cpd() / "requirements.txt"
 
     if not remove:
         is_pre_commit = PreCommitTool().is_used()
@@ -264,21 +342,10 @@ def use_requirements_txt(*, remove: bool = False) -> None:
         if is_pre_commit:
             tool.add_pre_commit_repo_configs()
 
-        if not path.exists():
-            # N.B. this is where a task runner would come in handy, to reduce duplication.
-            if not (Path.cwd() / "uv.lock").exists():
-                tick_print("Writing 'uv.lock'.")
-                call_uv_subprocess(["lock"])
-
-            tick_print("Writing 'requirements.txt'.")
-            call_uv_subprocess(
-                [
-                    "export",
-                    "--frozen",
-                    "--no-dev",
-                    "--output-file=requirements.txt",
-                ]
-            )
+        if (usethis_config.dry_run or not is_on_disk()) and not exists(path):
+            info_print("Skipping 'requirements.txt', since uv can't be run here.")
+        elif not exists(path):
+            export_requirements_txt()
 
         if not is_pre_commit:
             _requirements_txt_instructions_basic()
@@ -287,9 +354,9 @@ def use_requirements_txt(*, remove: bool = False) -> None:
     else:
         tool.remove_pre_commit_repo_configs()
 
-        if path.exists() and path.is_file():
+        if exists(path):
             tick_print("Removing 'requirements.txt'.")
-            path.unlink()
+            unlink(path)
 
 
 def _requirements_txt_instructions_basic() -> None:
@@ -348,3 +415,15 @@ def use_ruff(*, remove: bool = False) -> None:
         remove_bitbucket_steps_from_default(tool.get_bitbucket_steps())
         tool.remove_pyproject_configs()
         remove_deps_from_group(tool.dev_deps, "dev")
+
+
+# pre-commit goes last so that it can pick up the hooks of every other tool.
+_USE_TOOL_ORDER: list[UseToolFunc] = [
+    use_coverage,
+    use_deptry,
+    use_pyproject_fmt,
+    use_pytest,
+    use_requirements_txt,
+    use_ruff,
+    use_pre_commit,
+]
@@ -0,0 +1,465 @@
+"""Reading and writing the files which usethis manages.
+
+All file access goes through a filesystem, which is either the real disk or an
+in-memory tree of files. Each filesystem counts the operations performed on it.
+
+Files can also be staged in memory on top of the filesystem, in which case all reads
+and writes within the staging context go to in-memory copies of the files. The staged
+changes can then be previewed as a diff, or committed to the filesystem in one go.
+"""
+
+import shutil
+from abc import abstractmethod
+from collections import Counter
+from collections.abc import Generator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from difflib import unified_diff
+from itertools import count
+from pathlib import Path
+from typing import Protocol
+
+from usethis._config import usethis_config
+
+
+class FileSystem(Protocol):
+    """A tree of files and directories, addressed by absolute paths.
+
+    Attributes:
+        counts: The number of times each operation has been performed, by name.
+    """
+
+    counts: Counter[str]
+
+    @abstractmethod
+    def read_text(self, path: Path) -> str:
+        """Read a file.
+
+        Raises:
+            FileNotFoundError: If the file doesn't exist.
+        """
+
+    @abstractmethod
+    def write_text(self, path: Path, text: str) -> None:
+        """Write a file, creating any missing parent directories."""
+
+    @abstractmethod
+    def exists(self, path: Path) -> bool:
+        """Whether the path exists as a file."""
+
+    @abstractmethod
+    def is_dir(self, path: Path) -> bool:
+        """Whether the path exists as a directory."""
+
+    @abstractmethod
+    def iterdir(self, path: Path) -> list[Path]:
+        """The files and directories immediately within a directory."""
+
+    @abstractmethod
+    def mkdir(self, path: Path) -> None:
+        """Create a directory, including any missing parents."""
+
+    @abstractmethod
+    def unlink(self, path: Path) -> None:
+        """Delete a file.
+
+        Raises:
+            FileNotFoundError: If the file doesn't exist.
+        """
+
+    @abstractmethod
+    def rmtree(self, path: Path) -> None:
+        """Delete a directory and everything within it."""
+
+
+class DiskFileSystem(FileSystem):
+    """The real filesystem."""
+
+    def __init__(self) -> None:
+        self.counts = Counter()
+
+    def read_text(self, path: Path) -> str:
+        self.counts["read_text"] += 1
+        return path.read_text(encoding="utf-8")
+
+    def write_text(self, path: Path, text: str) -> None:
+        self.counts["write_text"] += 1
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(text, encoding="utf-8")
+
+    def exists(self, path: Path) -> bool:
+        self.counts["exists"] += 1
+        return path.is_file()
+
+    def is_dir(self, path: Path) -> bool:
+        self.counts["is_dir"] += 1
+        return path.is_dir()
+
+    def iterdir(self, path: Path) -> list[Path]:
+        self.counts["iterdir"] += 1
+        return list(path.iterdir())
+
+    def mkdir(self, path: Path) -> None:
+        self.counts["mkdir"] += 1
+        path.mkdir(parents=True, exist_ok=True)
+
+    def unlink(self, path: Path) -> None:
+        self.counts["unlink"] += 1
+        path.unlink()
+
+    def rmtree(self, path: Path) -> None:
+        self.counts["rmtree"] += 1
+        shutil.rmtree(path)
+
+
+class MemoryFileSystem(FileSystem):
+    """A filesystem held entirely in memory.
+
+    Args:
+        files: The initial contents of the files, by path.
+    """
+
+    def __init__(self, files: dict[Path, str] | None = None) -> None:
+        self.counts = Counter()
+        self.files: dict[Path, str] = {}
+        self.dirs: set[Path] = set()
+        for path, text in (files or {}).items():
+            self._write(path, text)
+
+    def read_text(self, path: Path) -> str:
+        self.counts["read_text"] += 1
+        try:
+            return self.files[path]
+        except KeyError:
+            msg = f"No such file: '{path}'"
+            raise FileNotFoundError(msg) from None
+
+    def write_text(self, path: Path, text: str) -> None:
+        self.counts["write_text"] += 1
+        self._write(path, text)
+
+    def exists(self, path: Path) -> bool:
+        self.counts["exists"] += 1
+        return path in self.files
+
+    def is_dir(self, path: Path) -> bool:
+        self.counts["is_dir"] += 1
+        return path in self.dirs
+
+    def iterdir(self, path: Path) -> list[Path]:
+        self.counts["iterdir"] += 1
+        return sorted(
+            child for child in self.files.keys() | self.dirs if child.parent == path
+        )
+
+    def mkdir(self, path: Path) -> None:
+        self.counts["mkdir"] += 1
+        self.dirs.update([path, *path.parents])
+
+    def unlink(self, path: Path) -> None:
+        self.counts["unlink"] += 1
+        try:
+            del self.files[path]
+        except KeyError:
+            msg = f"No such file: '{path}'"
+            raise FileNotFoundError(msg) from None
+
+    def rmtree(self, path: Path) -> None:
+        self.counts["rmtree"] += 1
+        self.files = {
+            file: text for file, text in self.files.items() if path not in file.parents
+        }
+        self.dirs = {
+            dir_ for dir_ in self.dirs if dir_ != path and path not in dir_.parents
+        }
+
+    def _write(self, path: Path, text: str) -> None:
+        self.files[path] = text
+        self.dirs.update(path.parents)
+
+
+class StagedFiles:
+    """In-memory copies of files, as modified since staging began.
+
+    A file which has been deleted is represented by a value of None.
+
+    Args:
+        fs: The filesystem which the staged changes are relative to.
+    """
+
+    def __init__(self, fs: FileSystem) -> None:
+        self._fs = fs
+        self._original_by_path: dict[Path, str | None] = {}
+        self._content_by_path: dict[Path, str | None] = {}
+        self._made_dirs: set[Path] = set()
+        self._removed_dirs: set[Path] = set()
+
+    def read_text(self, path: Path) -> str:
+        content = self._get(path)
+        if content is None:
+            msg = f"No such file: '{path}'"
+            raise FileNotFoundError(msg)
+        return content
+
+    def write_text(self, path: Path, text: str) -> None:
+        self._get(path)
+        self._content_by_path[path] = text
+
+    def exists(self, path: Path) -> bool:
+        return self._get(path) is not None
+
+    def unlink(self, path: Path) -> None:
+        self.read_text(path)
+        self._content_by_path[path] = None
+
+    def is_dir(self, path: Path) -> bool:
+        if path in self._made_dirs or self._has_staged_file_within(path):
+            return True
+        if self._is_removed(path):
+            return False
+        return self._fs.is_dir(path)
+
+    def iterdir(self, path: Path) -> list[Path]:
+        children: set[Path] = set()
+        if not self._is_removed(path) and self._fs.is_dir(path):
+            children.update(self._fs.iterdir(path))
+        children.update(dir_ for dir_ in self._made_dirs if dir_.parent == path)
+        for file, content in self._content_by_path.items():
+            if file.parent == path:
+                if content is None:
+                    children.discard(file)
+                else:
+                    children.add(file)
+        return sorted(
+            child
+            for child in children
+            if not self._is_removed(child) or self.is_dir(child) or self.exists(child)
+        )
+
+    def mkdir(self, path: Path) -> None:
+        self._made_dirs.update([path, *path.parents])
+
+    def rmtree(self, path: Path) -> None:
+        for child in self.iterdir(path):
+            if self.is_dir(child):
+                self.rmtree(child)
+            else:
+                self.unlink(child)
+        self._made_dirs = {
+            dir_
+            for dir_ in self._made_dirs
+            if dir_ != path and path not in dir_.parents
+        }
+        self._removed_dirs.add(path)
+
+    def diff(self) -> str:
+        """A unified diff of every staged change, relative to the original files."""
+        lines: list[str] = []
+        for path in sorted(self._content_by_path):
+            original = self._original_by_path[path]
+            content = self._content_by_path[path]
+            if original == content:
+                continue
+
+            name = _display_name(path)
+            for line in unified_diff(
+                (original or "").splitlines(keepends=True),
+                (content or "").splitlines(keepends=True),
+                fromfile="/dev/null" if original is None else f"a/{name}",
+                tofile="/dev/null" if content is None else f"b/{name}",
+            ):
+                if not line.endswith("\n"):
+                    line += "\n\\ No newline at end of file\n"
+                lines.append(line)
+
+        return "".join(lines)
+
+    def commit(self) -> None:
+        """Write every staged change to the filesystem, and start afresh from there."""
+        for dir_ in sorted(self._removed_dirs):
+            if self._fs.is_dir(dir_):
+                self._fs.rmtree(dir_)
+
+        for path, content in self._content_by_path.items():
+            if content == self._original_by_path[path]:
+                continue
+
+            if content is None:
+                if self._fs.exists(path):
+                    self._fs.unlink(path)
+            else:
+                self._fs.write_text(path, content)
+
+        for dir_ in sorted(self._made_dirs):
+            if not self._fs.is_dir(dir_):
+                self._fs.mkdir(dir_)
+
+        self._original_by_path.clear()
+        self._content_by_path.clear()
+        self._made_dirs.clear()
+        self._removed_dirs.clear()
+
+    def _get(self, path: Path) -> str | None:
+        if path not in self._content_by_path:
+            original = (
+                None
+                if self._is_removed(path) or not self._fs.exists(path)
+                else self._fs.read_text(path)
+            )
+            self._original_by_path[path] = original
+            self._content_by_path[path] = original
+        return self._content_by_path[path]
+
+    def _is_removed(self, path: Path) -> bool:
+        return any(dir_ == path or dir_ in path.parents for dir_ in self._removed_dirs)
+
+    def _has_staged_file_within(self, path: Path) -> bool:
+        return any(
+            path in file.parents
+            for file, content in self._content_by_path.items()
+            if content is not None
+        )
+
+
+_filesystem: ContextVar[FileSystem] = ContextVar(
+    "usethis_filesystem", default=DiskFileSystem()
+)
+_staged: ContextVar[StagedFiles | None] = ContextVar(
+    "usethis_staged_files", default=None
+)
+_generation: ContextVar[int] = ContextVar("usethis_files_generation", default=0)
+_generations = count(1)
+
+
+def get_filesystem() -> FileSystem:
+    """The filesystem in use in the current context."""
+    return _filesystem.get()
+
+
+def is_on_disk() -> bool:
+    """Whether the filesystem in use is the real disk, e.g. so subprocesses can run."""
+    return isinstance(get_filesystem(), DiskFileSystem)
+
+
+@contextmanager
+def use_filesystem(fs: FileSystem) -> Generator[FileSystem, None, None]:
+    """Use a different filesystem, e.g. one in memory, in the current context only."""
+    token = _filesystem.set(fs)
+    _generation.set(next(_generations))
+    try:
+        yield fs
+    finally:
+        _filesystem.reset(token)
+        _generation.set(next(_generations))
+
+
+def get_generation() -> int:
+    """A counter which changes whenever the files being read might come from elsewhere.
+
+    This happens when staged files begin or stop shadowing the filesystem, or when the
+    filesystem itself changes. This allows anything derived from file contents to be
+    cached safely.
+    """
+    return _generation.get()
+
+
+@contextmanager
+def staged_files(*, commit: bool = True) -> Generator[StagedFiles, None, None]:
+    """Stage all file reads and writes in memory, in the current context only.
+
+    Args:
+        commit: Whether to write the staged changes to the filesystem on exit. If an
+                error is raised within the context, nothing is written.
+    """
+    staged = _staged.get()
+    if staged is not None:
+        # Already staging; the outermost context decides what happens to the changes.
+        yield staged
+        return
+
+    staged = StagedFiles(get_filesystem())
+    token = _staged.set(staged)
+    _generation.set(next(_generations))
+    try:
+        yield staged
+        if commit:
+            staged.commit()
+    finally:
+        _staged.reset(token)
+        _generation.set(next(_generations))
+
+
+@contextmanager
+def without_staged_files() -> Generator[None, None, None]:
+    """Use the filesystem directly, ignoring any staged files, in the current context.
+
+    This is for work in another thread, which mustn't touch the staged files while the
+    thread which staged them is still changing them.
+    """
+    token = _staged.set(None)
+    _generation.set(next(_generations))
+    try:
+        yield
+    finally:
+        _staged.reset(token)
+        _generation.set(next(_generations))
+
+
+def has_staged_files() -> bool:
+    """Whether file changes are being staged in memory, in the current context.
+
+    While they are, a subprocess would see the files as they were before staging began.
+    """
+    return _staged.get() is not None
+
+
+def read_text(path: Path) -> str:
+    return _current().read_text(_resolve(path))
+
+
+def write_text(path: Path, text: str) -> None:
+    _current().write_text(_resolve(path), text)
+
+
+def exists(path: Path) -> bool:
+    """Whether the path exists as a file."""
+    return _current().exists(_resolve(path))
+
+
+def unlink(path: Path) -> None:
+    _current().unlink(_resolve(path))
+
+
+def is_dir(path: Path) -> bool:
+    return _current().is_dir(_resolve(path))
+
+
+def iterdir(path: Path) -> list[Path]:
+    return _current().iterdir(_resolve(path))
+
+
+def mkdir(path: Path) -> None:
+    _current().mkdir(_resolve(path))
+
+
+def rmtree(path: Path) -> None:
+    _current().rmtree(_resolve(path))
+
+
+def _current() -> FileSystem | StagedFiles:
+    staged = _staged.get()
+    if staged is not None:
+        return staged
+    return get_filesystem()
+
+
+def _resolve(path: Path) -> Path:
+    # Relative paths are relative to the project, not the working directory.
+    return (usethis_config.cpd() / path).resolve()
+
+
+def _display_name(path: Path) -> str:
+    try:
+        return path.relative_to(usethis_config.cpd().resolve()).as_posix()
+    except ValueError:
+        return path.as_posix()
@@ -50,23 +50,29 @@ def _add_caches_via_doc(
 
 def remove_cache(cache: str) -> None:
     with edit_bitbucket_pipelines_yaml() as doc:
-        config = doc.model
-
-        if config.definitions is None or config.definitions.caches is None:
+        if not _cache_exists(cache, doc=doc):
             return
 
-        if cache in config.definitions.caches:
-            tick_print(
-                f"Removing cache '{cache}' definition from 'bitbucket-pipelines.yml'."
-            )
-            del config.definitions.caches[cache]
+        _remove_cache_via_doc(cache, doc=doc)
+        dump = bitbucket_fancy_dump(doc.model, reference=doc.content)
+        update_ruamel_yaml_map(doc.content, dump, preserve_comments=True)
 
-            # Remove an empty caches section
-            if not config.definitions.caches:
-                del config.definitions.caches
 
-        dump = bitbucket_fancy_dump(config, reference=doc.content)
-        update_ruamel_yaml_map(doc.content, dump, preserve_comments=True)
+def _remove_cache_via_doc(cache: str, *, doc: BitbucketPipelinesYAMLDocument) -> None:
+    config = doc.model
+
+    if config.definitions is None or config.definitions.caches is None:
+        return
+
+    if cache in config.definitions.caches:
+        tick_print(
+            f"Removing cache '{cache}' definition from 'bitbucket-pipelines.yml'."
+        )
+        del config.definitions.caches[cache]
+
+        # Remove an empty caches section
+        if not config.definitions.caches:
+            del config.definitions.caches
 
 
 def _cache_exists(name: str, *, doc: BitbucketPipelinesYAMLDocument) -> bool:
@@ -0,0 +1,29 @@
+from usethis._integrations.bitbucket.schema import Changesets, Condition
+from usethis._integrations.bitbucket.settings import get_bitbucket_settings
+
+# Glob patterns for the files which each kind of step depends on. Changes to the
+# pipeline configuration itself always count, so that new steps run straight away.
+PYTHON_PATHS = ["**.py"]
+PYPROJECT_PATHS = ["pyproject.toml"]
+LOCKFILE_PATHS = ["uv.lock"]
+_PIPELINE_PATHS = ["bitbucket-pipelines.yml"]
+
+
+def get_changeset_condition(include_paths: list[str]) -> Condition | None:
+    """Get the condition for a step to only run when the files it checks have changed.
+
+    Args:
+        include_paths: Glob patterns for the files which the step depends on.
+
+    Returns:
+        The condition, or None if changeset conditions aren't enabled in the settings,
+        in which case the step should always run.
+    """
+    if not get_bitbucket_settings().changeset_conditions:
+        return None
+
+    return Condition(
+        changesets=Changesets(
+            includePaths=list(dict.fromkeys([*include_paths, *_PIPELINE_PATHS]))
+        )
+    )
@@ -1,6 +1,6 @@
-from pathlib import Path
-
+from usethis._config import usethis_config
 from usethis._console import tick_print
+from usethis._files import exists, unlink
 from usethis._integrations.bitbucket.steps import (
     add_placeholder_step_in_default,
 )
@@ -11,7 +11,7 @@ def add_bitbucket_pipeline_config(report_placeholder: bool = True) -> None:
 
     Note that the pipeline is empty and will need steps added to it to run successfully.
     """
-    if (Path.cwd() / "bitbucket-pipelines.yml").exists():
+    if exists(usethis_config.cpd() / "bitbucket-pipelines.yml"):
         # Early exit; the file already exists
         return
 
@@ -19,9 +19,9 @@ def add_bitbucket_pipeline_config(report_placeholder: bool = True) -> None:
 
 
 def remove_bitbucket_pipeline_config() -> None:
-    if not (Path.cwd() / "bitbucket-pipelines.yml").exists():
+    if not exists(usethis_config.cpd() / "bitbucket-pipelines.yml"):
         # Early exit; the file already doesn't exist
         return
 
     tick_print("Removing 'bitbucket-pipelines.yml'.")
-    (Path.cwd() / "bitbucket-pipelines.yml").unlink()
+    unlink(usethis_config.cpd() / "bitbucket-pipelines.yml")
@@ -3,3 +3,7 @@ from usethis.errors import UsethisError
 
 class UnexpectedImportPipelineError(UsethisError):
     """Raised when an import pipeline is unexpectedly encountered."""
+
+
+class InvalidBitbucketSettingsError(UsethisError):
+    """Raised when the usethis Bitbucket settings in 'pyproject.toml' are invalid."""
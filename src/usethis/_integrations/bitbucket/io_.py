@@ -6,7 +6,9 @@ from pathlib import Path
 from pydantic import ValidationError
 from ruamel.yaml.comments import CommentedMap
 
+from usethis._config import usethis_config
 from usethis._console import tick_print
+from usethis._files import exists, read_text, write_text
 from usethis._integrations.bitbucket.schema import PipelinesConfiguration
 from usethis._integrations.yaml.io_ import YAMLLiteral, edit_yaml
 
@@ -34,11 +36,13 @@ def edit_bitbucket_pipelines_yaml() -> Generator[
 ]:
     """A context manager to modify 'bitbucket-pipelines.yml' in-place."""
     name = "bitbucket-pipelines.yml"
-    path = Path.cwd() / name
+    path = usethis_config.cpd() / name
 
-    if not path.exists():
+    if not exists(path):
         tick_print(f"Writing '{name}'.")
-        path.write_text("image: atlassian/default-image:3", encoding="utf-8")
+        # A shallow clone is much faster for large repositories, and is enough for
+        # the steps which usethis adds.
+        write_text(path, "image: atlassian/default-image:3\nclone:\n    depth: 1\n")
         guess_indent = False
     else:
         guess_indent = _has_indentation(path)
@@ -58,5 +62,5 @@ def _validate_config(ruamel_content: YAMLLiteral) -> PipelinesConfiguration:
 
 
 def _has_indentation(path: Path) -> bool:
-    lines = path.read_text().splitlines()
+    lines = read_text(path).splitlines()
     return any(line.startswith(" ") or line.startswith("\t") for line in lines)
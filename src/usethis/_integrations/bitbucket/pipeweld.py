@@ -1,5 +1,5 @@
+import hashlib
 from functools import singledispatch
-from uuid import uuid4
 
 from typing_extensions import assert_never
 
@@ -13,6 +13,7 @@ from usethis._integrations.bitbucket.io_ import (
 from usethis._integrations.bitbucket.schema import (
     ImportPipeline,
     Items,
+    Parallel,
     ParallelExpanded,
     ParallelItem,
     ParallelSteps,
@@ -25,7 +26,13 @@ from usethis._integrations.bitbucket.schema import (
 )
 from usethis._integrations.bitbucket.schema_utils import step1tostep
 from usethis._integrations.yaml.update import update_ruamel_yaml_map
-from usethis._pipeweld.ops import Instruction
+from usethis._pipeweld.ops import (
+    InsertParallel,
+    InsertSuccessor,
+    Instruction,
+    Move,
+    Remove,
+)
 
 
 def get_pipeweld_step(step: Step) -> str:
@@ -96,7 +103,11 @@ def _(item: StageItem):
     if item.stage.name is not None:
         name = item.stage.name
     else:
-        name = str(f"Unnamed Stage {uuid4()}")
+        # Derived from the content, so the same stage always gets the same name.
+        digest = hashlib.sha256(
+            item.stage.model_dump_json(exclude_defaults=True).encode()
+        ).hexdigest()
+        name = f"Unnamed Stage {digest[:16]}"
 
     for step in item.stage.steps:
         depgroup_steps.append(get_pipeweld_step(step1tostep(step)))
@@ -121,7 +132,7 @@ def apply_pipeweld_instruction_via_doc(
     doc: BitbucketPipelinesYAMLDocument,
 ) -> None:
     if get_pipeweld_step(new_step) != instruction.step:
-        # N.B. This doesn't currently handle moving existing steps
+        # N.B. Existing steps are moved with `apply_pipeweld_move_via_doc` instead.
         return
 
     if doc.model.pipelines is None:
@@ -141,22 +152,172 @@ def apply_pipeweld_instruction_via_doc(
     else:
         items = default.root.root
 
-    if instruction.after is None:
-        items.insert(0, StepItem(step=new_step))
+    idx = _get_insertion_idx(items, instruction=instruction)
+    if idx is None:
+        return
+
+    if (
+        isinstance(instruction, InsertParallel)
+        and idx < len(items)
+        # Bitbucket doesn't support stages in parallel groups, but the step doesn't
+        # depend on the stage so it can just come before it.
+        and not isinstance(items[idx], StageItem)
+    ):
+        items[idx] = _add_parallel_step(items[idx], step=new_step)
     else:
-        for item in items:
-            if _is_insertion_necessary(item, instruction=instruction):
-                # N.B. This doesn't currently handle InsertParallel properly
-                items.insert(
-                    items.index(item) + 1,
-                    StepItem(step=new_step),
-                )
-                break
+        items.insert(idx, StepItem(step=new_step))
 
     if default is None and items:
         pipelines.default = Pipeline(Items(items))
 
 
+def apply_pipeweld_move_via_doc(
+    move: Move, *, doc: BitbucketPipelinesYAMLDocument
+) -> None:
+    step = apply_pipeweld_removal_via_doc(Remove(step=move.step), doc=doc)
+    if step is None:
+        return
+
+    if move.parallel:
+        instruction = InsertParallel(after=move.after, step=move.step)
+    else:
+        instruction = InsertSuccessor(after=move.after, step=move.step)
+    apply_pipeweld_instruction_via_doc(instruction, new_step=step, doc=doc)
+
+
+def apply_pipeweld_removal_via_doc(
+    removal: Remove, *, doc: BitbucketPipelinesYAMLDocument
+) -> Step | None:
+    """Remove a step from the default pipeline, giving the step if it was there.
+
+    Any parallel group or stage which is left empty is removed too, and a parallel group
+    which is left with a single step is replaced by that step.
+
+    Raises:
+        UnexpectedImportPipelineError: If the pipeline is an import pipeline.
+    """
+    if doc.model.pipelines is None or doc.model.pipelines.default is None:
+        return None
+
+    default = doc.model.pipelines.default
+    if isinstance(default.root, ImportPipeline):
+        msg = "Cannot remove steps from an import pipeline."
+        raise UnexpectedImportPipelineError(msg)
+
+    items = default.root.root
+    for idx, item in enumerate(items):
+        new_item, step = _pop_step(item, name=removal.step)
+        if step is None:
+            continue
+
+        if new_item is None:
+            del items[idx]
+        else:
+            items[idx] = new_item
+        return step
+
+    return None
+
+
+@singledispatch
+def _pop_step(
+    item: StepItem | ParallelItem | StageItem, *, name: str
+) -> tuple[StepItem | ParallelItem | StageItem | None, Step | None]:
+    """Take a step out of an item, giving the item to replace it and the step."""
+    raise NotImplementedError
+
+
+@_pop_step.register
+def _(
+    item: StepItem, *, name: str
+) -> tuple[StepItem | ParallelItem | StageItem | None, Step | None]:
+    if get_pipeweld_step(item.step) == name:
+        return None, item.step
+    return item, None
+
+
+@_pop_step.register
+def _(
+    item: ParallelItem, *, name: str
+) -> tuple[StepItem | ParallelItem | StageItem | None, Step | None]:
+    if isinstance(item.parallel.root, ParallelSteps):
+        step_items = item.parallel.root.root
+    elif isinstance(item.parallel.root, ParallelExpanded):
+        step_items = item.parallel.root.steps.root
+    else:
+        assert_never(item.parallel.root)
+
+    for idx, step_item in enumerate(step_items):
+        if get_pipeweld_step(step_item.step) == name:
+            break
+    else:
+        return item, None
+
+    step_item = step_items.pop(idx)
+    if not step_items:
+        return None, step_item.step
+    elif len(step_items) == 1:
+        return step_items[0], step_item.step
+    return item, step_item.step
+
+
+@_pop_step.register
+def _(
+    item: StageItem, *, name: str
+) -> tuple[StepItem | ParallelItem | StageItem | None, Step | None]:
+    for idx, step1 in enumerate(item.stage.steps):
+        step = step1tostep(step1)
+        if get_pipeweld_step(step) == name:
+            break
+    else:
+        return item, None
+
+    item.stage.steps.pop(idx)
+    if not item.stage.steps:
+        return None, step
+    return item, step
+
+
+def _get_insertion_idx(
+    items: list[StepItem | ParallelItem | StageItem], *, instruction: Instruction
+) -> int | None:
+    """The index of the item which comes just after the instruction's predecessor."""
+    if instruction.after is None:
+        return 0
+
+    for idx, item in enumerate(items):
+        if _is_insertion_necessary(item, instruction=instruction):
+            return idx + 1
+
+    return None
+
+
+@singledispatch
+def _add_parallel_step(item: StepItem | ParallelItem, *, step: Step) -> ParallelItem:
+    """Add a step to run in parallel with an item, giving the item to replace it."""
+    raise NotImplementedError
+
+
+@_add_parallel_step.register
+def _(item: StepItem, *, step: Step) -> ParallelItem:
+    return ParallelItem(
+        parallel=Parallel(ParallelSteps([item, StepItem(step=step)])),
+    )
+
+
+@_add_parallel_step.register
+def _(item: ParallelItem, *, step: Step) -> ParallelItem:
+    if isinstance(item.parallel.root, ParallelSteps):
+        step_items = item.parallel.root.root
+    elif isinstance(item.parallel.root, ParallelExpanded):
+        step_items = item.parallel.root.steps.root
+    else:
+        assert_never(item.parallel.root)
+
+    step_items.append(StepItem(step=step))
+    return item
+
+
 @singledispatch
 def _is_insertion_necessary(
     item: StepItem | ParallelItem | StageItem,
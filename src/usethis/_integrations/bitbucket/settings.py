@@ -0,0 +1,57 @@
+from pydantic import BaseModel, Field, ValidationError
+
+from usethis._integrations.bitbucket.errors import InvalidBitbucketSettingsError
+from usethis._integrations.pyproject.core import get_config_value, set_config_value
+
+
+class BitbucketSettings(
+    BaseModel,
+    frozen=True,
+    extra="forbid",
+    alias_generator=lambda name: name.replace("_", "-"),
+):
+    """The usethis settings for Bitbucket Pipelines, at 'tool.usethis.bitbucket'.
+
+    Attributes:
+        pytest_shards: The number of parallel steps to split the tests across, for each
+                       Python version. The test files are balanced across the steps
+                       using their timings in the JUnit reports, if there are any, and
+                       are otherwise dealt out to the steps in turn, in sorted order.
+        junit_reports: The paths to JUnit XML reports of earlier test runs, relative to
+                       the project directory, from which to get the test timings. A
+                       directory stands for all the '.xml' files within it.
+        changeset_conditions: Whether to only run each step when the files it depends
+                              on have changed, using a changeset condition, e.g. to
+                              skip the Ruff step when only the docs have changed.
+    """
+
+    pytest_shards: int = Field(default=1, ge=1)
+    junit_reports: list[str] = ["test-reports"]
+    changeset_conditions: bool = False
+
+
+def get_bitbucket_settings() -> BitbucketSettings:
+    """Get the usethis settings for Bitbucket Pipelines from 'pyproject.toml'.
+
+    Raises:
+        InvalidBitbucketSettingsError: If the settings are invalid.
+    """
+    try:
+        settings = get_config_value(["tool", "usethis", "bitbucket"])
+    except (FileNotFoundError, KeyError):
+        settings = {}
+
+    try:
+        return BitbucketSettings.model_validate(settings)
+    except ValidationError as err:
+        msg = (
+            f"Invalid settings at 'tool.usethis.bitbucket' in 'pyproject.toml':\n{err}"
+        )
+        raise InvalidBitbucketSettingsError(msg) from None
+
+
+def set_bitbucket_pytest_shards(shards: int) -> None:
+    """Set the number of shards for the tests in 'pyproject.toml'."""
+    set_config_value(
+        ["tool", "usethis", "bitbucket", "pytest-shards"], shards, exists_ok=True
+    )
@@ -1,5 +1,4 @@
 from functools import singledispatch
-from pathlib import Path
 
 from ruamel.yaml.anchor import Anchor
 from ruamel.yaml.comments import CommentedSeq
@@ -7,9 +6,15 @@ from ruamel.yaml.scalarstring import LiteralScalarString
 from typing_extensions import assert_never
 
 import usethis._pipeweld.func
+from usethis._config import usethis_config
 from usethis._console import box_print, tick_print
+from usethis._files import exists
 from usethis._integrations.bitbucket.anchor import ScriptItemAnchor, ScriptItemName
-from usethis._integrations.bitbucket.cache import _add_caches_via_doc, remove_cache
+from usethis._integrations.bitbucket.cache import (
+    _add_caches_via_doc,
+    _remove_cache_via_doc,
+    remove_cache,
+)
 from usethis._integrations.bitbucket.dump import bitbucket_fancy_dump
 from usethis._integrations.bitbucket.errors import UnexpectedImportPipelineError
 from usethis._integrations.bitbucket.io_ import (
@@ -18,13 +23,18 @@ from usethis._integrations.bitbucket.io_ import (
 )
 from usethis._integrations.bitbucket.pipeweld import (
     apply_pipeweld_instruction_via_doc,
+    apply_pipeweld_move_via_doc,
+    apply_pipeweld_removal_via_doc,
     get_pipeweld_pipeline_from_default,
     get_pipeweld_step,
 )
 from usethis._integrations.bitbucket.schema import (
+    Cache,
+    CacheExpanded,
     CachePath,
     Definitions,
     ImportPipeline,
+    Key,
     Parallel,
     ParallelExpanded,
     ParallelItem,
@@ -36,12 +46,31 @@ from usethis._integrations.bitbucket.schema import (
     StepItem,
 )
 from usethis._integrations.bitbucket.schema_utils import step1tostep
+from usethis._integrations.bitbucket.settings import get_bitbucket_settings
 from usethis._integrations.uv.python import get_supported_major_python_versions
 from usethis._integrations.yaml.update import update_ruamel_yaml_map
-
-_CACHE_LOOKUP = {
-    "uv": CachePath("~/.cache/uv"),
-    "pre-commit": CachePath("~/.cache/pre-commit"),
+from usethis._pipeweld.ops import Move, Remove
+
+# Each cache is keyed on the files which determine its contents, so it's restored
+# whenever those files are unchanged and rebuilt from scratch when they change.
+_CACHE_LOOKUP: dict[str, Cache] = {
+    "uv": Cache(
+        CacheExpanded(key=Key(files=["uv.lock"]), path=CachePath("~/.cache/uv"))
+    ),
+    "pre-commit": Cache(
+        CacheExpanded(
+            key=Key(files=[".pre-commit-config.yaml"]),
+            path=CachePath("~/.cache/pre-commit"),
+        )
+    ),
+    "ruff": Cache(
+        CacheExpanded(key=Key(files=["pyproject.toml"]), path=CachePath(".ruff_cache"))
+    ),
+    "pytest": Cache(
+        CacheExpanded(
+            key=Key(files=["pyproject.toml"]), path=CachePath(".pytest_cache")
+        )
+    ),
 }
 
 
@@ -60,28 +89,101 @@ for name, script_item in _SCRIPT_ITEM_LOOKUP.items():
 
 
 def add_bitbucket_steps_in_default(steps: list[Step]) -> None:
-    for step in steps:
-        add_bitbucket_step_in_default(step)
+    """Add steps to the default pipeline in the Bitbucket Pipelines configuration.
+
+    The steps are added in a single edit of the file, along with any caches and script
+    items they need. Steps which already exist in some sense are skipped. If any steps
+    are added, the placeholder step is removed.
+
+    Raises:
+        UnexpectedImportPipelineError: If the pipeline is an import pipeline.
+    """
+    update_bitbucket_steps_in_default(add=steps, remove=[])
 
 
 def add_bitbucket_step_in_default(step: Step) -> None:
-    try:
-        existing_steps = get_steps_in_default()
-    except UnexpectedImportPipelineError:
-        msg = (
-            f"Cannot add step '{step.name}' to default pipeline in "
-            f"'bitbucket-pipelines.yml' because it is an import pipeline."
-        )
-        raise UnexpectedImportPipelineError(msg) from None
+    add_bitbucket_steps_in_default([step])
 
-    # Early exit if the step already exists in some sense
-    for existing_step in existing_steps:
-        if _steps_are_equivalent(existing_step, step):
-            return
 
-    # Add the step to the default pipeline
+def update_bitbucket_steps_in_default(*, add: list[Step], remove: list[Step]) -> None:
+    """Add and remove steps in the default pipeline in a single edit.
+
+    The removals and additions are welded into one script of operations, which is
+    applied to the file in one pass. Steps to add which already exist in some sense are
+    skipped. If any steps are added, the placeholder step is removed, and if the
+    pipeline is left empty, the placeholder step is added. Caches which are no longer
+    used by any step are removed.
+
+    Raises:
+        UnexpectedImportPipelineError: If the pipeline is an import pipeline.
+    """
+    if not add and not remove:
+        return
+
+    if not add and not exists(usethis_config.cpd() / "bitbucket-pipelines.yml"):
+        return
+
+    for step in remove:
+        if step.name == _PLACEHOLDER_NAME:
+            pass  # We need to selectively choose to report at a higher level.
+            # It's not always notable that the placeholder is being removed.
+        else:
+            tick_print(
+                f"Removing '{step.name}' from default pipeline in "
+                f"'bitbucket-pipelines.yml'."
+            )
+
     with edit_bitbucket_pipelines_yaml() as doc:
-        _add_step_in_default_via_doc(step, doc=doc)
+        try:
+            existing_steps = _get_steps_in_default_via_doc(doc=doc)
+        except UnexpectedImportPipelineError:
+            if not add:
+                msg = "Cannot remove steps from an import pipeline."
+                raise UnexpectedImportPipelineError(msg) from None
+            msg = (
+                f"Cannot add step '{add[0].name}' to default pipeline in "
+                f"'bitbucket-pipelines.yml' because it is an import pipeline."
+            )
+            raise UnexpectedImportPipelineError(msg) from None
+
+        removed_steps = [
+            existing_step
+            for existing_step in existing_steps
+            if any(_steps_are_equivalent(existing_step, step) for step in remove)
+        ]
+        remaining_steps = [
+            existing_step
+            for existing_step in existing_steps
+            if existing_step not in removed_steps
+        ]
+
+        new_steps, updated_steps = _get_new_steps(add, existing_steps=remaining_steps)
+
+        if not new_steps and not removed_steps and not updated_steps:
+            return
+
+        _add_steps_in_default_via_doc(
+            new_steps,
+            doc=doc,
+            step_order=_get_step_order(),
+            removals=removed_steps,
+        )
+
+        unused_caches = [cache for step in removed_steps for cache in step.caches or []]
+
+        # Remove the placeholder step if it already exists, unless it's what we added.
+        placeholder = _get_placeholder_step()
+        if any(not _steps_are_equivalent(placeholder, step) for step in new_steps):
+            _remove_step_in_default_via_doc(placeholder, doc=doc)
+            unused_caches.extend(placeholder.caches or [])
+
+        if not _get_steps_in_default_via_doc(doc=doc):
+            _add_steps_in_default_via_doc(
+                [placeholder], doc=doc, step_order=_get_step_order()
+            )
+
+        _remove_unused_caches_via_doc(list(dict.fromkeys(unused_caches)), doc=doc)
+
         dump = bitbucket_fancy_dump(doc.model, reference=doc.content)
         update_ruamel_yaml_map(
             doc.content,
@@ -89,16 +191,96 @@ def add_bitbucket_step_in_default(step: Step) -> None:
             preserve_comments=True,
         )
 
-    # Remove the placeholder step if it already exists
-    placeholder = _get_placeholder_step()
-    if not _steps_are_equivalent(placeholder, step):
-        # Only remove the placeholder if it hasn't already been added.
-        remove_bitbucket_step_from_default(placeholder)
 
+def _get_new_steps(
+    steps: list[Step], *, existing_steps: list[Step]
+) -> tuple[list[Step], list[Step]]:
+    """Get the steps which need adding, and update the ones which already exist.
 
-def _add_step_in_default_via_doc(
-    step: Step, *, doc: BitbucketPipelinesYAMLDocument
+    Returns:
+        The steps to add, and the existing steps whose condition was updated.
+    """
+    new_steps: list[Step] = []
+    updated_steps: list[Step] = []
+    for step in steps:
+        # Skip the step if it already exists in some sense
+        existing_step = next(
+            (
+                existing_step
+                for existing_step in [*existing_steps, *new_steps]
+                if _steps_are_equivalent(existing_step, step)
+            ),
+            None,
+        )
+        if existing_step is None:
+            new_steps.append(step)
+        elif existing_step in existing_steps and _update_condition(existing_step, step):
+            updated_steps.append(existing_step)
+
+    return new_steps, updated_steps
+
+
+def _update_condition(existing_step: Step, step: Step) -> bool:
+    """Bring the condition of an existing step up to date, e.g. once it's enabled.
+
+    Conditions are only ever set, not removed, since they might have been added
+    manually.
+
+    Returns:
+        Whether the condition was changed.
+    """
+    if step.condition is None or existing_step.condition == step.condition:
+        return False
+
+    tick_print(
+        f"Setting condition for '{existing_step.name}' in 'bitbucket-pipelines.yml'."
+    )
+    existing_step.condition = step.condition
+    return True
+
+
+def _add_steps_in_default_via_doc(
+    steps: list[Step],
+    *,
+    doc: BitbucketPipelinesYAMLDocument,
+    step_order: list[list[str]],
+    removals: list[Step] | None = None,
 ) -> None:
+    step_by_name: dict[str, Step] = {}
+    prerequisites: dict[str, set[str]] = {}
+    postrequisites: dict[str, set[str]] = {}
+    for step in steps:
+        step = _prepare_step_via_doc(step, doc=doc)
+        name = get_pipeweld_step(step)
+        step_by_name[name] = step
+        prerequisites[name], postrequisites[name] = _get_step_requirements(
+            step, step_order=step_order
+        )
+
+    weld_result = usethis._pipeweld.func.BatchAdder(
+        pipeline=get_pipeweld_pipeline_from_default(doc.model),
+        steps=set(step_by_name),
+        prerequisites=prerequisites,
+        postrequisites=postrequisites,
+        removals={get_pipeweld_step(step) for step in removals or []},
+    ).add()
+    for operation in weld_result.instructions:
+        if isinstance(operation, Remove):
+            apply_pipeweld_removal_via_doc(operation, doc=doc)
+        elif isinstance(operation, Move):
+            apply_pipeweld_move_via_doc(operation, doc=doc)
+        elif operation.step in step_by_name:
+            apply_pipeweld_instruction_via_doc(
+                instruction=operation, new_step=step_by_name[operation.step], doc=doc
+            )
+
+    # Existing steps which have been moved into a parallel group are dumped afresh, so
+    # their script items need to refer to the anchors again.
+    _restore_script_item_anchors_via_doc(doc=doc)
+
+
+def _prepare_step_via_doc(step: Step, *, doc: BitbucketPipelinesYAMLDocument) -> Step:
+    """Add the caches and script items a step needs, giving the step to add."""
     _add_step_caches_via_doc(step, doc=doc)
 
     if step.name == _PLACEHOLDER_NAME:
@@ -151,39 +333,90 @@ def _add_step_in_default_via_doc(
 
             step.script.root[idx] = script_item
 
-    # If the step is unrecognized, it will go at the end.
+    return step
+
+
+def _get_step_requirements(
+    step: Step, *, step_order: list[list[str]]
+) -> tuple[set[str], set[str]]:
+    """The prerequisites and postrequisites of a step, from the canonical order.
+
+    A step runs after the steps in earlier groups and before those in later groups,
+    and in parallel with the rest of its own group. If the step is unrecognized, it
+    will go at the end.
+    """
     prerequisites: set[str] = set()
+    postrequisites: set[str] = set()
+
+    for group_idx, group in enumerate(step_order):
+        if step.name in group:
+            postrequisites = {
+                step_name
+                for later in step_order[group_idx + 1 :]
+                for step_name in later
+            }
+            break
+        prerequisites.update(group)
+
+    return prerequisites, postrequisites
+
+
+def _restore_script_item_anchors_via_doc(
+    *, doc: BitbucketPipelinesYAMLDocument
+) -> None:
+    config = doc.model
+
+    if config.pipelines is None or config.pipelines.default is None:
+        return
+
+    script_item_by_content = {
+        str(script_item): script_item
+        for script_item in get_defined_script_items_via_doc(doc=doc).values()
+    }
+    if not script_item_by_content:
+        return
+
+    for step in _get_steps_in_pipeline(config.pipelines.default):
+        for idx, script_item in enumerate(step.script.root):
+            if isinstance(script_item, str) and script_item in script_item_by_content:
+                step.script.root[idx] = script_item_by_content[script_item]
+
+
+def _get_step_order() -> list[list[str]]:
+    """The canonical order of the steps which usethis adds to the default pipeline.
+
+    Each group of steps is independent, so they can run in parallel. The checks come
+    before the tests, so that a failing check stops the pipeline before the slower
+    tests are run.
+    """
+    shards = get_bitbucket_settings().pytest_shards
 
-    # N.B. Currently, we are not accounting for parallelism, whereas all these steps
-    # could be parallel potentially.
     # See https://github.com/nathanjmcdougall/usethis-python/issues/149
-    step_order = [
-        "Run pre-commit",
-        # For these tools, sync them with the pre-commit removal logic
-        "Run pyproject-fmt",
-        "Run Ruff",
-        "Run Deptry",
-        *[f"Test on 3.{maj}" for maj in get_supported_major_python_versions()],
+    return [
+        [
+            "Run pre-commit",
+            # For these tools, sync them with the pre-commit removal logic
+            "Run pyproject-fmt",
+            "Run Ruff",
+            "Run Deptry",
+        ],
+        [
+            get_pytest_step_name(maj, shard=shard, shards=shards)
+            for maj in get_supported_major_python_versions()
+            for shard in range(1, shards + 1)
+        ],
     ]
-    for step_name in step_order:
-        if step_name == step.name:
-            break
-        prerequisites.add(step_name)
 
-    weld_result = usethis._pipeweld.func.Adder(
-        pipeline=get_pipeweld_pipeline_from_default(doc.model),
-        step=get_pipeweld_step(step),
-        prerequisites=prerequisites,
-    ).add()
-    for instruction in weld_result.instructions:
-        apply_pipeweld_instruction_via_doc(
-            instruction=instruction, new_step=step, doc=doc
-        )
+
+def get_pytest_step_name(version: int, *, shard: int = 1, shards: int = 1) -> str:
+    """The name of the step which runs a shard of the tests on a Python 3 version."""
+    if shards == 1:
+        return f"Test on 3.{version}"
+    return f"Test on 3.{version} (shard {shard}/{shards})"
 
 
 def remove_bitbucket_steps_from_default(steps: list[Step]) -> None:
-    for step in steps:
-        remove_bitbucket_step_from_default(step)
+    update_bitbucket_steps_in_default(add=[], remove=steps)
 
 
 def remove_bitbucket_step_from_default(step: Step) -> None:
@@ -191,7 +424,7 @@ def remove_bitbucket_step_from_default(step: Step) -> None:
 
     If the default pipeline does not exist, or the step is not found, nothing happens.
     """
-    if not (Path.cwd() / "bitbucket-pipelines.yml").exists():
+    if not exists(usethis_config.cpd() / "bitbucket-pipelines.yml"):
         return
 
     if step.name == _PLACEHOLDER_NAME:
@@ -217,20 +450,12 @@ def remove_bitbucket_step_from_default(step: Step) -> None:
             msg = "Cannot remove steps from an import pipeline."
             raise UnexpectedImportPipelineError(msg)
 
-        items = pipeline.root.root
-
-        # Iterate over the items. Any item that contains the step is censored to remove
-        # references to the step. If the only thing in the item is the step, we get None
-        new_items: list[StepItem | ParallelItem | StageItem] = []
-        for item in items:
-            new_item = _censor_step(item, step=step)
-            if new_item is not None:
-                new_items.append(new_item)
-        pipeline.root.root = new_items
+        _remove_step_in_default_via_doc(step, doc=doc)
 
-        if len(new_items) == 0:
-            placeholder = _get_placeholder_step()
-            _add_step_in_default_via_doc(placeholder, doc=doc)
+        if not pipeline.root.root:
+            _add_steps_in_default_via_doc(
+                [_get_placeholder_step()], doc=doc, step_order=_get_step_order()
+            )
 
         dump = bitbucket_fancy_dump(doc.model, reference=doc.content)
         update_ruamel_yaml_map(doc.content, dump, preserve_comments=True)
@@ -241,6 +466,32 @@ def remove_bitbucket_step_from_default(step: Step) -> None:
                 remove_cache(cache)
 
 
+def _remove_step_in_default_via_doc(
+    step: Step, *, doc: BitbucketPipelinesYAMLDocument
+) -> None:
+    config = doc.model
+
+    if config.pipelines is None or config.pipelines.default is None:
+        return
+
+    pipeline = config.pipelines.default
+
+    if isinstance(pipeline.root, ImportPipeline):
+        msg = "Cannot remove steps from an import pipeline."
+        raise UnexpectedImportPipelineError(msg)
+
+    items = pipeline.root.root
+
+    # Iterate over the items. Any item that contains the step is censored to remove
+    # references to the step. If the only thing in the item is the step, we get None
+    new_items: list[StepItem | ParallelItem | StageItem] = []
+    for item in items:
+        new_item = _censor_step(item, step=step)
+        if new_item is not None:
+            new_items.append(new_item)
+    pipeline.root.root = new_items
+
+
 @singledispatch
 def _censor_step(
     item: StepItem | ParallelItem | StageItem, *, step: Step
@@ -312,6 +563,20 @@ def is_cache_used(cache: str) -> bool:
     return False
 
 
+def _remove_unused_caches_via_doc(
+    caches: list[str], *, doc: BitbucketPipelinesYAMLDocument
+) -> None:
+    config = doc.model
+
+    steps: list[Step] = []
+    if config.pipelines is not None and config.pipelines.default is not None:
+        steps = _get_steps_in_pipeline(config.pipelines.default)
+
+    for cache in caches:
+        if not any(step.caches is not None and cache in step.caches for step in steps):
+            _remove_cache_via_doc(cache, doc=doc)
+
+
 def _add_step_caches_via_doc(
     step: Step, *, doc: BitbucketPipelinesYAMLDocument
 ) -> None:
@@ -321,9 +586,12 @@ def _add_step_caches_via_doc(
             try:
                 cache = _CACHE_LOOKUP[name]
             except KeyError:
+                supported_str = ", ".join(
+                    [f"'{cache_name}'" for cache_name in _CACHE_LOOKUP]
+                )
                 msg = (
                     f"Unrecognized cache name '{name}' in step '{step.name}'. "
-                    f"Supported caches are 'uv' and 'pre-commit'."
+                    f"Supported caches are {supported_str}."
                 )
                 raise NotImplementedError(msg) from None
             cache_by_name[name] = cache
@@ -355,7 +623,7 @@ def get_steps_in_default() -> list[Step]:
     Raises:
         UnexpectedImportPipelineError: If the pipeline is an import pipeline.
     """
-    if not (Path.cwd() / "bitbucket-pipelines.yml").exists():
+    if not exists(usethis_config.cpd() / "bitbucket-pipelines.yml"):
         return []
 
     with edit_bitbucket_pipelines_yaml() as doc:
@@ -372,6 +640,15 @@ def get_steps_in_default() -> list[Step]:
     return _get_steps_in_pipeline(pipeline)
 
 
+def _get_steps_in_default_via_doc(*, doc: BitbucketPipelinesYAMLDocument) -> list[Step]:
+    config = doc.model
+
+    if config.pipelines is None or config.pipelines.default is None:
+        return []
+
+    return _get_steps_in_pipeline(config.pipelines.default)
+
+
 def _get_steps_in_pipeline(pipeline: Pipeline) -> list[Step]:
     if isinstance(pipeline.root, ImportPipeline):
         msg = "Cannot retrieve steps from an import pipeline."
@@ -453,7 +730,11 @@ def get_defined_script_items_via_doc(
     if config.definitions.script_items is None:
         return {}
 
-    script_item_contents = doc.content["definitions"]["script_items"]
+    script_item_contents = [
+        # Items added to the model during this edit aren't in the content yet.
+        *doc.content.get("definitions", {}).get("script_items", []),
+        *config.definitions.script_items,
+    ]
 
     script_anchor_by_name = {}
     for script_item_content in script_item_contents:
@@ -468,6 +749,6 @@ def get_defined_script_items_via_doc(
             continue
 
         anchor_name = anchor.value
-        script_anchor_by_name[anchor_name] = script_item_content
+        script_anchor_by_name.setdefault(anchor_name, script_item_content)
 
     return script_anchor_by_name
@@ -0,0 +1,238 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
+from email.utils import parsedate_to_datetime
+from functools import cache
+from pathlib import Path
+from typing import Any
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from usethis._config import usethis_config
+from usethis._integrations.github.errors import GitHubAPIError, GitHubRateLimitError
+
+_API_URL = "https://api.github.com"
+
+# How long a cached response is used before it's revalidated, in seconds.
+_CACHE_TTL = 60 * 60
+
+_MAX_WORKERS = 8
+
+_TIMEOUT = 1
+
+
+class GitHubClient:
+    """A client for the GitHub REST API, with a connection pool and a response cache.
+
+    Responses are cached on disk along with their ETag. A cached response is used as-is
+    for an hour, and after that it's revalidated with a conditional request, which
+    GitHub doesn't count against the rate limit if nothing has changed. When offline,
+    when a request fails, or once the rate limit is exhausted, cached responses are used
+    regardless of their age.
+
+    If the `GITHUB_TOKEN` environment variable is set, requests are authenticated with
+    it, which gives a much higher rate limit.
+
+    Args:
+        api_url: The base URL of the API.
+        cache_dir: The directory to cache responses in.
+        max_workers: The most requests to make at once.
+    """
+
+    def __init__(
+        self,
+        *,
+        api_url: str = _API_URL,
+        cache_dir: Path,
+        max_workers: int = _MAX_WORKERS,
+    ) -> None:
+        self.api_url = api_url
+        self.cache_dir = cache_dir
+        self.max_workers = max_workers
+
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_maxsize=max_workers)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+        self._session.headers["Accept"] = "application/vnd.github+json"
+        token = os.environ.get("GITHUB_TOKEN")
+        if token:
+            self._session.headers["Authorization"] = f"Bearer {token}"
+
+        self._lock = threading.Lock()
+        self._rate_limit_reset: float | None = None
+
+    def get_json(self, path: str) -> Any:
+        """Get the JSON response from an endpoint of the API.
+
+        Args:
+            path: The path of the endpoint, e.g. '/repos/owner/repo/tags'.
+
+        Raises:
+            GitHubAPIError: If the request fails and there's no cached response.
+            GitHubRateLimitError: If the rate limit is exhausted and there's no cached
+                                  response.
+        """
+        url = f"{self.api_url}{path}"
+        cached = self._read_cache(url)
+        if cached is not None and (
+            usethis_config.offline or time.time() - cached["fetched_at"] < _CACHE_TTL
+        ):
+            return cached["body"]
+
+        if usethis_config.offline:
+            msg = f"Cannot fetch '{url}' while offline"
+            raise GitHubAPIError(msg)
+
+        try:
+            return self._fetch(url, cached=cached)
+        except GitHubAPIError:
+            if cached is not None:
+                # Better a stale response than none at all.
+                return cached["body"]
+            raise
+
+    def get_json_many(self, paths: list[str]) -> list[Any | GitHubAPIError]:
+        """Get the JSON responses from several endpoints of the API, concurrently.
+
+        Args:
+            paths: The paths of the endpoints.
+
+        Returns:
+            The response for each path, in order, or the error which prevented it being
+            fetched.
+        """
+        if not paths:
+            return []
+
+        with ThreadPoolExecutor(
+            max_workers=min(self.max_workers, len(paths))
+        ) as executor:
+            # Each request runs in a copy of the current context to keep its options.
+            futures = [
+                executor.submit(copy_context().run, self._try_get_json, path)
+                for path in paths
+            ]
+            return [future.result() for future in futures]
+
+    def _try_get_json(self, path: str) -> Any | GitHubAPIError:
+        try:
+            return self.get_json(path)
+        except GitHubAPIError as err:
+            return err
+
+    def _fetch(self, url: str, *, cached: dict[str, Any] | None) -> Any:
+        with self._lock:
+            reset = self._rate_limit_reset
+        if reset is not None and time.time() < reset:
+            msg = f"GitHub API rate limit exceeded; it resets at {time.ctime(reset)}"
+            raise GitHubRateLimitError(msg)
+
+        headers = {}
+        if cached is not None and cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+
+        try:
+            response = self._session.get(url, headers=headers, timeout=_TIMEOUT)
+        except requests.exceptions.RequestException as err:
+            msg = f"Failed to fetch '{url}': {err}"
+            raise GitHubAPIError(msg) from None
+
+        self._track_rate_limit(response)
+
+        if response.status_code == requests.codes.not_modified and cached is not None:
+            body = cached["body"]
+            etag = cached["etag"]
+        else:
+            try:
+                response.raise_for_status()
+            except requests.exceptions.HTTPError as err:
+                if _is_rate_limited(response):
+                    msg = f"GitHub API rate limit exceeded: {err}"
+                    raise GitHubRateLimitError(msg) from None
+                msg = f"Failed to fetch '{url}': {err}"
+                raise GitHubAPIError(msg) from None
+
+            body = response.json()
+            etag = response.headers.get("ETag")
+
+        self._write_cache(url, {"etag": etag, "body": body, "fetched_at": time.time()})
+        return body
+
+    def _track_rate_limit(self, response: requests.Response) -> None:
+        # Once the limit is reached, stop making requests until it resets.
+        reset = _parse_retry_after(response.headers.get("Retry-After"))
+        if reset is None and response.headers.get("X-RateLimit-Remaining") == "0":
+            reset = float(response.headers.get("X-RateLimit-Reset", time.time() + 60))
+
+        if reset is not None:
+            with self._lock:
+                self._rate_limit_reset = reset
+
+    def _get_cache_path(self, url: str) -> Path:
+        name = hashlib.sha256(url.encode()).hexdigest()
+        return self.cache_dir / f"{name}.json"
+
+    def _read_cache(self, url: str) -> dict[str, Any] | None:
+        try:
+            cached = json.loads(self._get_cache_path(url).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+
+        if not isinstance(cached, dict) or cached.get("url") != url:
+            return None
+        return cached
+
+    def _write_cache(self, url: str, cached: dict[str, Any]) -> None:
+        path = self._get_cache_path(url)
+        # Write to a temporary file first, since other processes may read the cache.
+        tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_text(json.dumps({"url": url, **cached}), encoding="utf-8")
+            tmp_path.replace(path)
+        except OSError:
+            # The cache is only an optimization.
+            pass
+
+
+def _parse_retry_after(value: str | None) -> float | None:
+    """The time to retry after, from a Retry-After header in seconds or as a date.
+
+    Values which can't be parsed are ignored.
+    """
+    if value is None:
+        return None
+
+    try:
+        return time.time() + float(value)
+    except ValueError:
+        pass
+
+    try:
+        return parsedate_to_datetime(value).timestamp()
+    except (TypeError, ValueError):
+        return None
+
+
+def _is_rate_limited(response: requests.Response) -> bool:
+    return response.status_code in {
+        requests.codes.forbidden,
+        requests.codes.too_many_requests,
+    } and (
+        response.headers.get("X-RateLimit-Remaining") == "0"
+        or "Retry-After" in response.headers
+    )
+
+
+@cache
+def get_github_client() -> GitHubClient:
+    """The client shared by everything which uses the GitHub API."""
+    cache_home = os.environ.get("XDG_CACHE_HOME") or "~/.cache"
+    cache_dir = Path(cache_home).expanduser() / "usethis" / "github"
+    return GitHubClient(api_url=_API_URL, cache_dir=cache_dir)
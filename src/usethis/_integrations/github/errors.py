@@ -1,7 +1,15 @@
 from usethis.errors import UsethisError
 
 
-class GitHubTagError(UsethisError):
+class GitHubAPIError(UsethisError):
+    """Raised when a request to the GitHub API fails."""
+
+
+class GitHubRateLimitError(GitHubAPIError):
+    """Raised when the GitHub API rate limit has been exhausted."""
+
+
+class GitHubTagError(GitHubAPIError):
     """Custom exception for GitHub tag-related errors."""
 
 
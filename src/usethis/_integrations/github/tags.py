@@ -1,6 +1,11 @@
-import requests
+from typing import Any
 
-from usethis._integrations.github.errors import GitHubTagError, NoGitHubTagsFoundError
+from usethis._integrations.github.client import get_github_client
+from usethis._integrations.github.errors import (
+    GitHubAPIError,
+    GitHubTagError,
+    NoGitHubTagsFoundError,
+)
 
 
 def get_github_latest_tag(owner: str, repo: str) -> str:
@@ -17,22 +22,42 @@ def get_github_latest_tag(owner: str, repo: str) -> str:
         GitHubTagError: If there's an issue fetching the tags from the GitHub API.
         NoTagsFoundError: If the repository has no tags.
     """
-    # GitHub API URL for repository tags
-    api_url = f"https://api.github.com/repos/{owner}/{repo}/tags"
+    tag = get_github_latest_tags([(owner, repo)])[owner, repo]
+    if isinstance(tag, GitHubTagError):
+        raise tag
+    return tag
 
-    # Fetch the tags using the GitHub API
-    try:
-        response = requests.get(api_url, timeout=1)
-        response.raise_for_status()  # Raise an error for HTTP issues
-    except (requests.exceptions.HTTPError, requests.exceptions.ConnectionError) as err:
-        msg = f"Failed to fetch tags from GitHub API: {err}"
-        raise GitHubTagError(msg)
 
-    tags = response.json()
+def get_github_latest_tags(
+    repos: list[tuple[str, str]],
+) -> dict[tuple[str, str], str | GitHubTagError]:
+    """Get the most recent tag for each of several GitHub repositories, concurrently.
 
-    if not tags:
+    Args:
+        repos: Pairs of the GitHub repository owner and name.
+
+    Returns:
+        The name of the most recent tag for each repository, or the error which
+        prevented it from being found.
+    """
+    repos = list(dict.fromkeys(repos))
+    responses = get_github_client().get_json_many(
+        [f"/repos/{owner}/{repo}/tags" for owner, repo in repos]
+    )
+    return {
+        (owner, repo): _get_latest_tag(owner, repo, response)
+        for (owner, repo), response in zip(repos, responses, strict=True)
+    }
+
+
+def _get_latest_tag(owner: str, repo: str, response: Any) -> str | GitHubTagError:
+    if isinstance(response, GitHubAPIError):
+        msg = f"Failed to fetch tags from GitHub API: {response}"
+        return GitHubTagError(msg)
+
+    if not response:
         msg = f"No tags found for repository '{owner}/{repo}'"
-        raise NoGitHubTagsFoundError(msg)
+        return NoGitHubTagsFoundError(msg)
 
     # Most recent tag's name
-    return tags[0]["name"]
+    return response[0]["name"]
@@ -1,20 +1,82 @@
-from pathlib import Path
+from collections.abc import Generator
+from contextlib import contextmanager
+from contextvars import ContextVar, copy_context
+from threading import Thread
+
+from pydantic import BaseModel
 
 from usethis._config import usethis_config
 from usethis._console import box_print, info_print, tick_print
+from usethis._files import (
+    exists,
+    is_on_disk,
+    unlink,
+    without_staged_files,
+)
 from usethis._integrations.pre_commit.errors import PreCommitInstallationError
+from usethis._integrations.pre_commit.hooks import get_install_hook_types
 from usethis._integrations.uv.call import call_uv_subprocess
+from usethis._integrations.uv.deps import apply_deferred_dep_changes
 from usethis._integrations.uv.errors import UVSubprocessFailedError
+from usethis._integrations.uv.lock import get_locked_version
 
 
 def remove_pre_commit_config() -> None:
     name = ".pre-commit-config.yaml"
-    if not (Path.cwd() / name).exists():
+    if not exists(usethis_config.cpd() / name):
         # Early exit; the file already doesn't exist
         return
 
     tick_print(f"Removing '{name}'.")
-    (Path.cwd() / name).unlink()
+    unlink(usethis_config.cpd() / name)
+
+
+class _DeferredInstall(BaseModel):
+    """The hook (un)installation requested while it was deferred.
+
+    The latest request wins, so at most one of the two is pending.
+
+    Attributes:
+        is_pending: Whether the hooks were requested to be installed.
+        uninstall_hook_type_args: The hook types to uninstall, if the hooks were
+                                  requested to be uninstalled. These are found when
+                                  requested, since the configuration is usually removed
+                                  straight afterwards.
+    """
+
+    is_pending: bool = False
+    uninstall_hook_type_args: list[str] | None = None
+
+
+_deferred_install: ContextVar[_DeferredInstall | None] = ContextVar(
+    "usethis_deferred_pre_commit_install", default=None
+)
+
+
+@contextmanager
+def defer_pre_commit_hooks_installation() -> Generator[None, None, None]:
+    """Install or uninstall pre-commit hooks at most once, on exit, not on every request.
+
+    This allows pre-commit to run once the other changes are on disk, e.g. after staged
+    files are committed and deferred dependency changes are applied. If an error is
+    raised within the context, the hooks are left alone.
+    """
+    if _deferred_install.get() is not None:
+        # Already deferring; the outermost context will install the hooks.
+        yield
+        return
+
+    deferred = _DeferredInstall()
+    token = _deferred_install.set(deferred)
+    try:
+        yield
+    finally:
+        _deferred_install.reset(token)
+
+    if deferred.uninstall_hook_type_args is not None:
+        _uninstall_pre_commit_hooks(deferred.uninstall_hook_type_args, is_deferred=True)
+    elif deferred.is_pending:
+        install_pre_commit_hooks()
 
 
 def install_pre_commit_hooks() -> None:
@@ -23,42 +85,221 @@ def install_pre_commit_hooks() -> None:
     Note that this requires pre-commit to be installed. It also requires the user to be
     in a git repo.
     """
-    if usethis_config.frozen:
+    deferred = _deferred_install.get()
+    if deferred is not None:
+        deferred.is_pending = True
+        deferred.uninstall_hook_type_args = None
+        return
+
+    if usethis_config.frozen or usethis_config.dry_run or not is_on_disk():
         box_print("Run 'uv run pre-commit install' to register pre-commit with git.")
         return
 
+    # pre-commit needs to be available in the environment.
+    apply_deferred_dep_changes()
+
     tick_print("Ensuring pre-commit is installed to Git.")
     try:
-        call_uv_subprocess(["run", "pre-commit", "install"])
+        call_uv_subprocess(["run", "pre-commit", "install", *_get_hook_type_args()])
     except UVSubprocessFailedError as err:
         msg = f"Failed to install pre-commit in the Git repository:\n{err}"
         raise PreCommitInstallationError(msg) from None
     tick_print("Ensuring pre-commit hooks are installed.")
-    info_print(
-        "This may take a minute or so while the hooks are downloaded.", temporary=True
-    )
+    jobs = _background_jobs.get()
+    if jobs is None:
+        info_print(
+            "This may take a minute or so while the hooks are downloaded.",
+            temporary=True,
+        )
+        _install_hook_environments()
+    elif not jobs:
+        # The download may have started already, while the hooks were deferred.
+        info_print("Downloading the pre-commit hook environments in the background.")
+        jobs.append(_HookEnvironmentsJob())
+
+
+def _get_hook_type_args() -> list[str]:
+    hook_types = get_install_hook_types()
+    if hook_types == ["pre-commit"]:
+        return []
+
+    # Older versions of pre-commit don't read the hook types from the configuration.
+    return [arg for hook_type in hook_types for arg in ("--hook-type", hook_type)]
+
+
+def start_pre_commit_hook_environments_download() -> None:
+    """Start downloading the hook environments for deferred pre-commit hooks.
+
+    Once the hook configuration is final, the hook environments can be downloaded
+    while the rest of the work carries on, rather than after it. The download uses
+    pre-commit as a uv tool, since pre-commit needn't be in the project's environment
+    yet. The tool is pinned to the version in the project's lockfile, so that the hook
+    environments are built by the same pre-commit which later runs them. Without a
+    locked version, the download is left to the deferred installation instead.
+
+    This only has an effect while hooks are both deferred and due to be installed, and
+    within `install_pre_commit_hooks_in_background`. The deferred installation then
+    skips its own download. pre-commit reads the configuration from disk, so any staged
+    files need to be committed first.
+    """
+    deferred = _deferred_install.get()
+    jobs = _background_jobs.get()
+    if deferred is None or not deferred.is_pending or jobs is None or jobs:
+        return
+
+    if usethis_config.frozen or usethis_config.dry_run or not is_on_disk():
+        return
+
+    tool_version = get_locked_version("pre-commit")
+    if tool_version is None:
+        return
+
+    info_print("Downloading the pre-commit hook environments in the background.")
+    jobs.append(_HookEnvironmentsJob(tool_version=tool_version))
+
+
+def _install_hook_environments(*, tool_version: str | None = None) -> None:
+    if tool_version is not None:
+        offline_args = ["--offline"] if usethis_config.offline else []
+        args = [
+            "tool",
+            "run",
+            *offline_args,
+            "--from",
+            f"pre-commit=={tool_version}",
+            "pre-commit",
+            "install-hooks",
+        ]
+    else:
+        args = ["run", "pre-commit", "install-hooks"]
+
     try:
-        call_uv_subprocess(["run", "pre-commit", "install-hooks"])
+        call_uv_subprocess(args)
     except UVSubprocessFailedError as err:
         msg = f"Failed to install pre-commit hooks:\n{err}"
         raise PreCommitInstallationError(msg) from None
 
 
+class _HookEnvironmentsJob:
+    """The pre-commit hook environments being installed in a background thread.
+
+    Args:
+        tool_version: The version of pre-commit to run as a uv tool. If None,
+                      pre-commit runs from the project's environment instead.
+    """
+
+    def __init__(self, *, tool_version: str | None = None) -> None:
+        self.error: PreCommitInstallationError | None = None
+        self.tool_version = tool_version
+        # The thread runs in a copy of the current context, to keep the same options.
+        context = copy_context()
+        self._thread = Thread(target=context.run, args=(self._run,), daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        try:
+            with without_staged_files():
+                _install_hook_environments(tool_version=self.tool_version)
+        except PreCommitInstallationError as err:
+            self.error = err
+
+    def wait(self) -> None:
+        self._thread.join()
+
+
+_background_jobs: ContextVar[list[_HookEnvironmentsJob] | None] = ContextVar(
+    "usethis_pre_commit_background_jobs", default=None
+)
+
+
+@contextmanager
+def install_pre_commit_hooks_in_background() -> Generator[None, None, None]:
+    """Download the pre-commit hook environments in the background, joined on exit.
+
+    Within the context, installing the hooks returns as soon as pre-commit is installed
+    to Git, while the hook environments are downloaded in a separate thread. Other work
+    can carry on meanwhile. On exit, the download is waited for.
+
+    Raises:
+        PreCommitInstallationError: On exit, if the hook environments failed to
+                                    install.
+    """
+    if _background_jobs.get() is not None:
+        # Already in the background; the outermost context will wait for the jobs.
+        yield
+        return
+
+    jobs: list[_HookEnvironmentsJob] = []
+    token = _background_jobs.set(jobs)
+    try:
+        yield
+    finally:
+        _background_jobs.reset(token)
+        if jobs:
+            info_print(
+                "Waiting for the pre-commit hook environments to download.",
+                temporary=True,
+            )
+        for job in jobs:
+            job.wait()
+
+    for job in jobs:
+        if job.error is not None and job.tool_version is not None:
+            # By now pre-commit is in the project's environment, so try it from there.
+            _install_hook_environments()
+        elif job.error is not None:
+            raise job.error
+
+    if jobs:
+        tick_print("Downloaded the pre-commit hook environments.")
+
+
 def uninstall_pre_commit_hooks() -> None:
     """Uninstall pre-commit hooks.
 
     Note that this requires pre-commit to be installed. It also requires the user to be
     in a git repo.
     """
-    if usethis_config.frozen:
-        box_print(
-            "Run 'uv run pre-commit uninstall' to deregister pre-commit with git."
-        )
+    is_runnable = not (
+        usethis_config.frozen or usethis_config.dry_run or not is_on_disk()
+    )
+
+    deferred = _deferred_install.get()
+    if deferred is not None:
+        deferred.is_pending = False
+        deferred.uninstall_hook_type_args = _get_hook_type_args() if is_runnable else []
         return
 
+    if not is_runnable:
+        _uninstall_pre_commit_hooks_instructions()
+        return
+
+    _uninstall_pre_commit_hooks(_get_hook_type_args())
+
+
+def _uninstall_pre_commit_hooks_instructions() -> None:
+    box_print("Run 'uv run pre-commit uninstall' to deregister pre-commit with git.")
+
+
+def _uninstall_pre_commit_hooks(
+    hook_type_args: list[str], *, is_deferred: bool = False
+) -> None:
+    if usethis_config.frozen or usethis_config.dry_run or not is_on_disk():
+        _uninstall_pre_commit_hooks_instructions()
+        return
+
+    if is_deferred:
+        # The dependency changes were applied first, which might have removed
+        # pre-commit from the environment.
+        args = ["run", "--with", "pre-commit", "pre-commit", "uninstall"]
+    else:
+        # pre-commit needs to be available in the environment.
+        apply_deferred_dep_changes()
+        args = ["run", "pre-commit", "uninstall"]
+
     tick_print("Ensuring pre-commit hooks are uninstalled.")
     try:
-        call_uv_subprocess(["run", "pre-commit", "uninstall"])
+        call_uv_subprocess([*args, *hook_type_args])
     except UVSubprocessFailedError as err:
         msg = f"Failed to uninstall pre-commit hooks:\n{err}"
         raise PreCommitInstallationError(msg) from None
@@ -7,3 +7,11 @@ class PreCommitError(UsethisError):
 
 class PreCommitInstallationError(PreCommitError):
     """Used when something goes wrong installing or uninstalling pre-commit hooks."""
+
+
+class DuplicatedHookNameError(ValueError):
+    """Raised when a hook name is duplicated in a pre-commit configuration file."""
+
+
+class InvalidPreCommitSettingsError(PreCommitError):
+    """Raised when the usethis pre-commit settings in 'pyproject.toml' are invalid."""
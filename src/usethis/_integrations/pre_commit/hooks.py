@@ -1,9 +1,12 @@
-from collections import Counter
-from pathlib import Path
-
+from usethis._config import usethis_config
 from usethis._console import box_print, tick_print
+from usethis._files import exists
 from usethis._integrations.pre_commit.dump import pre_commit_fancy_dump
-from usethis._integrations.pre_commit.io_ import edit_pre_commit_config_yaml
+from usethis._integrations.pre_commit.index import HookIndex
+from usethis._integrations.pre_commit.io_ import (
+    PreCommitConfigYAMLDocument,
+    edit_pre_commit_config_yaml,
+)
 from usethis._integrations.pre_commit.schema import (
     HookDefinition,
     JsonSchemaForPreCommitConfigYaml,
@@ -12,6 +15,7 @@ from usethis._integrations.pre_commit.schema import (
     MetaRepo,
     UriRepo,
 )
+from usethis._integrations.pre_commit.settings import get_pre_commit_settings
 from usethis._integrations.yaml.update import update_ruamel_yaml_map
 
 _HOOK_ORDER = [
@@ -25,101 +29,161 @@ _HOOK_ORDER = [
 
 _PLACEHOLDER_ID = "placeholder"
 
-
-class DuplicatedHookNameError(ValueError):
-    """Raised when a hook name is duplicated in a pre-commit configuration file."""
+# The Git hook type which runs each stage, where it differs from the stage's name. Manual
+# hooks are only ever run explicitly, so they need no Git hook.
+_HOOK_TYPE_BY_STAGE: dict[str, str | None] = {
+    "commit": "pre-commit",
+    "merge-commit": "pre-merge-commit",
+    "push": "pre-push",
+    "manual": None,
+}
 
 
 def add_repo(repo: LocalRepo | UriRepo) -> None:
     """Add a pre-commit repo configuration to the pre-commit configuration file.
 
-    This assumes the hook doesn't already exist in the configuration file.
+    Hooks which already exist in the configuration file are skipped.
     """
-    with edit_pre_commit_config_yaml() as doc:
-        if repo.hooks is None or len(repo.hooks) != 1:
-            msg = "Currently, only repos with exactly one hook are supported."
-            raise NotImplementedError(msg)  # Should allow multiple or 0 hooks per repo
+    add_repos([repo])
 
-        (hook_config,) = repo.hooks
-        hook_name = hook_config.id
 
-        if hook_name is None:
-            msg = "Hook ID must be specified"
-            raise ValueError(msg)
+def add_repos(repos: list[LocalRepo | UriRepo]) -> None:
+    """Add several pre-commit repo configurations in a single edit of the file.
 
-        # Ordered list of the hooks already in the file
-        existing_hooks = extract_hook_names(doc.model)
+    Each hook is placed according to the hook order, in the order given. A hook is
+    added to a neighbouring repo with the same URL and rev if there is one, so that
+    pre-commit has fewer repos to clone and environments to build. Hooks which are
+    already in the configuration file are skipped.
 
-        if not existing_hooks:
-            if hook_name == _PLACEHOLDER_ID:
-                tick_print("Adding placeholder hook to '.pre-commit-config.yaml'.")
-            else:
-                tick_print(f"Adding hook '{hook_name}' to '.pre-commit-config.yaml'.")
+    Hooks run at the stages given for them in the usethis pre-commit settings, and the
+    Git hook types for those stages are added to `default_install_hook_types`.
+    """
+    for repo in repos:
+        for hook_config in repo.hooks or []:
+            if hook_config.id is None:
+                msg = "Hook ID must be specified"
+                raise ValueError(msg)
 
-            doc.model.repos.append(repo)
-        else:
-            # Get the precendents, i.e. hooks occurring before the new hook
-            try:
-                hook_idx = _HOOK_ORDER.index(hook_name)
-            except ValueError:
-                msg = f"Hook '{hook_name}' not recognized"
-                raise NotImplementedError(msg)
-            precedents = _HOOK_ORDER[:hook_idx]
-
-            # Find the last of the precedents in the existing hooks
-            existings_precedents = [
-                hook for hook in existing_hooks if hook in precedents
-            ]
-            if existings_precedents:
-                last_precedent = existings_precedents[-1]
-            else:
-                # Use the last existing hook
-                last_precedent = existing_hooks[-1]
-
-            doc.model.repos = insert_repo(
-                repo_to_insert=repo,
-                existing_repos=doc.model.repos,
-                predecessor=last_precedent,
+    stages_by_id = get_pre_commit_settings().stages
+
+    with edit_pre_commit_config_yaml() as doc:
+        is_changed = False
+        for repo in repos:
+            for hook_config in repo.hooks or []:
+                if hook_config.id in stages_by_id:
+                    hook_config = hook_config.model_copy(
+                        update={"stages": stages_by_id[hook_config.id]}
+                    )
+                if _add_hook_to_doc(doc, repo, hook_config):
+                    is_changed = True
+
+        if is_changed:
+            _add_install_hook_types(doc.model)
+            update_ruamel_yaml_map(
+                doc.content,
+                pre_commit_fancy_dump(doc.model, reference=doc.content),
+                preserve_comments=True,
             )
 
-        update_ruamel_yaml_map(
-            doc.content,
-            pre_commit_fancy_dump(doc.model, reference=doc.content),
-            preserve_comments=True,
+
+def _add_hook_to_doc(
+    doc: PreCommitConfigYAMLDocument,
+    repo: LocalRepo | UriRepo,
+    hook_config: HookDefinition,
+) -> bool:
+    """Add a hook from a repo to the document, returning whether it was added."""
+    hook_name = hook_config.id
+    assert hook_name is not None
+
+    index = doc.index
+    if hook_name in index:
+        return False
+
+    repos = doc.model.repos
+    last_repo_idx = index.last_repo_with_hooks()
+    if last_repo_idx is None:
+        if hook_name == _PLACEHOLDER_ID:
+            tick_print("Adding placeholder hook to '.pre-commit-config.yaml'.")
+        else:
+            tick_print(f"Adding hook '{hook_name}' to '.pre-commit-config.yaml'.")
+
+        index.insert_repo(
+            repo.model_copy(update={"hooks": [hook_config]}), at=len(repos)
         )
+        return True
+
+    # Get the precendents, i.e. hooks occurring before the new hook
+    try:
+        hook_idx = _HOOK_ORDER.index(hook_name)
+    except ValueError:
+        msg = f"Hook '{hook_name}' not recognized"
+        raise NotImplementedError(msg)
+    precedents = _HOOK_ORDER[:hook_idx]
+
+    # Insert after the last of the precedents in the existing hooks, or otherwise
+    # after the last existing hook
+    existing_precedents = [index.position(hook) for hook in precedents if hook in index]
+    if existing_precedents:
+        repo_idx, hook_idx = max(existing_precedents)
+    else:
+        repo_idx = last_repo_idx
+        hook_idx = len(repos[repo_idx].hooks or []) - 1
+
+    tick_print(f"Adding hook '{hook_name}' to '.pre-commit-config.yaml'.")
+    is_last_in_repo = hook_idx == len(repos[repo_idx].hooks or []) - 1
+    if _get_source(repos[repo_idx]) == _get_source(repo):
+        index.insert_hook(hook_config, repo_idx=repo_idx, at=hook_idx + 1)
+    elif (
+        is_last_in_repo
+        and repo_idx + 1 < len(repos)
+        and _get_source(repos[repo_idx + 1]) == _get_source(repo)
+    ):
+        index.insert_hook(hook_config, repo_idx=repo_idx + 1, at=0)
+    else:
+        index.insert_repo(
+            repo.model_copy(update={"hooks": [hook_config]}), at=repo_idx + 1
+        )
+
+    # Don't include the placeholder from now on, since we're adding a hook which can
+    # be there instead.
+    if _PLACEHOLDER_ID in index:
+        index.remove_hook(_PLACEHOLDER_ID)
+
+    return True
 
 
-def insert_repo(
-    *,
-    repo_to_insert: LocalRepo | UriRepo | MetaRepo,
-    existing_repos: list[LocalRepo | UriRepo | MetaRepo],
-    predecessor: str,
-) -> list[LocalRepo | UriRepo | MetaRepo]:
-    # Insert the new hook after the last precedent repo
-    # Do this by iterating over the repos and hooks, and inserting the new hook
-    # after the last precedent
+def _add_install_hook_types(model: JsonSchemaForPreCommitConfigYaml) -> None:
+    """Add the Git hook types needed for every stage which the hooks run at."""
+    hook_types = list(model.default_install_hook_types or ["pre-commit"])
+    for repo in model.repos:
+        for hook in repo.hooks or []:
+            if not isinstance(hook, HookDefinition) or hook.stages is None:
+                continue
 
-    repos = []
-    for repo in existing_repos:
-        hooks = repo.hooks
-        if hooks is None:
-            hooks = []
+            for stage in hook.stages.root:
+                hook_type = _HOOK_TYPE_BY_STAGE.get(stage.root, stage.root)
+                if hook_type is not None and hook_type not in hook_types:
+                    hook_types.append(hook_type)
 
-        # Don't include the placeholder from now on, since we're adding a repo
-        # which can be there instead.
-        if [hook.id for hook in hooks] != [_PLACEHOLDER_ID]:
-            repos.append(repo)
+    model.default_install_hook_types = hook_types
 
-        for hook in hooks:
-            if hook.id == predecessor:
-                if repo_to_insert.hooks is not None:
-                    for inserted_hook in repo_to_insert.hooks:
-                        tick_print(
-                            f"Adding hook '{inserted_hook.id}' to '.pre-commit-config.yaml'."
-                        )
-                repos.append(repo_to_insert)
 
-    return repos
+def get_install_hook_types() -> list[str]:
+    """The Git hook types which pre-commit is installed as, for the configuration."""
+    path = usethis_config.cpd() / ".pre-commit-config.yaml"
+
+    if not exists(path):
+        return ["pre-commit"]
+
+    with edit_pre_commit_config_yaml() as doc:
+        return list(doc.model.default_install_hook_types or ["pre-commit"])
+
+
+def _get_source(repo: LocalRepo | UriRepo | MetaRepo) -> tuple[str | None, str | None]:
+    """The repo URL and rev, which hooks must share to be in the same repo."""
+    if isinstance(repo, UriRepo):
+        return repo.repo, repo.rev
+    return repo.repo, None
 
 
 def add_placeholder_hook() -> None:
@@ -149,54 +213,78 @@ def remove_hook(name: str) -> None:
     If the hook doesn't exist, this function will have no effect. Meta hooks are
     ignored.
     """
+    remove_hooks([name])
+
+
+def remove_hooks(names: list[str]) -> None:
+    """Remove several pre-commit hook configurations in a single edit of the file.
+
+    Hooks which don't exist are ignored, as are meta hooks.
+    """
     with edit_pre_commit_config_yaml() as doc:
-        # search across the repos for any hooks with ID equal to name
-        for repo in doc.model.repos:
-            if isinstance(repo, MetaRepo) or repo.hooks is None:
+        index = doc.index
+        for name in names:
+            if name not in index:
                 continue
 
-            for hook in repo.hooks:
-                if hook.id == name:
-                    tick_print(
-                        f"Removing hook '{hook.id}' from '.pre-commit-config.yaml'."
-                    )
-                    repo.hooks.remove(hook)
+            repo_idx, _ = index.position(name)
+            if isinstance(doc.model.repos[repo_idx], MetaRepo):
+                continue
 
-            # if repo has no hooks, remove it
-            if not repo.hooks:
-                doc.model.repos.remove(repo)
+            tick_print(f"Removing hook '{name}' from '.pre-commit-config.yaml'.")
+            index.remove_hook(name)
 
         # If there are no more hooks, we should add a placeholder.
         if not doc.model.repos:
-            doc.model.repos.append(_get_placeholder_repo_config())
+            index.insert_repo(_get_placeholder_repo_config(), at=0)
 
         dump = pre_commit_fancy_dump(doc.model, reference=doc.content)
         update_ruamel_yaml_map(doc.content, dump, preserve_comments=True)
 
 
-def get_hook_names() -> list[str]:
-    path = Path.cwd() / ".pre-commit-config.yaml"
+def get_uri_repos() -> list[UriRepo]:
+    """The repos in the pre-commit configuration file which are fetched from a URL."""
+    path = usethis_config.cpd() / ".pre-commit-config.yaml"
 
-    if not path.exists():
+    if not exists(path):
         return []
 
     with edit_pre_commit_config_yaml() as doc:
-        return extract_hook_names(doc.model)
+        return [repo for repo in doc.model.repos if isinstance(repo, UriRepo)]
 
 
-def extract_hook_names(model: JsonSchemaForPreCommitConfigYaml) -> list[str]:
-    hook_names = []
-    for repo in model.repos:
-        if repo.hooks is None:
-            continue
+def update_repo_revs(revs: dict[str, str]) -> None:
+    """Change the revs of several repos in a single edit of the configuration file.
+
+    Args:
+        revs: The new rev for each repo, by its URL. Other repos are left alone.
+    """
+    with edit_pre_commit_config_yaml() as doc:
+        for repo, repo_content in zip(
+            doc.model.repos, doc.content["repos"], strict=True
+        ):
+            if not isinstance(repo, UriRepo) or repo.repo not in revs:
+                continue
+
+            rev = revs[repo.repo]
+            if repo.rev == rev:
+                continue
 
-        for hook in repo.hooks:
-            hook_names.append(hook.id)
+            tick_print(f"Updating rev of '{repo.repo}' to '{rev}'.")
+            # Set the rev in-place, to keep any comment on it, e.g. on why it's pinned.
+            repo.rev = rev
+            repo_content["rev"] = rev
 
-    # Need to validate there are no duplicates
-    for name, count in Counter(hook_names).items():
-        if count > 1:
-            msg = f"Hook name '{name}' is duplicated"
-            raise DuplicatedHookNameError(msg)
 
-    return hook_names
+def get_hook_names() -> list[str]:
+    path = usethis_config.cpd() / ".pre-commit-config.yaml"
+
+    if not exists(path):
+        return []
+
+    with edit_pre_commit_config_yaml() as doc:
+        return doc.index.names()
+
+
+def extract_hook_names(model: JsonSchemaForPreCommitConfigYaml) -> list[str]:
+    return HookIndex(model).names()
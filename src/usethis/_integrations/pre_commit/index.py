@@ -0,0 +1,138 @@
+from usethis._integrations.pre_commit.errors import DuplicatedHookNameError
+from usethis._integrations.pre_commit.schema import (
+    Hook,
+    HookDefinition,
+    JsonSchemaForPreCommitConfigYaml,
+    LocalRepo,
+    MetaRepo,
+    UriRepo,
+)
+
+
+class HookIndex:
+    """An index of the hooks in a pre-commit configuration, by hook ID.
+
+    The index maps each hook ID to its position, i.e. the index of its repo in the
+    list of repos and the index of the hook within that repo. Looking up a hook is
+    constant-time, rather than a scan of every repo and hook.
+
+    The index only stays consistent with the model if the repos are changed through
+    the index's methods. Inserting or removing a whole repo shifts the positions of
+    the hooks after it, which is linear in the number of hooks, much like the list
+    insertion in the model itself.
+
+    Args:
+        model: The pre-commit configuration to index.
+
+    Raises:
+        DuplicatedHookNameError: If two hooks share the same ID.
+    """
+
+    def __init__(self, model: JsonSchemaForPreCommitConfigYaml) -> None:
+        self._model = model
+        self._positions: dict[str, tuple[int, int]] = {}
+        self._names: list[str] | None = None
+        for repo_idx, repo in enumerate(model.repos):
+            self._index_repo(repo, repo_idx)
+
+    def __contains__(self, hook_id: str) -> bool:
+        return hook_id in self._positions
+
+    def __len__(self) -> int:
+        return len(self._positions)
+
+    def position(self, hook_id: str) -> tuple[int, int]:
+        """The index of the repo, and of the hook within that repo, for a hook ID.
+
+        Raises:
+            KeyError: If the hook isn't in the configuration.
+        """
+        return self._positions[hook_id]
+
+    def names(self) -> list[str]:
+        """The hook IDs, in the order they appear in the configuration."""
+        if self._names is None:
+            self._names = sorted(self._positions, key=self._positions.__getitem__)
+        return list(self._names)
+
+    def last_repo_with_hooks(self) -> int | None:
+        """The index of the last repo which has any hooks, if there is one."""
+        for repo_idx in reversed(range(len(self._model.repos))):
+            if self._model.repos[repo_idx].hooks:
+                return repo_idx
+        return None
+
+    def insert_repo(self, repo: LocalRepo | UriRepo | MetaRepo, *, at: int) -> None:
+        """Insert a repo into the list of repos, before the repo currently at `at`.
+
+        Raises:
+            DuplicatedHookNameError: If the repo has a hook which is already indexed.
+        """
+        self._model.repos.insert(at, repo)
+        self._names = None
+        self._positions = {
+            hook_id: (repo_idx + 1 if repo_idx >= at else repo_idx, hook_idx)
+            for hook_id, (repo_idx, hook_idx) in self._positions.items()
+        }
+        self._index_repo(repo, at)
+
+    def insert_hook(
+        self, hook: HookDefinition | Hook, *, repo_idx: int, at: int
+    ) -> None:
+        """Insert a hook into an existing repo, before the hook currently at `at`.
+
+        Raises:
+            DuplicatedHookNameError: If the hook is already indexed.
+        """
+        if hook.id is not None and hook.id in self._positions:
+            msg = f"Hook name '{hook.id}' is duplicated"
+            raise DuplicatedHookNameError(msg)
+
+        repo = self._model.repos[repo_idx]
+        repo.hooks = [*(repo.hooks or [])[:at], hook, *(repo.hooks or [])[at:]]
+        self._names = None
+        for hook_idx, other in enumerate(repo.hooks[at:], start=at):
+            if other.id is not None:
+                self._positions[other.id] = (repo_idx, hook_idx)
+
+    def remove_repo(self, repo_idx: int) -> None:
+        """Remove the repo at the given index, along with all its hooks."""
+        self._model.repos.pop(repo_idx)
+        self._names = None
+        self._positions = {
+            hook_id: (idx - 1 if idx > repo_idx else idx, hook_idx)
+            for hook_id, (idx, hook_idx) in self._positions.items()
+            if idx != repo_idx
+        }
+
+    def remove_hook(self, hook_id: str) -> None:
+        """Remove a hook, and its repo too if no other hooks are left in it.
+
+        Raises:
+            KeyError: If the hook isn't in the configuration.
+        """
+        repo_idx, hook_idx = self._positions[hook_id]
+        repo = self._model.repos[repo_idx]
+        assert repo.hooks is not None
+
+        if len(repo.hooks) == 1:
+            self.remove_repo(repo_idx)
+            return
+
+        repo.hooks = [hook for idx, hook in enumerate(repo.hooks) if idx != hook_idx]
+        del self._positions[hook_id]
+        self._names = None
+        for other_idx, hook in enumerate(repo.hooks[hook_idx:], start=hook_idx):
+            if hook.id is not None:
+                self._positions[hook.id] = (repo_idx, other_idx)
+
+    def _index_repo(self, repo: LocalRepo | UriRepo | MetaRepo, repo_idx: int) -> None:
+        for hook_idx, hook in enumerate(repo.hooks or []):
+            if hook.id is None:
+                continue
+
+            if hook.id in self._positions:
+                msg = f"Hook name '{hook.id}' is duplicated"
+                raise DuplicatedHookNameError(msg)
+
+            self._positions[hook.id] = (repo_idx, hook_idx)
@@ -1,12 +1,15 @@
 from collections.abc import Generator
 from contextlib import contextmanager
 from dataclasses import dataclass
-from pathlib import Path
+from functools import cached_property
 
 from pydantic import ValidationError
 from ruamel.yaml.comments import CommentedMap
 
+from usethis._config import usethis_config
 from usethis._console import tick_print
+from usethis._files import exists, write_text
+from usethis._integrations.pre_commit.index import HookIndex
 from usethis._integrations.pre_commit.schema import JsonSchemaForPreCommitConfigYaml
 from usethis._integrations.yaml.io_ import YAMLLiteral, edit_yaml
 
@@ -27,16 +30,25 @@ class PreCommitConfigYAMLDocument:
     content: CommentedMap
     model: JsonSchemaForPreCommitConfigYaml
 
+    @cached_property
+    def index(self) -> HookIndex:
+        """An index of the hooks in the model, built when first needed.
+
+        Changes to the repos in the model should be made through the index, to keep
+        it consistent.
+        """
+        return HookIndex(self.model)
+
 
 @contextmanager
 def edit_pre_commit_config_yaml() -> Generator[PreCommitConfigYAMLDocument, None, None]:
     """A context manager to modify '.pre-commit-config.yaml' in-place."""
     name = ".pre-commit-config.yaml"
-    path = Path.cwd() / name
+    path = usethis_config.cpd() / name
 
-    if not path.exists():
+    if not exists(path):
         tick_print(f"Writing '{name}'.")
-        path.write_text("repos: []\n", encoding="utf-8")
+        write_text(path, "repos: []\n")
         guess_indent = False
     else:
         guess_indent = True
@@ -0,0 +1,55 @@
+from pydantic import BaseModel, Field, ValidationError
+
+from usethis._integrations.pre_commit.errors import InvalidPreCommitSettingsError
+from usethis._integrations.pre_commit.schema import Stages
+from usethis._integrations.pyproject.core import get_config_value
+
+
+class PreCommitSettings(
+    BaseModel,
+    frozen=True,
+    extra="forbid",
+    alias_generator=lambda name: name.replace("_", "-"),
+):
+    """The usethis settings for pre-commit, at 'tool.usethis.pre-commit'.
+
+    The settings only affect hooks as they're added; existing hooks are left as they
+    are.
+
+    Attributes:
+        changed_files_only: Whether hooks added by usethis only run on the changed files
+                            of the relevant types, rather than always checking the
+                            whole repository. The whole repository is still checked by
+                            'pre-commit run --all-files', e.g. in CI.
+        direct_venv: Whether local hooks run tools from the project's virtual
+                     environment directly, rather than starting uv each time with
+                     'uv run'. This relies on a POSIX shell, and falls back to 'uv run'
+                     if the tool isn't in '.venv'. The environment isn't synced first.
+        stages: The stages to run hooks at, by hook ID, e.g. `deptry = ["pre-push"]` to
+                check the dependencies when pushing rather than on every commit. The
+                Git hooks for these stages are installed along with pre-commit's.
+    """
+
+    changed_files_only: bool = False
+    direct_venv: bool = False
+    stages: dict[str, Stages] = Field(default_factory=dict)
+
+
+def get_pre_commit_settings() -> PreCommitSettings:
+    """Get the usethis settings for pre-commit from 'pyproject.toml'.
+
+    Raises:
+        InvalidPreCommitSettingsError: If the settings are invalid.
+    """
+    try:
+        settings = get_config_value(["tool", "usethis", "pre-commit"])
+    except (FileNotFoundError, KeyError):
+        settings = {}
+
+    try:
+        return PreCommitSettings.model_validate(settings)
+    except ValidationError as err:
+        msg = (
+            f"Invalid settings at 'tool.usethis.pre-commit' in 'pyproject.toml':\n{err}"
+        )
+        raise InvalidPreCommitSettingsError(msg) from None
@@ -5,6 +5,8 @@ from tomlkit.api import dumps, parse
 from tomlkit.exceptions import TOMLKitError
 from tomlkit.toml_document import TOMLDocument
 
+from usethis._config import usethis_config
+from usethis._files import get_generation, read_text, write_text
 from usethis._integrations.pyproject.errors import (
     PyProjectTOMLDecodeError,
     PyProjectTOMLNotFoundError,
@@ -12,13 +14,17 @@ from usethis._integrations.pyproject.errors import (
 
 
 def read_pyproject_toml() -> TOMLDocument:
-    return read_pyproject_toml_from_path(Path.cwd() / "pyproject.toml")
+    return read_pyproject_toml_from_path(usethis_config.cpd() / "pyproject.toml")
 
 
-@cache
 def read_pyproject_toml_from_path(path: Path) -> TOMLDocument:
+    return _read_pyproject_toml_cached(path, generation=get_generation())
+
+
+@cache
+def _read_pyproject_toml_cached(path: Path, *, generation: int) -> TOMLDocument:
     try:
-        return parse(path.read_text())
+        return parse(read_text(path))
     except FileNotFoundError:
         msg = "'pyproject.toml' not found in the current directory."
         raise PyProjectTOMLNotFoundError(msg)
@@ -27,6 +33,11 @@ def read_pyproject_toml_from_path(path: Path) -> TOMLDocument:
         raise PyProjectTOMLDecodeError(msg) from None
 
 
+def clear_pyproject_toml_cache() -> None:
+    """Forget any cached contents, e.g. after a subprocess may have modified the file."""
+    _read_pyproject_toml_cached.cache_clear()
+
+
 def write_pyproject_toml(toml_document: TOMLDocument) -> None:
-    read_pyproject_toml_from_path.cache_clear()
-    (Path.cwd() / "pyproject.toml").write_text(dumps(toml_document))
+    clear_pyproject_toml_cache()
+    write_text(usethis_config.cpd() / "pyproject.toml", dumps(toml_document))
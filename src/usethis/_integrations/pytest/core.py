@@ -1,37 +1,36 @@
-import shutil
-from pathlib import Path
-
+from usethis._config import usethis_config
 from usethis._console import box_print, tick_print
+from usethis._files import exists, is_dir, iterdir, mkdir, rmtree, write_text
 
 
 def add_pytest_dir() -> None:
-    tests_dir = Path.cwd() / "tests"
+    tests_dir = usethis_config.cpd() / "tests"
 
-    if not tests_dir.exists():
+    if not is_dir(tests_dir):
         tick_print("Creating '/tests'.")
-        tests_dir.mkdir()
+        mkdir(tests_dir)
 
-    if (tests_dir / "conftest.py").exists():
+    if exists(tests_dir / "conftest.py"):
         # Early exit; conftest.py already exists
         return
 
     tick_print("Writing '/tests/conftest.py'.")
-    (tests_dir / "conftest.py").write_text(
-        "collect_ignore_glob = []\npytest_plugins = []\n"
+    write_text(
+        tests_dir / "conftest.py", "collect_ignore_glob = []\npytest_plugins = []\n"
     )
 
 
 def remove_pytest_dir() -> None:
-    tests_dir = Path.cwd() / "tests"
+    tests_dir = usethis_config.cpd() / "tests"
 
-    if not tests_dir.exists():
+    if not is_dir(tests_dir):
         # Early exit; tests directory does not exist
         return
 
-    if set(tests_dir.iterdir()) <= {tests_dir / "conftest.py"}:
+    if set(iterdir(tests_dir)) <= {tests_dir.resolve() / "conftest.py"}:
         # The only file in the directory is conftest.py
         tick_print("Removing '/tests'.")
-        shutil.rmtree(tests_dir)
+        rmtree(tests_dir)
     else:
         box_print("Reconfigure the '/tests' directory to run without pytest.")
         # Note we don't actually remove the directory, just explain what needs to be done.
@@ -0,0 +1,102 @@
+from collections.abc import Iterable
+from pathlib import Path
+from xml.etree import ElementTree
+
+from usethis._config import usethis_config
+from usethis._files import exists, is_dir, iterdir, read_text
+
+
+def get_test_file_durations(paths: Iterable[str]) -> dict[str, float]:
+    """Get the total duration of the tests in each test file from JUnit XML reports.
+
+    The test files are given as POSIX paths relative to the project directory, e.g.
+    'tests/test_foo.py'. Test cases which can't be traced back to a test file which
+    still exists are ignored, as are reports which can't be parsed.
+
+    Args:
+        paths: The paths to the JUnit XML reports relative to the project directory,
+               e.g. as written by pytest's `--junitxml` option. A directory stands for
+               all the '.xml' files within it. Paths which don't exist are ignored.
+
+    Returns:
+        The summed duration in seconds of the test cases in each test file.
+    """
+    durations: dict[str, float] = {}
+    file_by_classname: dict[str, str | None] = {}
+    for report in _get_reports(paths):
+        try:
+            root = ElementTree.fromstring(read_text(Path(report)))
+        except ElementTree.ParseError:
+            continue
+
+        for testcase in root.iter("testcase"):
+            try:
+                time = float(testcase.get("time", 0))
+            except ValueError:
+                continue
+
+            file = testcase.get("file")
+            if file is None:
+                classname = testcase.get("classname", "")
+                if classname not in file_by_classname:
+                    file_by_classname[classname] = _get_file_from_classname(classname)
+                file = file_by_classname[classname]
+            elif exists(Path(file)):
+                file = Path(file).as_posix()
+            else:
+                file = None
+
+            if file is not None:
+                durations[file] = durations.get(file, 0.0) + time
+
+    return durations
+
+
+def get_test_files() -> list[str]:
+    """Get the test files in the '/tests' directory which pytest will collect.
+
+    Returns:
+        The sorted POSIX paths of the test files relative to the project directory.
+    """
+    return sorted(
+        file
+        for file in _get_files_within(Path("tests"))
+        if Path(file).match("test_*.py") or Path(file).match("*_test.py")
+    )
+
+
+def _get_reports(paths: Iterable[str]) -> list[str]:
+    reports: list[str] = []
+    for path in paths:
+        if is_dir(Path(path)):
+            reports.extend(
+                file for file in _get_files_within(Path(path)) if file.endswith(".xml")
+            )
+        elif exists(Path(path)):
+            reports.append(Path(path).as_posix())
+    return sorted(dict.fromkeys(reports))
+
+
+def _get_files_within(path: Path) -> list[str]:
+    if not is_dir(path):
+        return []
+
+    root = usethis_config.cpd().resolve()
+    files: list[str] = []
+    for child in iterdir(path):
+        if is_dir(child):
+            files.extend(_get_files_within(child))
+        else:
+            files.append(child.relative_to(root).as_posix())
+    return files
+
+
+def _get_file_from_classname(classname: str) -> str | None:
+    # pytest gives the classname as the dotted path to the test file, followed by the
+    # names of any classes the test is nested in, e.g. 'tests.test_foo.TestBar'.
+    parts = classname.split(".")
+    for idx in range(len(parts), 0, -1):
+        file = "/".join(parts[:idx]) + ".py"
+        if exists(Path(file)):
+            return file
+    return None
@@ -0,0 +1,29 @@
+import heapq
+
+
+def get_balanced_shards(durations: dict[str, float], *, shards: int) -> list[list[str]]:
+    """Split test files into shards which take about as long as each other to run.
+
+    This is the greedy longest-processing-time partition: the test files are taken
+    from slowest to fastest, and each goes into whichever shard is quickest so far. The
+    slowest shard is then at most 4/3 as slow as it would be with the best partition.
+
+    Args:
+        durations: The duration of each test file, in seconds.
+        shards: The number of shards.
+
+    Returns:
+        The sorted test files in each shard. Some shards are empty if there are fewer
+        test files than shards.
+    """
+    heap = [(0.0, idx) for idx in range(shards)]
+    files_by_shard: list[list[str]] = [[] for _ in range(shards)]
+    # Ties are broken by name, so the shards are stable when timings are equal.
+    for file, duration in sorted(
+        durations.items(), key=lambda item: (-item[1], item[0])
+    ):
+        total, idx = heapq.heappop(heap)
+        files_by_shard[idx].append(file)
+        heapq.heappush(heap, (total + duration, idx))
+
+    return [sorted(files) for files in files_by_shard]
@@ -1,9 +1,10 @@
 import re
-from pathlib import Path
 from sysconfig import get_python_version
 
 from pydantic import TypeAdapter
 
+from usethis._config import usethis_config
+from usethis._files import exists, read_text
 from usethis._integrations.pyproject.core import get_config_value
 from usethis._integrations.sonarqube.errors import (
     CoverageReportConfigNotFoundError,
@@ -18,12 +19,14 @@ class _NonstandardPythonVersionError(Exception):
 
 def get_sonar_project_properties() -> str:
     """Get contents for (or from) the sonar-project.properties file."""
-    path = Path.cwd() / "sonar-project.properties"
-    if path.exists() and path.is_file():
-        return path.read_text(encoding="utf-8")
+    path = usethis_config.cpd() / "sonar-project.properties"
+    if exists(path):
+        return read_text(path)
 
     try:
-        python_version = _get_short_version(Path(".python-version").read_text().strip())
+        python_version = _get_short_version(
+            read_text(usethis_config.cpd() / ".python-version").strip()
+        )
     except (FileNotFoundError, _NonstandardPythonVersionError):
         python_version = get_python_version()
 
@@ -1,16 +1,61 @@
+from collections.abc import Generator
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from contextvars import ContextVar
+
 from usethis._config import usethis_config
-from usethis._integrations.pyproject.io_ import read_pyproject_toml_from_path
-from usethis._integrations.uv.errors import UVSubprocessFailedError
+from usethis._files import has_staged_files, is_on_disk
+from usethis._integrations.pyproject.io_ import clear_pyproject_toml_cache
+from usethis._integrations.uv.errors import UVDryRunError, UVSubprocessFailedError
 from usethis._subprocess import SubprocessFailedError, call_subprocess
 
+# Commands which don't modify the project. These still run during a dry run, e.g.
+# `uv python list` to find the supported Python versions for the CI test steps, since
+# the preview would otherwise show a different test matrix from a real run.
+_READ_ONLY_ARGS = [["python", "list"], ["tree"], ["version"]]
+
+_uv_limiter: ContextVar[AbstractContextManager | None] = ContextVar(
+    "usethis_uv_limiter", default=None
+)
+
+
+@contextmanager
+def limit_uv_concurrency(
+    limiter: AbstractContextManager | None,
+) -> Generator[None, None, None]:
+    """Hold a limiter, e.g. a semaphore shared between processes, around uv calls.
+
+    The limit applies in the current context only. Passing None removes the limit.
+    """
+    token = _uv_limiter.set(limiter)
+    try:
+        yield
+    finally:
+        _uv_limiter.reset(token)
+
 
 def call_uv_subprocess(args: list[str]) -> str:
     """Run a subprocess using the uv command-line tool.
 
     Raises:
         UVSubprocessFailedError: If the subprocess fails.
+        UVDryRunError: If the command would modify the project during a dry run, when
+                       the project is held in memory, or while file changes are
+                       staged.
     """
-    read_pyproject_toml_from_path.cache_clear()
+    is_read_only = any(args[: len(ro_args)] == ro_args for ro_args in _READ_ONLY_ARGS)
+    if usethis_config.dry_run and not is_read_only:
+        msg = f"Cannot run 'uv {args[0]}' during a dry run."
+        raise UVDryRunError(msg)
+    if not is_on_disk() and not is_read_only:
+        msg = f"Cannot run 'uv {args[0]}' for a project which is held in memory."
+        raise UVDryRunError(msg)
+    if has_staged_files() and not is_read_only:
+        # uv works with the files on disk, which won't be up-to-date until the staged
+        # changes are all committed together.
+        msg = f"Cannot run 'uv {args[0]}' while file changes are staged."
+        raise UVDryRunError(msg)
+
+    clear_pyproject_toml_cache()
     new_args = ["uv", *args]
     if usethis_config.frozen and args[0] in {
         "run",
@@ -23,6 +68,7 @@ def call_uv_subprocess(args: list[str]) -> str:
     }:
         new_args.append("--frozen")
     try:
-        return call_subprocess(new_args)
+        with _uv_limiter.get() or nullcontext():
+            return call_subprocess(new_args, cwd=usethis_config.cpd())
     except SubprocessFailedError as err:
         raise UVSubprocessFailedError(err) from None
@@ -1,11 +1,18 @@
+from collections.abc import Generator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Literal
+
 from packaging.requirements import Requirement
 from pydantic import BaseModel, TypeAdapter
 
 from usethis._config import usethis_config
 from usethis._console import tick_print
+from usethis._files import is_on_disk
 from usethis._integrations.pyproject.core import (
     append_config_list,
     get_config_value,
+    remove_from_config_list,
 )
 from usethis._integrations.pyproject.io_ import (
     read_pyproject_toml,
@@ -26,7 +33,83 @@ class Dependency(BaseModel):
         return hash((self.__class__.__name__, self.name, self.extras))
 
 
+class _DeferredDepChanges(BaseModel):
+    """Dependency changes which have been requested but not yet applied via uv.
+
+    Attributes:
+        to_add: The dependencies to add, by group.
+        to_remove: The dependencies to remove, by group.
+    """
+
+    to_add: dict[str, list[Dependency]] = {}
+    to_remove: dict[str, list[Dependency]] = {}
+
+
+_deferred: ContextVar[_DeferredDepChanges | None] = ContextVar(
+    "usethis_deferred_dep_changes", default=None
+)
+
+
+@contextmanager
+def defer_dep_changes() -> Generator[None, None, None]:
+    """Gather dependency changes and apply them together on exit.
+
+    Within the context, adding or removing dependencies is recorded rather than being
+    applied immediately, although the outcome is visible to the functions in this
+    module. On exit, the changes are applied with a single uv call per group, which
+    means one resolution rather than one per dependency. If an error is raised within
+    the context, the pending changes are discarded.
+    """
+    if _deferred.get() is not None:
+        # Already deferring; the outermost context will apply the changes.
+        yield
+        return
+
+    token = _deferred.set(_DeferredDepChanges())
+    try:
+        yield
+        apply_deferred_dep_changes()
+    finally:
+        _deferred.reset(token)
+
+
+def apply_deferred_dep_changes() -> None:
+    """Apply any dependency changes which are pending because they were deferred.
+
+    This is useful when a subprocess needs to see an up-to-date environment partway
+    through a deferral context. If nothing has been deferred, this has no effect.
+    """
+    deferred = _deferred.get()
+    if deferred is None:
+        return
+
+    to_remove, to_add = deferred.to_remove, deferred.to_add
+    deferred.to_remove, deferred.to_add = {}, {}
+
+    for group, deps in to_remove.items():
+        _change_deps("remove", deps, group=group)
+    for group, deps in to_add.items():
+        _change_deps("add", deps, group=group)
+
+
 def get_dep_groups() -> dict[str, list[Dependency]]:
+    deps_by_group = _read_dep_groups()
+
+    deferred = _deferred.get()
+    if deferred is not None:
+        for group, deps in deferred.to_remove.items():
+            if group in deps_by_group:
+                names = {dep.name for dep in deps}
+                deps_by_group[group] = [
+                    dep for dep in deps_by_group[group] if dep.name not in names
+                ]
+        for group, deps in deferred.to_add.items():
+            deps_by_group[group] = deps_by_group.get(group, []) + deps
+
+    return deps_by_group
+
+
+def _read_dep_groups() -> dict[str, list[Dependency]]:
     pyproject = read_pyproject_toml()
     try:
         dep_groups_section = pyproject["dependency-groups"]
@@ -109,17 +192,12 @@ def add_deps_to_group(deps: list[Dependency], group: str) -> None:
 
     register_default_group(group)  # Register the group before adding dependencies
 
-    for dep in to_add_deps:
-        try:
-            if not usethis_config.offline:
-                call_uv_subprocess(["add", "--group", group, "--quiet", str(dep)])
-            else:
-                call_uv_subprocess(
-                    ["add", "--group", group, "--quiet", "--offline", str(dep)]
-                )
-        except UVSubprocessFailedError as err:
-            msg = f"Failed to add '{dep}' to the '{group}' dependency group:\n{err}"
-            raise UVDepGroupError(msg) from None
+    deferred = _deferred.get()
+    if deferred is not None:
+        deferred.to_add.setdefault(group, []).extend(to_add_deps)
+        return
+
+    _change_deps("add", to_add_deps, group=group)
 
 
 def is_dep_satisfied_in(dep: Dependency, *, in_: list[Dependency]) -> bool:
@@ -146,19 +224,75 @@ def remove_deps_from_group(deps: list[Dependency], group: str) -> None:
         f"Removing dependenc{ies} {deps_str} from the '{group}' group in 'pyproject.toml'."
     )
 
-    for dep in _deps:
-        try:
-            if not usethis_config.offline:
-                call_uv_subprocess(["remove", "--group", group, "--quiet", str(dep)])
-            else:
-                call_uv_subprocess(
-                    ["remove", "--group", group, "--quiet", "--offline", str(dep)]
-                )
-        except UVSubprocessFailedError as err:
+    deferred = _deferred.get()
+    if deferred is not None:
+        # Dependencies which haven't been added yet can simply be forgotten.
+        names = {dep.name for dep in _deps}
+        pending = deferred.to_add.get(group, [])
+        deferred.to_add[group] = [dep for dep in pending if dep.name not in names]
+        on_disk_names = {dep.name for dep in _read_dep_groups().get(group, [])}
+        deferred.to_remove.setdefault(group, []).extend(
+            dep for dep in _deps if dep.name in on_disk_names
+        )
+        return
+
+    _change_deps("remove", _deps, group=group)
+
+
+def _change_deps(
+    subcommand: Literal["add", "remove"], deps: list[Dependency], *, group: str
+) -> None:
+    if usethis_config.dry_run or not is_on_disk():
+        # uv can't be run, so write the declarations directly to show what would change.
+        _write_deps_to_pyproject(subcommand, deps, group=group)
+    else:
+        _call_uv_deps_subprocess(subcommand, deps, group=group)
+
+
+def _write_deps_to_pyproject(
+    subcommand: Literal["add", "remove"], deps: list[Dependency], *, group: str
+) -> None:
+    if not deps:
+        return
+
+    id_keys = ["dependency-groups", group]
+    if subcommand == "add":
+        append_config_list(id_keys, [str(dep) for dep in deps])
+        return
+
+    try:
+        req_strs = TypeAdapter(list[str]).validate_python(get_config_value(id_keys))
+    except KeyError:
+        return
+    names = {dep.name for dep in deps}
+    remove_from_config_list(
+        id_keys,
+        [req_str for req_str in req_strs if Requirement(req_str).name in names],
+    )
+
+
+def _call_uv_deps_subprocess(
+    subcommand: Literal["add", "remove"], deps: list[Dependency], *, group: str
+) -> None:
+    if not deps:
+        return
+
+    args = [subcommand, "--group", group, "--quiet"]
+    if usethis_config.offline:
+        args.append("--offline")
+
+    try:
+        call_uv_subprocess([*args, *[str(dep) for dep in deps]])
+    except UVSubprocessFailedError as err:
+        deps_str = ", ".join([f"'{dep}'" for dep in deps])
+        if subcommand == "add":
+            msg = f"Failed to add {deps_str} to the '{group}' dependency group:\n{err}"
+        else:
             msg = (
-                f"Failed to remove '{dep}' from the '{group}' dependency group:\n{err}"
+                f"Failed to remove {deps_str} from the '{group}' dependency group:"
+                f"\n{err}"
             )
-            raise UVDepGroupError(msg) from None
+        raise UVDepGroupError(msg) from None
 
 
 def is_dep_in_any_group(dep: Dependency) -> bool:
@@ -15,3 +15,11 @@ class UVSubprocessFailedError(UVError):
 
 class UVUnparsedPythonVersionError(UVError):
     """Raised when a Python version string cannot be parsed."""
+
+
+class UVDryRunError(UVError):
+    """Raised when uv would need to modify a project which can't be modified by uv.
+
+    This happens during a dry run, when the project is held in memory, or while file
+    changes are staged and so haven't been written for uv to see.
+    """
@@ -0,0 +1,72 @@
+from collections.abc import Generator
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from pydantic import BaseModel
+
+from usethis._config import usethis_config
+from usethis._console import tick_print
+from usethis._files import exists
+from usethis._integrations.uv.call import call_uv_subprocess
+from usethis._integrations.uv.deps import apply_deferred_dep_changes
+
+
+class _DeferredExport(BaseModel):
+    """Whether 'requirements.txt' was requested to be written while it was deferred."""
+
+    is_pending: bool = False
+
+
+_deferred_export: ContextVar[_DeferredExport | None] = ContextVar(
+    "usethis_deferred_requirements_txt_export", default=None
+)
+
+
+@contextmanager
+def defer_requirements_txt_export() -> Generator[None, None, None]:
+    """Write 'requirements.txt' at most once, on exit, rather than on every request.
+
+    This allows the file to be exported once the other changes are on disk, e.g. after
+    staged files are committed and deferred dependency changes are applied. If an error
+    is raised within the context, the file is not written.
+    """
+    if _deferred_export.get() is not None:
+        # Already deferring; the outermost context will write the file.
+        yield
+        return
+
+    deferred = _DeferredExport()
+    token = _deferred_export.set(deferred)
+    try:
+        yield
+    finally:
+        _deferred_export.reset(token)
+
+    if deferred.is_pending:
+        export_requirements_txt()
+
+
+def export_requirements_txt() -> None:
+    """Write 'requirements.txt' using `uv export`, creating the lockfile if necessary."""
+    deferred = _deferred_export.get()
+    if deferred is not None:
+        deferred.is_pending = True
+        return
+
+    # The lockfile and export need to reflect any dependencies added so far.
+    apply_deferred_dep_changes()
+
+    # N.B. this is where a task runner would come in handy, to reduce duplication.
+    if not exists(usethis_config.cpd() / "uv.lock"):
+        tick_print("Writing 'uv.lock'.")
+        call_uv_subprocess(["lock"])
+
+    tick_print("Writing 'requirements.txt'.")
+    call_uv_subprocess(
+        [
+            "export",
+            "--frozen",
+            "--no-dev",
+            "--output-file=requirements.txt",
+        ]
+    )
@@ -1,33 +1,96 @@
+import re
 from pathlib import Path
+from tempfile import TemporaryDirectory
 
+from usethis._config import usethis_config
 from usethis._console import tick_print
+from usethis._files import (
+    exists,
+    is_on_disk,
+    read_text,
+    without_staged_files,
+    write_text,
+)
 from usethis._integrations.pyproject.errors import PyProjectTOMLInitError
 from usethis._integrations.uv.call import call_uv_subprocess
 from usethis._integrations.uv.errors import UVSubprocessFailedError
 
 
 def ensure_pyproject_toml() -> None:
-    """Create a pyproject.toml file using `uv init`."""
-    if (Path.cwd() / "pyproject.toml").exists():
-        return
+    """Create a pyproject.toml file using `uv init`.
 
-    is_hello_py = (Path.cwd() / "hello.py").exists()
+    `uv init` runs in a temporary directory and the file it writes is copied into the
+    project, so that the file can be staged along with any other changes. uv can't be
+    run during a dry run or when the project is held in memory, so a minimal equivalent
+    of the file `uv init` would write is used instead.
+    """
+    path = usethis_config.cpd() / "pyproject.toml"
+    if exists(path):
+        return
 
     tick_print("Writing 'pyproject.toml'.")
-    try:
-        call_uv_subprocess(
-            [
-                "init",
-                "--no-pin-python",
-                "--no-readme",
-                "--vcs=none",
-                "--author-from=auto",
-            ]
-        )
-    except UVSubprocessFailedError as err:
-        msg = f"Failed to create a pyproject.toml file:\n{err}"
-        raise PyProjectTOMLInitError(msg) from None
-
-    if not is_hello_py:
-        # Delete the generated 'hello.py' file
-        Path.unlink(Path.cwd() / "hello.py")
+    if usethis_config.dry_run or not is_on_disk():
+        write_text(path, _get_minimal_pyproject_toml())
+    else:
+        write_text(path, _get_uv_init_pyproject_toml())
+
+
+def _get_uv_init_pyproject_toml() -> str:
+    with TemporaryDirectory() as tmp_dir:
+        # The project name comes from the directory name, and uv still runs from the
+        # project directory, e.g. to respect its '.python-version' file.
+        tmp_path = Path(tmp_dir) / usethis_config.cpd().name
+        try:
+            with without_staged_files():
+                call_uv_subprocess(
+                    [
+                        "init",
+                        tmp_path.as_posix(),
+                        "--no-pin-python",
+                        "--no-readme",
+                        "--vcs=none",
+                        "--author-from=auto",
+                    ]
+                )
+        except UVSubprocessFailedError as err:
+            msg = f"Failed to create a pyproject.toml file:\n{err}"
+            raise PyProjectTOMLInitError(msg) from None
+
+        return (tmp_path / "pyproject.toml").read_text()
+
+
+def _get_minimal_pyproject_toml() -> str:
+    name = re.sub(r"[^a-z0-9]+", "-", usethis_config.cpd().name.lower()).strip("-")
+    requires_python = _get_python_version_pin()
+    requires_python_line = (
+        f'requires-python = ">={requires_python}"\n'
+        if requires_python is not None
+        else ""
+    )
+    return f"""\
+[project]
+name = "{name or "project"}"
+version = "0.1.0"
+description = "Add your description here"
+{requires_python_line}dependencies = []
+"""
+
+
+def _get_python_version_pin() -> str | None:
+    # Like uv, use the nearest '.python-version' file. Otherwise, uv would use the
+    # version of whichever interpreter it finds, which can't be known without it.
+    for dir_ in [usethis_config.cpd(), *usethis_config.cpd().parents]:
+        path = dir_ / ".python-version"
+        if exists(path):
+            break
+    else:
+        return None
+
+    versions = [
+        line.strip()
+        for line in read_text(path).splitlines()
+        if line.strip() and not line.strip().startswith("#")
+    ]
+    if versions and re.fullmatch(r"3\.\d+(\.\d+)?", versions[0]):
+        return versions[0]
+    return None
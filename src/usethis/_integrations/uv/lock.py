@@ -0,0 +1,30 @@
+from pydantic import TypeAdapter, ValidationError
+from tomlkit.api import parse
+from tomlkit.exceptions import TOMLKitError
+
+from usethis._config import usethis_config
+from usethis._files import exists, read_text
+
+
+def get_locked_version(name: str) -> str | None:
+    """Get the version of a package which is pinned in the 'uv.lock' file.
+
+    Returns:
+        The version, or None if there is no lockfile, the package isn't in it, or the
+        lockfile can't be parsed.
+    """
+    path = usethis_config.cpd() / "uv.lock"
+    if not exists(path):
+        return None
+
+    try:
+        packages = TypeAdapter(list[dict]).validate_python(
+            parse(read_text(path)).get("package", [])
+        )
+    except (TOMLKitError, ValidationError):
+        return None
+
+    for package in packages:
+        if package.get("name") == name and isinstance(package.get("version"), str):
+            return package["version"]
+    return None
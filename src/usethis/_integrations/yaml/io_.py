@@ -1,6 +1,7 @@
 from collections.abc import Generator
 from contextlib import contextmanager
 from dataclasses import dataclass
+from io import StringIO
 from pathlib import Path
 from types import NoneType
 from typing import TypeAlias
@@ -30,6 +31,7 @@ from ruamel.yaml.scalarstring import (
 from ruamel.yaml.timestamp import TimeStamp
 from ruamel.yaml.util import load_yaml_guess_indent
 
+from usethis._files import read_text, write_text
 from usethis._integrations.yaml.errors import InvalidYAMLError
 
 YAMLLiteral: TypeAlias = (
@@ -74,14 +76,14 @@ def edit_yaml(
     guess_indent: bool = True,
 ) -> Generator[YAMLDocument, None, None]:
     """A context manager to modify a YAML file in-place, with managed read and write."""
-    with yaml_path.open(mode="r") as f:
-        # Can't preserve quotes so don't keep the content.
-        # Yes, it' not very efficient to load the content twice.
-        try:
-            content, sequence_ind, offset_ind = load_yaml_guess_indent(f)
-        except YAMLError as err:
-            msg = f"Error reading '{yaml_path}':\n{err}"
-            raise InvalidYAMLError(msg) from None
+    # Can't preserve quotes so don't keep the content.
+    # Yes, it' not very efficient to load the content twice.
+    original = read_text(yaml_path)
+    try:
+        content, sequence_ind, offset_ind = load_yaml_guess_indent(original)
+    except YAMLError as err:
+        msg = f"Error reading '{yaml_path}':\n{err}"
+        raise InvalidYAMLError(msg) from None
     if not guess_indent:
         sequence_ind = None
         offset_ind = None
@@ -98,4 +100,7 @@ def edit_yaml(
     yaml_document = YAMLDocument(content=content)
     yield yaml_document
 
-    yaml.dump(yaml_document.content, yaml_path)
+    stream = StringIO()
+    yaml.dump(yaml_document.content, stream)
+    if stream.getvalue() != original:
+        write_text(yaml_path, stream.getvalue())
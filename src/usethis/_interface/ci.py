@@ -15,12 +15,19 @@ def bitbucket(
     remove: bool = typer.Option(
         False, "--remove", help="Remove Bitbucket pipelines CI instead of adding it."
     ),
+    shards: int | None = typer.Option(
+        None,
+        "--shards",
+        min=1,
+        help="Split the tests for each Python version across this many parallel "
+        "steps, balanced using the test timings in the JUnit reports.",
+    ),
     offline: bool = offline_opt,
     quiet: bool = quiet_opt,
 ) -> None:
     try:
         with usethis_config.set(offline=offline, quiet=quiet):
-            use_ci_bitbucket(remove=remove)
+            use_ci_bitbucket(remove=remove, shards=shards)
     except UsethisError as err:
         err_print(err)
 
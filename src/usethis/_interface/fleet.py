@@ -0,0 +1,95 @@
+import sys
+import time
+from functools import partial
+from pathlib import Path
+
+import typer
+
+import usethis._interface.ci
+import usethis._interface.tool
+from usethis._config import quiet_opt, usethis_config
+from usethis._console import err_print, info_print, plain_print, tick_print
+from usethis._core.fleet import FleetResult, run_fleet
+
+# The commands which can be run across a fleet.
+_commands = typer.Typer()
+_commands.add_typer(usethis._interface.ci.app, name="ci")
+_commands.add_typer(usethis._interface.tool.app, name="tool")
+
+
+def fleet(  # noqa: PLR0913
+    command: list[str] = typer.Argument(
+        ..., help="The usethis command to run, e.g. 'tool ruff'."
+    ),
+    repos: list[Path] = typer.Option(
+        [], "--repo", help="The root directory of a project. Can be given repeatedly."
+    ),
+    repos_file: Path | None = typer.Option(
+        None,
+        "--repos-file",
+        help="A file listing the root directories of projects, one per line.",
+    ),
+    jobs: int | None = typer.Option(
+        None, "--jobs", help="The number of worker processes. Defaults to the CPUs."
+    ),
+    uv_jobs: int = typer.Option(
+        4,
+        "--uv-jobs",
+        min=1,
+        help="The maximum number of uv subprocesses running at once.",
+    ),
+    quiet: bool = quiet_opt,
+) -> None:
+    paths = list(repos)
+    if repos_file is not None:
+        lines = repos_file.read_text(encoding="utf-8").splitlines()
+        paths += [Path(line.strip()) for line in lines if line.strip()]
+    paths = [path.resolve() for path in dict.fromkeys(paths)]
+
+    with usethis_config.set(quiet=quiet):
+        if not paths:
+            err_print("No projects were given; use '--repo' or '--repos-file'.")
+            sys.exit(1)
+
+        start = time.perf_counter()
+        results = []
+        for result in run_fleet(
+            paths,
+            partial(_run_command, command),
+            jobs=jobs,
+            uv_jobs=uv_jobs,
+            warm_modules=[__name__],
+        ):
+            _print_result(result)
+            results.append(result)
+
+        _print_summary(results, elapsed=time.perf_counter() - start)
+
+    if not all(result.success for result in results):
+        sys.exit(1)
+
+
+def _run_command(command: list[str]) -> None:
+    typer.main.get_command(_commands).main(
+        command, prog_name="usethis", standalone_mode=False
+    )
+
+
+def _print_result(result: FleetResult) -> None:
+    if result.success:
+        tick_print(f"'{result.path}' ({result.duration:.2f}s)")
+    else:
+        err_print(f"'{result.path}' ({result.duration:.2f}s)")
+        if result.output:
+            plain_print(result.output.rstrip("\n"))
+
+
+def _print_summary(results: list[FleetResult], *, elapsed: float) -> None:
+    n_failed = sum(not result.success for result in results)
+    total = sum(result.duration for result in results)
+    slowest = max(results, key=lambda result: result.duration)
+    info_print(
+        f"{len(results) - n_failed} succeeded, {n_failed} failed in {elapsed:.2f}s "
+        f"({total:.2f}s across projects; slowest was '{slowest.path}' at "
+        f"{slowest.duration:.2f}s)."
+    )
@@ -0,0 +1,18 @@
+import typer
+
+from usethis._config import offline_opt, quiet_opt, usethis_config
+from usethis._core.pre_commit import update_pre_commit_revs
+
+app = typer.Typer(help="Manage the pre-commit configuration.")
+
+
+@app.command(
+    name="update-revs",
+    help="Update the revs of GitHub-hosted hooks to their latest tags.",
+)
+def update_revs(
+    offline: bool = offline_opt,
+    quiet: bool = quiet_opt,
+) -> None:
+    with usethis_config.set(offline=offline, quiet=quiet):
+        update_pre_commit_revs()
@@ -1,11 +1,12 @@
 import sys
-from typing import Protocol
+from dataclasses import dataclass
 
 import typer
 
 from usethis._config import offline_opt, quiet_opt, usethis_config
 from usethis._console import err_print
 from usethis._core.tool import (
+    UseToolFunc,
     use_coverage,
     use_deptry,
     use_pre_commit,
@@ -13,10 +14,51 @@ from usethis._core.tool import (
     use_pytest,
     use_requirements_txt,
     use_ruff,
+    use_tools,
 )
 from usethis.errors import UsethisError
 
-app = typer.Typer(help="Add and configure development tools, e.g. linters.")
+
+@dataclass(frozen=True)
+class _ToolCall:
+    """A request from the command line to add or remove a tool."""
+
+    use_tool: UseToolFunc
+    remove: bool
+    offline: bool
+    quiet: bool
+    frozen: bool
+    dry_run: bool
+
+
+def _run_tools(calls: list[_ToolCall]) -> None:
+    """Run every tool given on the command line together, as one plan.
+
+    Options given to any one of the tools apply to all of them.
+    """
+    with usethis_config.set(
+        offline=any(call.offline for call in calls),
+        quiet=any(call.quiet for call in calls),
+        frozen=any(call.frozen for call in calls),
+    ):
+        try:
+            use_tools(
+                [(call.use_tool, call.remove) for call in calls],
+                dry_run=any(call.dry_run for call in calls),
+            )
+        except UsethisError as err:
+            err_print(err)
+            sys.exit(1)
+
+
+app = typer.Typer(
+    help=(
+        "Add and configure development tools, e.g. linters. Several tools can be given "
+        "at once, e.g. 'usethis tool ruff pytest'."
+    ),
+    chain=True,
+    result_callback=_run_tools,
+)
 
 remove_opt = typer.Option(
     False, "--remove", help="Remove the tool instead of adding it."
@@ -24,100 +66,60 @@ remove_opt = typer.Option(
 
 frozen_opt = typer.Option(False, "--frozen", help="Use the frozen dependencies.")
 
-
-@app.command(help="Use the coverage code coverage measurement tool.")
-def coverage(
-    remove: bool = remove_opt,
-    offline: bool = offline_opt,
-    quiet: bool = quiet_opt,
-    frozen: bool = frozen_opt,
-) -> None:
-    with usethis_config.set(offline=offline, quiet=quiet, frozen=frozen):
-        _run_tool(use_coverage, remove=remove)
+dry_run_opt = typer.Option(
+    False, "--dry-run", help="Show the changes as a diff without making them."
+)
 
 
-@app.command(
-    help="Use the deptry linter: avoid missing or superfluous dependency declarations."
+def _tool_command(use_tool: UseToolFunc, *, name: str, help_text: str) -> None:
+    """Register a command which adds or removes a tool, with the shared options."""
+
+    @app.command(name=name, help=help_text)
+    def command(
+        remove: bool = remove_opt,
+        offline: bool = offline_opt,
+        quiet: bool = quiet_opt,
+        frozen: bool = frozen_opt,
+        dry_run: bool = dry_run_opt,
+    ) -> _ToolCall:
+        return _ToolCall(
+            use_tool=use_tool,
+            remove=remove,
+            offline=offline,
+            quiet=quiet,
+            frozen=frozen,
+            dry_run=dry_run,
+        )
+
+
+_tool_command(
+    use_coverage,
+    name="coverage",
+    help_text="Use the coverage code coverage measurement tool.",
+)
+_tool_command(
+    use_deptry,
+    name="deptry",
+    help_text="Use the deptry linter: avoid missing or superfluous dependency declarations.",
 )
-def deptry(
-    remove: bool = remove_opt,
-    offline: bool = offline_opt,
-    quiet: bool = quiet_opt,
-    frozen: bool = frozen_opt,
-) -> None:
-    with usethis_config.set(offline=offline, quiet=quiet, frozen=frozen):
-        _run_tool(use_deptry, remove=remove)
-
-
-@app.command(
-    help="Use the pre-commit framework to manage and maintain pre-commit hooks."
+_tool_command(
+    use_pre_commit,
+    name="pre-commit",
+    help_text="Use the pre-commit framework to manage and maintain pre-commit hooks.",
 )
-def pre_commit(
-    remove: bool = remove_opt,
-    offline: bool = offline_opt,
-    quiet: bool = quiet_opt,
-    frozen: bool = frozen_opt,
-) -> None:
-    with usethis_config.set(offline=offline, quiet=quiet, frozen=frozen):
-        _run_tool(use_pre_commit, remove=remove)
-
-
-@app.command(
-    help="Use the pyproject-fmt linter: opinionated formatting of 'pyproject.toml' files."
+_tool_command(
+    use_pyproject_fmt,
+    name="pyproject-fmt",
+    help_text="Use the pyproject-fmt linter: opinionated formatting of 'pyproject.toml' files.",
 )
-def pyproject_fmt(
-    remove: bool = remove_opt,
-    offline: bool = offline_opt,
-    quiet: bool = quiet_opt,
-    frozen: bool = frozen_opt,
-) -> None:
-    with usethis_config.set(offline=offline, quiet=quiet, frozen=frozen):
-        _run_tool(use_pyproject_fmt, remove=remove)
-
-
-@app.command(help="Use the pytest testing framework.")
-def pytest(
-    remove: bool = remove_opt,
-    offline: bool = offline_opt,
-    quiet: bool = quiet_opt,
-    frozen: bool = frozen_opt,
-) -> None:
-    with usethis_config.set(offline=offline, quiet=quiet, frozen=frozen):
-        _run_tool(use_pytest, remove=remove)
-
-
-@app.command(
+_tool_command(use_pytest, name="pytest", help_text="Use the pytest testing framework.")
+_tool_command(
+    use_requirements_txt,
     name="requirements.txt",
-    help="Use a requirements.txt file exported from the uv lockfile.",
+    help_text="Use a requirements.txt file exported from the uv lockfile.",
+)
+_tool_command(
+    use_ruff,
+    name="ruff",
+    help_text="Use Ruff: an extremely fast Python linter and code formatter.",
 )
-def requirements_txt(
-    remove: bool = remove_opt,
-    offline: bool = offline_opt,
-    quiet: bool = quiet_opt,
-    frozen: bool = frozen_opt,
-) -> None:
-    with usethis_config.set(offline=offline, quiet=quiet, frozen=frozen):
-        _run_tool(use_requirements_txt, remove=remove)
-
-
-@app.command(help="Use Ruff: an extremely fast Python linter and code formatter.")
-def ruff(
-    remove: bool = remove_opt,
-    offline: bool = offline_opt,
-    quiet: bool = quiet_opt,
-    frozen: bool = frozen_opt,
-) -> None:
-    with usethis_config.set(offline=offline, quiet=quiet, frozen=frozen):
-        _run_tool(use_ruff, remove=remove)
-
-
-class UseToolFunc(Protocol):
-    def __call__(self, *, remove: bool) -> None: ...
-
-
-def _run_tool(caller: UseToolFunc, *, remove: bool):
-    try:
-        caller(remove=remove)
-    except UsethisError as err:
-        err_print(err)
-        sys.exit(1)
@@ -1,62 +1,150 @@
-from typing import Any
+import weakref
+from collections.abc import Iterable
+from typing import Any, ClassVar, TypeAlias
 
-from pydantic import BaseModel, RootModel
+Component: TypeAlias = "Series | Parallel | DepGroup | str"
 
-_HASH_SALT = "e6fdde87-adc6-42f6-8e66-4aabe4ba05f2"
 
+class _Container:
+    """An immutable, hash-consed container of pipeline components.
 
-class Series(RootModel[list["Series | Parallel | DepGroup | str"]]):
-    def __hash__(self):
-        return hash((_HASH_SALT, tuple(self.root)))
+    Constructing a container with the same contents as an existing one gives back the
+    existing object, so identical subtrees are shared. This means equality is just an
+    identity check, and the hash is computed once, when the container is created.
+    """
+
+    __slots__ = ("__weakref__", "_hash")
+
+    _hash: int
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        msg = f"'{type(self).__name__}' objects are immutable"
+        raise AttributeError(msg)
+
+    def __delattr__(self, name: str) -> None:
+        msg = f"'{type(self).__name__}' objects are immutable"
+        raise AttributeError(msg)
+
+    def __eq__(self, other: object) -> bool:
+        return self is other
+
+    def __hash__(self) -> int:
+        return self._hash
+
+
+class Series(_Container):
+    """Components which run one after another."""
+
+    __slots__ = ("root",)
+
+    root: tuple[Component, ...]
+
+    _instances: ClassVar[weakref.WeakValueDictionary[tuple[Component, ...], "Series"]]
+    _instances = weakref.WeakValueDictionary()
+
+    def __new__(cls, root: Iterable[Component] = ()) -> "Series":
+        root = tuple(root)
+        try:
+            return cls._instances[root]
+        except KeyError:
+            pass
+
+        self = object.__new__(cls)
+        object.__setattr__(self, "root", root)
+        object.__setattr__(self, "_hash", hash(("series", root)))
+        return cls._instances.setdefault(root, self)
+
+    def __reduce__(self) -> tuple[type["Series"], tuple[tuple[Component, ...]]]:
+        return Series, (self.root,)
 
     def __getitem__(self, item):
         return self.root[item]
 
-    def __setitem__(self, item, value):
-        self.root[item] = value
+    def __len__(self) -> int:
+        return len(self.root)
+
+    def __repr__(self) -> str:
+        return f"series({', '.join(repr(component) for component in self.root)})"
 
-    def __eq__(self, other: Any):
-        if not isinstance(other, Series):
-            return False
-        return self.root == other.root
 
-    def __len__(self):
-        return len(self.root)
+class Parallel(_Container):
+    """Components which can run at the same time."""
+
+    __slots__ = ("root",)
+
+    root: frozenset[Component]
 
+    _instances: ClassVar[weakref.WeakValueDictionary[frozenset[Component], "Parallel"]]
+    _instances = weakref.WeakValueDictionary()
 
-class Parallel(RootModel[frozenset["Series | Parallel | DepGroup | str"]]):
-    def __hash__(self):
-        return hash((_HASH_SALT, frozenset(self)))
+    def __new__(cls, root: Iterable[Component] = ()) -> "Parallel":
+        root = frozenset(root)
+        try:
+            return cls._instances[root]
+        except KeyError:
+            pass
+
+        self = object.__new__(cls)
+        object.__setattr__(self, "root", root)
+        object.__setattr__(self, "_hash", hash(("parallel", root)))
+        return cls._instances.setdefault(root, self)
+
+    def __reduce__(self) -> tuple[type["Parallel"], tuple[frozenset[Component]]]:
+        return Parallel, (self.root,)
 
     def __or__(self, other: "Parallel") -> "Parallel":
         return Parallel(self.root | other.root)
 
-    def __eq__(self, other: Any):
-        if not isinstance(other, Parallel):
-            return False
+    def __len__(self) -> int:
+        return len(self.root)
 
-        if any(component not in list(self.root) for component in other.root):
-            return False
-        return not any(component not in list(other.root) for component in self.root)
+    def __repr__(self) -> str:
+        components = sorted(repr(component) for component in self.root)
+        return f"parallel({', '.join(components)})"
 
-    def __len__(self):
-        return len(self.root)
 
+class DepGroup(_Container):
+    """Components in a series which share a configuration group, e.g. a stage."""
+
+    __slots__ = ("config_group", "series")
 
-class DepGroup(BaseModel):
     series: Series
     config_group: str
 
-    def __hash__(self):
-        return hash((_HASH_SALT, hash(self.series), self.config_group))
+    _instances: ClassVar[weakref.WeakValueDictionary[tuple[Series, str], "DepGroup"]]
+    _instances = weakref.WeakValueDictionary()
+
+    def __new__(cls, *, series: Series, config_group: str) -> "DepGroup":
+        key = (series, config_group)
+        try:
+            return cls._instances[key]
+        except KeyError:
+            pass
+
+        self = object.__new__(cls)
+        object.__setattr__(self, "series", series)
+        object.__setattr__(self, "config_group", config_group)
+        object.__setattr__(self, "_hash", hash(("depgroup", key)))
+        return cls._instances.setdefault(key, self)
+
+    def __reduce__(self):
+        return _make_depgroup, (self.series, self.config_group)
+
+    def __repr__(self) -> str:
+        components = ", ".join(repr(component) for component in self.series.root)
+        return f"depgroup({components}, config_group={self.config_group!r})"
+
+
+def _make_depgroup(series: Series, config_group: str) -> DepGroup:
+    return DepGroup(series=series, config_group=config_group)
 
 
 def parallel(*args: Series | Parallel | DepGroup | str) -> Parallel:
-    return Parallel(frozenset(args))
+    return Parallel(args)
 
 
 def series(*args: Series | Parallel | DepGroup | str) -> Series:
-    return Series(list(args))
+    return Series(args)
 
 
 def depgroup(*args: Series | Parallel | DepGroup | str, config_group: str) -> DepGroup:
@@ -1,7 +1,9 @@
 import contextlib
-from functools import reduce, singledispatch, singledispatchmethod
+import heapq
+from dataclasses import dataclass
+from functools import lru_cache, reduce, singledispatch
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from typing_extensions import assert_never
 
 from usethis._pipeweld.containers import (
@@ -12,18 +14,28 @@ from usethis._pipeweld.containers import (
     parallel,
     series,
 )
-from usethis._pipeweld.ops import InsertParallel, InsertSuccessor, Instruction
+from usethis._pipeweld.ops import (
+    InsertParallel,
+    InsertSuccessor,
+    Instruction,
+    Move,
+    Operation,
+    Remove,
+)
 from usethis._pipeweld.result import WeldResult
 
 
-class Partition(BaseModel):
+@dataclass(frozen=True, slots=True, kw_only=True)
+class Partition:
+    top_ranked_endpoint: str
     prerequisite_component: str | Series | DepGroup | Parallel | None = None
     nondependent_component: str | Series | DepGroup | Parallel | None = None
     postrequisite_component: str | Series | DepGroup | Parallel | None = None
-    top_ranked_endpoint: str
 
 
 class Adder(BaseModel):
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
     pipeline: Series
     step: str
     prerequisites: set[str] = set()
@@ -42,155 +54,43 @@ class Adder(BaseModel):
             self.pipeline, predecessor=None
         )
         rearranged_pipeline = _flatten_partition(partition)
-        new_instructions = self._insert_step(rearranged_pipeline)
+        inserted = self._insert_step(rearranged_pipeline)
 
-        if not new_instructions:
+        if inserted is None:
             # Didn't find a pre-requisite so just add the step in parallel to everything
-            new_instructions = self._insert_before_postrequisites(
+            inserted = self._insert_before_postrequisites(
                 rearranged_pipeline, idx=-1, predecessor=None
             )
 
+        solution, new_instructions = inserted
         instructions += new_instructions
 
         return WeldResult(
-            solution=rearranged_pipeline,
+            solution=solution,
             instructions=instructions,
         )
 
-    @singledispatchmethod
     def partition_component(
         self, component: str | Series | Parallel | DepGroup, *, predecessor: str | None
     ) -> tuple[Partition, list[Instruction]]:
-        raise NotImplementedError
-
-    @partition_component.register(str)
-    def _(
-        self, component: str, *, predecessor: str | None
-    ) -> tuple[Partition, list[Instruction]]:
-        if component in self.prerequisites:
-            return Partition(
-                prerequisite_component=component,
-                top_ranked_endpoint=component,
-            ), []
-        elif component in self.postrequisites:
-            return Partition(
-                postrequisite_component=component,
-                top_ranked_endpoint=component,
-            ), []
-        else:
-            return Partition(
-                nondependent_component=component,
-                top_ranked_endpoint=component,
-            ), []
-
-    @partition_component.register(Series)
-    def _(
-        self, component: Series, *, predecessor: str | None
-    ) -> tuple[Partition, list[Instruction]]:
-        partitions: list[Partition] = []
-        instructions = []
-        for subcomponent in component.root:
-            partition, these_instructions = self.partition_component(
-                subcomponent,
-                predecessor=predecessor,
-            )
-            partitions.append(partition)
-            instructions.extend(these_instructions)
-            predecessor = partition.top_ranked_endpoint  # For the next iteration
-
-        if len(partitions) > 1:
-            return reduce(_op_series_merge_partitions, partitions), instructions
-        else:
-            partition = partitions[0]
-            return Partition(
-                prerequisite_component=series(partition.prerequisite_component)
-                if partition.prerequisite_component is not None
-                else None,
-                nondependent_component=series(partition.nondependent_component)
-                if partition.nondependent_component is not None
-                else None,
-                postrequisite_component=series(partition.postrequisite_component)
-                if partition.postrequisite_component is not None
-                else None,
-                top_ranked_endpoint=partition.top_ranked_endpoint,
-            ), instructions
-
-    @partition_component.register(Parallel)
-    def _(
-        self, component: Parallel, *, predecessor: str | None
-    ) -> tuple[Partition, list[Instruction]]:
-        partition_with_instruction_tuples = [
-            self.partition_component(
-                subcomponent,
-                predecessor=predecessor,
-            )
-            for subcomponent in component.root
-        ]
-
-        partitions = [_[0] for _ in partition_with_instruction_tuples]
-        instructions = [x for _ in partition_with_instruction_tuples for x in _[1]]
-
-        any_prerequisites = any(
-            p.prerequisite_component is not None for p in partitions
-        )
-        any_postrequisites = any(
-            p.postrequisite_component is not None for p in partitions
-        )
-
-        if any_prerequisites and any_postrequisites:
-            return _parallel_merge_partitions(*partitions, predecessor=predecessor)
-        elif any_prerequisites:
-            return Partition(
-                prerequisite_component=component,
-                top_ranked_endpoint=min(p.top_ranked_endpoint for p in partitions),
-            ), instructions
-        elif any_postrequisites:
-            return Partition(
-                postrequisite_component=component,
-                top_ranked_endpoint=min(p.top_ranked_endpoint for p in partitions),
-            ), instructions
-        else:
-            return Partition(
-                nondependent_component=component,
-                top_ranked_endpoint=min(p.top_ranked_endpoint for p in partitions),
-            ), instructions
-
-    @partition_component.register(DepGroup)
-    def _(
-        self, component: DepGroup, *, predecessor: str | None
-    ) -> tuple[Partition, list[Instruction]]:
-        partition, instructions = self.partition_component(
-            component.series,
+        partition, instructions = _partition_component(
+            component,
+            prerequisites=frozenset(self.prerequisites),
+            postrequisites=frozenset(self.postrequisites),
             predecessor=predecessor,
         )
-        partition = Partition(
-            prerequisite_component=depgroup(
-                partition.prerequisite_component, config_group=component.config_group
-            )
-            if partition.prerequisite_component is not None
-            else None,
-            nondependent_component=depgroup(
-                partition.nondependent_component, config_group=component.config_group
-            )
-            if partition.nondependent_component is not None
-            else None,
-            postrequisite_component=depgroup(
-                partition.postrequisite_component, config_group=component.config_group
-            )
-            if partition.postrequisite_component is not None
-            else None,
-            top_ranked_endpoint=partition.top_ranked_endpoint,
-        )
-        return partition, instructions
+        return partition, list(instructions)
 
     def _insert_step(
         self,
         component: Series,
-    ) -> list[Instruction]:
+    ) -> tuple[Series, list[Instruction]] | None:
         # Iterate through the pipeline and insert the step
         # Work backwards until we find a pre-requisite (which is the final one), and then
         # insert after it - in parallel to its successor (or append if no successor). If we
         # don't find any pre-requsite then we insert in parallel to everything.
+        # The containers are immutable, so the new series is returned, along with the
+        # instructions.
         for idx, subcomponent in reversed(list(enumerate(component.root))):
             if isinstance(subcomponent, str):
                 if subcomponent in self.prerequisites:
@@ -200,74 +100,566 @@ class Adder(BaseModel):
                         predecessor=subcomponent,
                     )
             elif isinstance(subcomponent, Series):
-                added = self._insert_step(subcomponent)
-                if added:
-                    return added
+                inserted = self._insert_step(subcomponent)
+                if inserted is not None:
+                    new_subcomponent, instructions = inserted
+                    return _replace(component, idx, new_subcomponent), instructions
             elif isinstance(subcomponent, Parallel):
-                added = self._insert_step(Series(list(subcomponent.root)))
-                if added:
-                    return added
+                if any(
+                    isinstance(parallel_component, str | DepGroup)
+                    and _has_any_steps(parallel_component, steps=self.prerequisites)
+                    for parallel_component in subcomponent.root
+                ):
+                    # The step can't be nested in the parallel block after one of its
+                    # prerequisites, so it needs to come after the whole block.
+                    return self._insert_before_postrequisites(
+                        component,
+                        idx=idx,
+                        predecessor=get_endpoint(subcomponent),
+                    )
+
+                inserted = self._insert_step(Series(subcomponent.root))
+                if inserted is not None:
+                    new_subcomponent, instructions = inserted
+                    return _replace(
+                        component, idx, Parallel(new_subcomponent.root)
+                    ), instructions
             elif isinstance(subcomponent, DepGroup):
                 if _has_any_steps(subcomponent, steps=self.prerequisites):
-                    added = self._insert_before_postrequisites(
+                    return self._insert_before_postrequisites(
                         component,
                         idx=idx,
                         predecessor=get_endpoint(subcomponent),
                     )
-                    if added:
-                        return added
             else:
                 assert_never(subcomponent)
 
-        return []
+        return None
 
     def _insert_before_postrequisites(
         self, component: Series, *, idx: int, predecessor: str | None
-    ) -> list[Instruction]:
+    ) -> tuple[Series, list[Instruction]]:
         if idx + 1 >= len(component.root):
             # i.e. there is no successor; append
-            component.root.append(self.step)
-            return [InsertSuccessor(after=predecessor, step=self.step)]
+            return series(*component.root, self.step), [
+                InsertSuccessor(after=predecessor, step=self.step)
+            ]
 
         successor_component = component.root[idx + 1]
 
         if (
             isinstance(successor_component, Parallel)
             and len(successor_component.root) == 1
+            and isinstance(next(iter(successor_component.root)), Series)
         ):
-            container = Series(list(successor_component.root))
-            instructions = self._insert_before_postrequisites(
-                container,
+            # A singleton parallel block around a series; insert into the series.
+            (member,) = successor_component.root
+            assert isinstance(member, Series)
+            new_member, instructions = self._insert_before_postrequisites(
+                member,
                 idx=-1,
                 predecessor=predecessor,
             )
-            if len(container) == 1 and container[0] == _union(
-                successor_component, self.step
-            ):
-                component[idx + 1] = _union(successor_component, self.step)
-
-            return instructions
+            return _replace(component, idx + 1, parallel(new_member)), instructions
         elif isinstance(successor_component, Parallel | DepGroup | str):
             if _has_any_steps(successor_component, steps=self.postrequisites):
                 # Insert before this step
-                component.root.insert(idx + 1, self.step)
-                return [InsertSuccessor(after=predecessor, step=self.step)]
+                return _insert(component, idx + 1, self.step), [
+                    InsertSuccessor(after=predecessor, step=self.step)
+                ]
             else:
                 union = _union(successor_component, self.step)
                 if union is None:
                     raise AssertionError
-                component.root[idx + 1] = union
-                return [InsertParallel(after=predecessor, step=self.step)]
+                return _replace(component, idx + 1, union), [
+                    InsertParallel(after=predecessor, step=self.step)
+                ]
         elif isinstance(successor_component, Series):
-            return self._insert_before_postrequisites(
+            new_successor, instructions = self._insert_before_postrequisites(
                 successor_component,
                 idx=-1,
                 predecessor=predecessor,
             )
+            return _replace(component, idx + 1, new_successor), instructions
         else:
             assert_never(successor_component)
 
 
+class BatchAdder(BaseModel):
+    """Add several steps to a pipeline in one solve.
+
+    The steps are added in a canonical order: a step comes after any of the other new
+    steps which are among its prerequisites, or which have it among their
+    postrequisites, with ties broken by name. So the result doesn't depend on the
+    order the steps are given in, and it's the same as adding the steps one at a time
+    with `Adder` in that order.
+
+    While the pipeline is flat, i.e. a series of steps and parallel blocks of steps,
+    each step is placed directly using an index of where every step is. A step is only
+    welded by a full `Adder` solve when it needs the pipeline to be rearranged, i.e.
+    when a parallel block has both a prerequisite and a postrequisite of the step, or
+    when the pipeline isn't flat, e.g. it has dependency groups.
+
+    Any steps in `removals` are removed first. A new step which is already in the
+    pipeline is left alone if it's in order with its requirements, and is moved
+    otherwise. Existing steps which are moved when the pipeline is rearranged give
+    `Move` operations too, except for steps in dependency groups, which stay put.
+    """
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    pipeline: Series
+    steps: set[str]
+    prerequisites: dict[str, set[str]] = {}
+    postrequisites: dict[str, set[str]] = {}
+    removals: set[str] = set()
+
+    def add(self) -> WeldResult:
+        """Add the steps.
+
+        Raises:
+            ValueError: If the requirements between the new steps have a cycle.
+        """
+        pipeline = self.pipeline
+        instructions: list[Operation] = []
+        for step in sorted(self.removals):
+            if step in _get_steps(pipeline):
+                pipeline = _remove_step(pipeline, step=step)
+                instructions.append(Remove(step=step))
+
+        components = list(pipeline.root)
+        positions = _get_positions(components)
+        grouped_steps = _get_grouped_steps(components)
+
+        for step in self._get_order():
+            prerequisites = self.prerequisites.get(step, set())
+            postrequisites = self.postrequisites.get(step, set())
+            existing_steps = _get_steps(series(*components))
+
+            if step in existing_steps:
+                if step in grouped_steps or _is_in_order(
+                    components,
+                    step=step,
+                    prerequisites=prerequisites,
+                    postrequisites=postrequisites,
+                ):
+                    continue
+
+                components = list(_remove_step(series(*components), step=step).root)
+                positions = _get_positions(components)
+
+            if positions is not None and not _needs_rearranging(
+                components,
+                positions=positions,
+                prerequisites=prerequisites,
+                postrequisites=postrequisites,
+            ):
+                new_instructions = [
+                    _insert_into_flat(
+                        components,
+                        positions=positions,
+                        step=step,
+                        prerequisites=prerequisites,
+                        postrequisites=postrequisites,
+                    )
+                ]
+            else:
+                result = Adder(
+                    pipeline=series(*components),
+                    step=step,
+                    prerequisites=prerequisites,
+                    postrequisites=postrequisites,
+                ).add()
+                components = list(result.solution.root)
+                positions = _get_positions(components)
+                new_instructions = result.instructions
+
+            for instruction in new_instructions:
+                if instruction.step in grouped_steps:
+                    continue
+                elif instruction.step in existing_steps:
+                    instructions.append(
+                        Move(
+                            after=instruction.after,
+                            step=instruction.step,
+                            parallel=isinstance(instruction, InsertParallel),
+                        )
+                    )
+                else:
+                    instructions.append(instruction)
+
+        return WeldResult(solution=series(*components), instructions=instructions)
+
+    def _get_order(self) -> list[str]:
+        predecessors: dict[str, set[str]] = {step: set() for step in self.steps}
+        for step in self.steps:
+            predecessors[step] |= self.prerequisites.get(step, set()) & self.steps
+            for postrequisite in self.postrequisites.get(step, set()) & self.steps:
+                predecessors[postrequisite].add(step)
+
+        order = []
+        remaining = {step: len(predecessors[step]) for step in self.steps}
+        successors: dict[str, list[str]] = {step: [] for step in self.steps}
+        for step, step_predecessors in predecessors.items():
+            for predecessor in step_predecessors:
+                successors[predecessor].append(step)
+
+        ready = [step for step, count in remaining.items() if count == 0]
+        heapq.heapify(ready)
+        while ready:
+            step = heapq.heappop(ready)
+            order.append(step)
+            for successor in successors[step]:
+                remaining[successor] -= 1
+                if remaining[successor] == 0:
+                    heapq.heappush(ready, successor)
+
+        if len(order) != len(self.steps):
+            cycle = sorted(self.steps - set(order))
+            msg = f"The requirements of the new steps have a cycle: {', '.join(cycle)}"
+            raise ValueError(msg)
+
+        return order
+
+
+def _get_positions(
+    components: list[str | Series | Parallel | DepGroup],
+) -> dict[str, int] | None:
+    """The index of the component each step is in, if the pipeline is flat."""
+    positions: dict[str, int] = {}
+    for idx, component in enumerate(components):
+        if isinstance(component, str):
+            positions[component] = idx
+        elif (
+            isinstance(component, Parallel)
+            # Adder treats singleton parallel blocks specially, so leave them to it.
+            and len(component) > 1
+            and all(isinstance(sub, str) for sub in component.root)
+        ):
+            for step in component.root:
+                assert isinstance(step, str)
+                positions[step] = idx
+        else:
+            # Adder rearranges the contents of dependency groups too.
+            return None
+    return positions
+
+
+def _get_grouped_steps(
+    components: list[str | Series | Parallel | DepGroup],
+) -> frozenset[str]:
+    """The steps which are in dependency groups."""
+    grouped_steps: set[str] = set()
+    for component in components:
+        if isinstance(component, DepGroup):
+            grouped_steps |= _get_steps(component)
+        elif isinstance(component, Series | Parallel):
+            grouped_steps |= _get_grouped_steps(list(component.root))
+    return frozenset(grouped_steps)
+
+
+def _is_in_order(
+    components: list[str | Series | Parallel | DepGroup],
+    *,
+    step: str,
+    prerequisites: set[str],
+    postrequisites: set[str],
+) -> bool:
+    """Whether a step comes after its prerequisites and before its postrequisites."""
+    idx_by_step: dict[str, int] = {}
+    for idx, component in enumerate(components):
+        if isinstance(component, str):
+            idx_by_step[component] = idx
+        else:
+            idx_by_step.update(dict.fromkeys(_get_steps(component), idx))
+
+    step_idx = idx_by_step[step]
+    return all(
+        idx_by_step[prerequisite] < step_idx
+        for prerequisite in prerequisites & idx_by_step.keys()
+    ) and all(
+        idx_by_step[postrequisite] > step_idx
+        for postrequisite in postrequisites & idx_by_step.keys()
+    )
+
+
+def _needs_rearranging(
+    components: list[str | Series | Parallel | DepGroup],
+    *,
+    positions: dict[str, int],
+    prerequisites: set[str],
+    postrequisites: set[str],
+) -> bool:
+    # Adder splits a parallel block which has both.
+    prerequisite_idxs = {positions[step] for step in prerequisites if step in positions}
+    postrequisite_idxs = {
+        positions[step] for step in postrequisites if step in positions
+    }
+    return any(
+        not isinstance(components[idx], str)
+        for idx in prerequisite_idxs & postrequisite_idxs
+    )
+
+
+def _insert_into_flat(
+    components: list[str | Series | Parallel | DepGroup],
+    *,
+    positions: dict[str, int],
+    step: str,
+    prerequisites: set[str],
+    postrequisites: set[str],
+) -> Instruction:
+    """Insert a step into a flat pipeline, as `Adder` would, updating the index."""
+    if not components:
+        components.append(step)
+        positions[step] = 0
+        return InsertParallel(after=None, step=step)
+
+    # Insert after the last component with a prerequisite, or else at the start.
+    idx = max(
+        (positions[prerequisite] for prerequisite in prerequisites & positions.keys()),
+        default=-1,
+    )
+    if idx == -1:
+        predecessor = None
+    else:
+        predecessor = get_endpoint(components[idx])
+
+    if idx + 1 >= len(components):
+        components.append(step)
+        positions[step] = idx + 1
+        return InsertSuccessor(after=predecessor, step=step)
+
+    successor_component = components[idx + 1]
+    if _has_any_steps(successor_component, steps=postrequisites):
+        components.insert(idx + 1, step)
+        for other, other_idx in positions.items():
+            if other_idx > idx:
+                positions[other] = other_idx + 1
+        positions[step] = idx + 1
+        return InsertSuccessor(after=predecessor, step=step)
+
+    union = _union(successor_component, step)
+    if union is None:
+        raise AssertionError
+    components[idx + 1] = union
+    positions[step] = idx + 1
+    return InsertParallel(after=predecessor, step=step)
+
+
+def _partition_component(
+    component: str | Series | Parallel | DepGroup,
+    *,
+    prerequisites: frozenset[str],
+    postrequisites: frozenset[str],
+    predecessor: str | None,
+) -> tuple[Partition, tuple[Instruction, ...]]:
+    if isinstance(component, str):
+        return _partition(
+            component,
+            prerequisites=prerequisites,
+            postrequisites=postrequisites,
+            predecessor=predecessor,
+        )
+
+    steps = _get_steps(component)
+    if steps.isdisjoint(prerequisites) and steps.isdisjoint(postrequisites):
+        # The subtree can only be nondependent, whatever the requirements and the
+        # predecessor are, so share one cache entry between all of them.
+        prerequisites = postrequisites = frozenset()
+        predecessor = None
+
+    return _partition_cached(component, prerequisites, postrequisites, predecessor)
+
+
+@lru_cache(maxsize=4096)
+def _partition_cached(
+    component: Series | Parallel | DepGroup,
+    prerequisites: frozenset[str],
+    postrequisites: frozenset[str],
+    predecessor: str | None,
+) -> tuple[Partition, tuple[Instruction, ...]]:
+    # Containers are immutable and hash-consed, so identical subtrees share an entry.
+    return _partition(
+        component,
+        prerequisites=prerequisites,
+        postrequisites=postrequisites,
+        predecessor=predecessor,
+    )
+
+
+@singledispatch
+def _partition(
+    component: str | Series | Parallel | DepGroup,
+    *,
+    prerequisites: frozenset[str],
+    postrequisites: frozenset[str],
+    predecessor: str | None,
+) -> tuple[Partition, tuple[Instruction, ...]]:
+    raise NotImplementedError
+
+
+@_partition.register(str)
+def _(
+    component: str,
+    *,
+    prerequisites: frozenset[str],
+    postrequisites: frozenset[str],
+    predecessor: str | None,
+) -> tuple[Partition, tuple[Instruction, ...]]:
+    if component in prerequisites:
+        return Partition(
+            prerequisite_component=component,
+            top_ranked_endpoint=component,
+        ), ()
+    elif component in postrequisites:
+        return Partition(
+            postrequisite_component=component,
+            top_ranked_endpoint=component,
+        ), ()
+    else:
+        return Partition(
+            nondependent_component=component,
+            top_ranked_endpoint=component,
+        ), ()
+
+
+@_partition.register(Series)
+def _(
+    component: Series,
+    *,
+    prerequisites: frozenset[str],
+    postrequisites: frozenset[str],
+    predecessor: str | None,
+) -> tuple[Partition, tuple[Instruction, ...]]:
+    partitions: list[Partition] = []
+    instructions: list[Instruction] = []
+    for subcomponent in component.root:
+        partition, these_instructions = _partition_component(
+            subcomponent,
+            prerequisites=prerequisites,
+            postrequisites=postrequisites,
+            predecessor=predecessor,
+        )
+        partitions.append(partition)
+        instructions.extend(these_instructions)
+        predecessor = partition.top_ranked_endpoint  # For the next iteration
+
+    if len(partitions) > 1:
+        return reduce(_op_series_merge_partitions, partitions), tuple(instructions)
+    else:
+        partition = partitions[0]
+        return Partition(
+            prerequisite_component=series(partition.prerequisite_component)
+            if partition.prerequisite_component is not None
+            else None,
+            nondependent_component=series(partition.nondependent_component)
+            if partition.nondependent_component is not None
+            else None,
+            postrequisite_component=series(partition.postrequisite_component)
+            if partition.postrequisite_component is not None
+            else None,
+            top_ranked_endpoint=partition.top_ranked_endpoint,
+        ), tuple(instructions)
+
+
+@_partition.register(Parallel)
+def _(
+    component: Parallel,
+    *,
+    prerequisites: frozenset[str],
+    postrequisites: frozenset[str],
+    predecessor: str | None,
+) -> tuple[Partition, tuple[Instruction, ...]]:
+    partition_with_instruction_tuples = [
+        _partition_component(
+            subcomponent,
+            prerequisites=prerequisites,
+            postrequisites=postrequisites,
+            predecessor=predecessor,
+        )
+        for subcomponent in component.root
+    ]
+
+    partitions = [_[0] for _ in partition_with_instruction_tuples]
+    instructions = tuple(x for _ in partition_with_instruction_tuples for x in _[1])
+
+    any_prerequisites = any(p.prerequisite_component is not None for p in partitions)
+    any_postrequisites = any(p.postrequisite_component is not None for p in partitions)
+
+    if any_prerequisites and any_postrequisites:
+        partition, new_instructions = _parallel_merge_partitions(
+            *partitions, predecessor=predecessor
+        )
+        return partition, tuple(new_instructions)
+    elif any_prerequisites:
+        return Partition(
+            prerequisite_component=component,
+            top_ranked_endpoint=min(p.top_ranked_endpoint for p in partitions),
+        ), instructions
+    elif any_postrequisites:
+        return Partition(
+            postrequisite_component=component,
+            top_ranked_endpoint=min(p.top_ranked_endpoint for p in partitions),
+        ), instructions
+    else:
+        return Partition(
+            nondependent_component=component,
+            top_ranked_endpoint=min(p.top_ranked_endpoint for p in partitions),
+        ), instructions
+
+
+@_partition.register(DepGroup)
+def _(
+    component: DepGroup,
+    *,
+    prerequisites: frozenset[str],
+    postrequisites: frozenset[str],
+    predecessor: str | None,
+) -> tuple[Partition, tuple[Instruction, ...]]:
+    partition, instructions = _partition_component(
+        component.series,
+        prerequisites=prerequisites,
+        postrequisites=postrequisites,
+        predecessor=predecessor,
+    )
+    partition = Partition(
+        prerequisite_component=depgroup(
+            partition.prerequisite_component, config_group=component.config_group
+        )
+        if partition.prerequisite_component is not None
+        else None,
+        nondependent_component=depgroup(
+            partition.nondependent_component, config_group=component.config_group
+        )
+        if partition.nondependent_component is not None
+        else None,
+        postrequisite_component=depgroup(
+            partition.postrequisite_component, config_group=component.config_group
+        )
+        if partition.postrequisite_component is not None
+        else None,
+        top_ranked_endpoint=partition.top_ranked_endpoint,
+    )
+    return partition, instructions
+
+
+@lru_cache(maxsize=4096)
+def _get_steps(component: Series | Parallel | DepGroup) -> frozenset[str]:
+    if isinstance(component, Series | Parallel):
+        steps: set[str] = set()
+        for subcomponent in component.root:
+            if isinstance(subcomponent, str):
+                steps.add(subcomponent)
+            else:
+                steps |= _get_steps(subcomponent)
+        return frozenset(steps)
+    elif isinstance(component, DepGroup):
+        return _get_steps(component.series)
+    else:
+        assert_never(component)
+
+
 def _has_any_steps(
     component: Series | Parallel | DepGroup | str, *, steps: set[str]
 ) -> bool:
@@ -548,6 +940,90 @@ def _concat(*components: str | Series | DepGroup | Parallel | None) -> Series |
     return series(*s)
 
 
+def _remove_step(component: Series, *, step: str) -> Series:
+    """Remove a step from a series, dropping any containers which are left empty.
+
+    A parallel block which is left with a single component is unwrapped, unless it
+    was a singleton to begin with.
+    """
+    new_component = _remove_step_from_component(component, step=step)
+    if new_component is None:
+        return series()
+    assert isinstance(new_component, Series)
+    return new_component
+
+
+@singledispatch
+def _remove_step_from_component(
+    component: str | Series | Parallel | DepGroup, *, step: str
+) -> str | Series | Parallel | DepGroup | None:
+    raise NotImplementedError
+
+
+@_remove_step_from_component.register(str)
+def _(component: str, *, step: str) -> str | Series | Parallel | DepGroup | None:
+    return None if component == step else component
+
+
+@_remove_step_from_component.register(Series)
+def _(component: Series, *, step: str) -> str | Series | Parallel | DepGroup | None:
+    if step not in _get_steps(component):
+        return component
+
+    subcomponents = _remove_step_from_subcomponents(component, step=step)
+    if not subcomponents:
+        return None
+    return series(*subcomponents)
+
+
+@_remove_step_from_component.register(Parallel)
+def _(component: Parallel, *, step: str) -> str | Series | Parallel | DepGroup | None:
+    if step not in _get_steps(component):
+        return component
+
+    subcomponents = _remove_step_from_subcomponents(component, step=step)
+    if not subcomponents:
+        return None
+    elif len(subcomponents) == 1 and len(component) > 1:
+        (subcomponent,) = subcomponents
+        return subcomponent
+    return parallel(*subcomponents)
+
+
+@_remove_step_from_component.register(DepGroup)
+def _(component: DepGroup, *, step: str) -> str | Series | Parallel | DepGroup | None:
+    if step not in _get_steps(component):
+        return component
+
+    subcomponents = _remove_step_from_subcomponents(component.series, step=step)
+    if not subcomponents:
+        return None
+    return depgroup(*subcomponents, config_group=component.config_group)
+
+
+def _remove_step_from_subcomponents(
+    component: Series | Parallel, *, step: str
+) -> list[str | Series | Parallel | DepGroup]:
+    subcomponents = []
+    for subcomponent in component.root:
+        new_subcomponent = _remove_step_from_component(subcomponent, step=step)
+        if new_subcomponent is not None:
+            subcomponents.append(new_subcomponent)
+    return subcomponents
+
+
+def _replace(
+    component: Series, idx: int, new: str | Series | DepGroup | Parallel
+) -> Series:
+    return series(*component.root[:idx], new, *component.root[idx + 1 :])
+
+
+def _insert(
+    component: Series, idx: int, new: str | Series | DepGroup | Parallel
+) -> Series:
+    return series(*component.root[:idx], new, *component.root[idx:])
+
+
 def _union(*components: str | Series | DepGroup | Parallel | None) -> Parallel | None:
     p = []
     for component in components:
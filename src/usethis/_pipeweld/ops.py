@@ -16,4 +16,15 @@ class InsertSuccessor(BaseOperation):
     pass
 
 
+class Move(BaseOperation):
+    # Move an existing step to come after another step, either in parallel with the
+    # successor of that step or else as a new successor, like the insertions.
+    parallel: bool = False
+
+
+class Remove(BaseModel):
+    step: str
+
+
 Instruction: TypeAlias = InsertSuccessor | InsertParallel
+Operation: TypeAlias = Instruction | Move | Remove
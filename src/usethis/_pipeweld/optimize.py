@@ -0,0 +1,179 @@
+from pydantic import BaseModel, Field
+from typing_extensions import assert_never
+
+from usethis._pipeweld.containers import DepGroup, Parallel, Series, parallel, series
+from usethis._pipeweld.func import _get_instructions_for_insertion
+from usethis._pipeweld.result import OptimizeResult
+
+_DEFAULT_DURATION = 1.0
+
+
+class Optimizer(BaseModel):
+    """Arrange a whole set of steps to minimize the length of the critical path.
+
+    The steps are arranged as a series of parallel groups, which is what CI platforms
+    like Bitbucket Pipelines support. Each step comes in a later group than all its
+    prerequisites, and no group has more than `max_parallelism` steps. The makespan is
+    the sum of the longest duration in each group.
+
+    The search is exhaustive over which step sets the duration of each group, so the
+    makespan is minimal whenever no group is full. When there are more candidates than
+    room in a group, the steps with the longest path to the end of the pipeline are
+    preferred, as in critical path list scheduling.
+
+    Attributes:
+        steps: The steps to arrange.
+        prerequisites: The steps which must finish before each step starts. Steps which
+                       aren't being arranged are ignored.
+        durations: The expected duration of each step, which is 1 by default.
+        max_parallelism: The most steps to run at once, if there is a limit.
+    """
+
+    steps: set[str]
+    prerequisites: dict[str, set[str]] = {}
+    durations: dict[str, float] = {}
+    max_parallelism: int | None = Field(default=None, ge=1)
+
+    def optimize(self) -> OptimizeResult:
+        """Find the arrangement of the steps.
+
+        Raises:
+            ValueError: If the prerequisites have a cycle.
+        """
+        groups = self._get_groups()
+        solution = series(
+            *[
+                next(iter(group)) if len(group) == 1 else parallel(*group)
+                for group in groups
+            ]
+        )
+        instructions, _ = _get_instructions_for_insertion(solution, after=None)
+
+        return OptimizeResult(
+            solution=solution,
+            instructions=instructions,
+            makespan=get_makespan(solution, durations=self.durations),
+        )
+
+    def _get_groups(self) -> list[frozenset[str]]:
+        prerequisites = {
+            step: self.prerequisites.get(step, set()) & self.steps
+            for step in self.steps
+        }
+        durations = {
+            step: self.durations.get(step, _DEFAULT_DURATION) for step in self.steps
+        }
+        tails = _get_tail_durations(prerequisites, durations=durations)
+        capacity = self.max_parallelism or max(len(self.steps), 1)
+
+        # Priority order: longest path to the end first, then by name to be
+        # deterministic.
+        ranked = sorted(self.steps, key=lambda step: (-tails[step], step))
+
+        def get_candidates(done: frozenset[str]) -> list[frozenset[str]]:
+            available = [
+                step
+                for step in ranked
+                if step not in done and prerequisites[step] <= done
+            ]
+            candidates: list[frozenset[str]] = []
+            for threshold in sorted({durations[step] for step in available}):
+                group = frozenset(
+                    [step for step in available if durations[step] <= threshold][
+                        :capacity
+                    ]
+                )
+                if group not in candidates:
+                    candidates.append(group)
+            return candidates
+
+        # Dynamic programming over the sets of finished steps, with an explicit stack
+        # since the pipeline can be much longer than the recursion limit.
+        everything = frozenset(self.steps)
+        best: dict[frozenset[str], tuple[float, frozenset[str] | None]] = {
+            everything: (0.0, None)
+        }
+        stack = [frozenset[str]()]
+        while stack:
+            done = stack[-1]
+            if done in best:
+                stack.pop()
+                continue
+
+            candidates = get_candidates(done)
+            pending = [done | group for group in candidates if done | group not in best]
+            if pending:
+                stack.extend(pending)
+                continue
+
+            stack.pop()
+            for group in candidates:
+                cost = max(durations[step] for step in group) + best[done | group][0]
+                if done not in best or cost < best[done][0]:
+                    best[done] = (cost, group)
+
+        groups = []
+        done = frozenset[str]()
+        while (group := best[done][1]) is not None:
+            groups.append(group)
+            done |= group
+        return groups
+
+
+def _get_tail_durations(
+    prerequisites: dict[str, set[str]], *, durations: dict[str, float]
+) -> dict[str, float]:
+    """The duration of the longest path from the start of each step to the end."""
+    dependents: dict[str, set[str]] = {step: set() for step in prerequisites}
+    for step, step_prerequisites in prerequisites.items():
+        for prerequisite in step_prerequisites:
+            dependents[prerequisite].add(step)
+
+    # Work backwards from the steps which nothing depends on (Kahn's algorithm).
+    remaining = {step: len(dependents[step]) for step in prerequisites}
+    ready = sorted(step for step, count in remaining.items() if count == 0)
+    tails: dict[str, float] = {}
+    while ready:
+        step = ready.pop()
+        tails[step] = durations[step] + max(
+            (tails[dependent] for dependent in dependents[step]), default=0.0
+        )
+        for prerequisite in prerequisites[step]:
+            remaining[prerequisite] -= 1
+            if remaining[prerequisite] == 0:
+                ready.append(prerequisite)
+
+    if len(tails) != len(prerequisites):
+        cycle = sorted(set(prerequisites) - set(tails))
+        msg = f"The prerequisites of the steps have a cycle: {', '.join(cycle)}"
+        raise ValueError(msg)
+
+    return tails
+
+
+def get_makespan(
+    component: Series | Parallel | DepGroup | str, *, durations: dict[str, float]
+) -> float:
+    """The duration of the critical path through a component.
+
+    Steps without a duration take 1 unit of time.
+    """
+    if isinstance(component, str):
+        return durations.get(component, _DEFAULT_DURATION)
+    elif isinstance(component, Series):
+        return sum(
+            get_makespan(subcomponent, durations=durations)
+            for subcomponent in component.root
+        )
+    elif isinstance(component, Parallel):
+        return max(
+            (
+                get_makespan(subcomponent, durations=durations)
+                for subcomponent in component.root
+            ),
+            default=0.0,
+        )
+    elif isinstance(component, DepGroup):
+        return get_makespan(component.series, durations=durations)
+    else:
+        assert_never(component)
@@ -1,9 +1,19 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 from usethis._pipeweld.containers import Series
-from usethis._pipeweld.ops import Instruction
+from usethis._pipeweld.ops import Instruction, Operation
 
 
 class WeldResult(BaseModel):
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    solution: Series
+    instructions: list[Operation]
+
+
+class OptimizeResult(BaseModel):
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
     solution: Series
     instructions: list[Instruction]
+    makespan: float
@@ -1,16 +1,18 @@
 import subprocess
+from pathlib import Path
 
 
 class SubprocessFailedError(Exception):
     pass
 
 
-def call_subprocess(args: list[str]) -> str:
+def call_subprocess(args: list[str], *, cwd: Path | None = None) -> str:
     try:
         process = subprocess.run(
             args,
             check=True,
             capture_output=True,
+            cwd=cwd,
         )
         return process.stdout.decode()
     except subprocess.CalledProcessError as err:
@@ -1,7 +1,12 @@
+import hashlib
+import json
 import os
 import socket
+import threading
+import time
 from collections.abc import Generator
 from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
 
 
@@ -25,3 +30,104 @@ def is_offline() -> bool:
     else:
         s.close()
         return False
+
+
+class GitHubStub:
+    """A local stand-in for the GitHub API, serving the tags of each repository.
+
+    Responses have an ETag, and conditional requests are answered with 304 Not Modified
+    if nothing has changed.
+
+    Attributes:
+        url: The base URL of the API.
+        tags: The tag names for each repository, keyed by 'owner/repo', most recent
+              first.
+        rate_limit: How many more requests are allowed before the rate limit is
+                    exhausted. Requests answered with 304 Not Modified don't count. If
+                    None, there is no limit.
+        paths: The paths which have been requested, in order.
+        statuses: The status code of each response, in order.
+    """
+
+    def __init__(self, url: str) -> None:
+        self.url = url
+        self.tags: dict[str, list[str]] = {}
+        self.rate_limit: int | None = None
+        self.paths: list[str] = []
+        self.statuses: list[int] = []
+        self._lock = threading.Lock()
+
+    def handle(self, request: BaseHTTPRequestHandler) -> None:
+        with self._lock:
+            self.paths.append(request.path)
+            status, body, headers = self._get_response(request)
+            self.statuses.append(status)
+
+        request.send_response(status)
+        for key, value in headers.items():
+            request.send_header(key, value)
+        request.send_header("Content-Length", str(len(body)))
+        request.end_headers()
+        request.wfile.write(body)
+
+    def _get_response(
+        self, request: BaseHTTPRequestHandler
+    ) -> tuple[int, bytes, dict[str, str]]:
+        parts = request.path.strip("/").split("/")
+        names = None
+        if len(parts) == 4 and parts[0] == "repos" and parts[3] == "tags":
+            names = self.tags.get(f"{parts[1]}/{parts[2]}")
+
+        if names is None:
+            status, body = 404, json.dumps({"message": "Not Found"}).encode()
+        else:
+            status, body = 200, json.dumps([{"name": name} for name in names]).encode()
+        etag = f'"{hashlib.sha256(body).hexdigest()}"'
+
+        if status == 200 and request.headers.get("If-None-Match") == etag:
+            return 304, b"", {"ETag": etag}
+
+        headers = {"Content-Type": "application/json"}
+        if self.rate_limit is not None:
+            headers["X-RateLimit-Reset"] = str(int(time.time()) + 60)
+            if self.rate_limit <= 0:
+                headers["X-RateLimit-Remaining"] = "0"
+                body = json.dumps({"message": "API rate limit exceeded"}).encode()
+                return 403, body, headers
+
+            self.rate_limit -= 1
+            headers["X-RateLimit-Remaining"] = str(self.rate_limit)
+
+        if status == 200:
+            headers["ETag"] = etag
+        return status, body, headers
+
+
+@contextmanager
+def serve_github_stub() -> Generator[GitHubStub, None, None]:
+    """Serve a stand-in for the GitHub API on localhost, in a background thread."""
+    stub: GitHubStub
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"  # Keep connections alive for reuse
+
+        def do_GET(self) -> None:
+            stub.handle(self)
+
+        def log_message(self, *args: object) -> None:
+            pass
+
+    class Server(ThreadingHTTPServer):
+        request_queue_size = 64
+
+    server = Server(("127.0.0.1", 0), Handler)
+    host, port = server.server_address[:2]
+    stub = GitHubStub(url=f"http://{host!s}:{port}")
+
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield stub
+    finally:
+        server.shutdown()
+        server.server_close()
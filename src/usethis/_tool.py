@@ -1,17 +1,25 @@
+import shlex
 from abc import abstractmethod
 from pathlib import Path
 from typing import Protocol
 
 from usethis._console import tick_print
+from usethis._files import exists
 from usethis._integrations.bitbucket.anchor import (
     ScriptItemAnchor as BitbucketScriptItemAnchor,
 )
+from usethis._integrations.bitbucket.condition import (
+    LOCKFILE_PATHS,
+    PYPROJECT_PATHS,
+    PYTHON_PATHS,
+    get_changeset_condition,
+)
 from usethis._integrations.bitbucket.schema import Script as BitbucketScript
 from usethis._integrations.bitbucket.schema import Step as BitbucketStep
 from usethis._integrations.pre_commit.hooks import (
-    add_repo,
+    add_repos,
     get_hook_names,
-    remove_hook,
+    remove_hooks,
 )
 from usethis._integrations.pre_commit.schema import (
     FileType,
@@ -21,6 +29,7 @@ from usethis._integrations.pre_commit.schema import (
     LocalRepo,
     UriRepo,
 )
+from usethis._integrations.pre_commit.settings import get_pre_commit_settings
 from usethis._integrations.pyproject.config import PyProjectConfig
 from usethis._integrations.pyproject.core import (
     PyProjectTOMLValueAlreadySetError,
@@ -96,7 +105,7 @@ class Tool(Protocol):
         3. Whether any of the tool's managed pyproject.toml sections are present.
         """
         for file in self.get_managed_files():
-            if file.exists() and file.is_file():
+            if exists(file):
                 return True
         for id_keys in self.get_pyproject_id_keys():
             if do_id_keys_exist(id_keys):
@@ -117,19 +126,9 @@ class Tool(Protocol):
         if not repos:
             return
 
-        # Add the config for this specific tool.
-        for repo_config in repos:
-            if repo_config.hooks is None:
-                continue
-
-            if len(repo_config.hooks) > 1:
-                msg = "Multiple hooks in a single repo not yet supported."
-                raise NotImplementedError(msg)
-
-            for hook in repo_config.hooks:
-                if hook.id not in get_hook_names():
-                    # This will remove the placeholder, if present.
-                    add_repo(repo_config)
+        # Add the config for this specific tool. This will remove the placeholder, if
+        # present.
+        add_repos(repos)
 
     def remove_pre_commit_repo_configs(self) -> None:
         """Remove the tool's pre-commit configuration.
@@ -141,14 +140,16 @@ class Tool(Protocol):
         if not repo_configs:
             return
 
-        for repo_config in repo_configs:
-            if repo_config.hooks is None:
-                continue
-
-            # Remove the config for this specific tool.
-            for hook in repo_config.hooks:
-                if hook.id in get_hook_names():
-                    remove_hook(hook.id)
+        # Remove the config for this specific tool.
+        hook_names = get_hook_names()
+        to_remove = [
+            hook.id
+            for repo_config in repo_configs
+            for hook in repo_config.hooks or []
+            if hook.id in hook_names
+        ]
+        if to_remove:
+            remove_hooks(to_remove)
 
     def add_pyproject_configs(self) -> None:
         """Add the tool's pyproject.toml configurations."""
@@ -241,6 +242,13 @@ class DeptryTool(Tool):
         return [Dependency(name="deptry")]
 
     def get_pre_commit_repos(self) -> list[LocalRepo | UriRepo]:
+        if get_pre_commit_settings().changed_files_only:
+            # deptry needs to see the whole project, but only when it might have
+            # changed its imports or dependencies.
+            files, always_run = "(^pyproject\\.toml|\\.pyi?)$", None
+        else:
+            files, always_run = None, True
+
         return [
             LocalRepo(
                 repo="local",
@@ -248,9 +256,10 @@ class DeptryTool(Tool):
                     HookDefinition(
                         id="deptry",
                         name="deptry",
-                        entry="uv run --frozen deptry src",
+                        entry=_get_hook_entry("deptry", "src"),
                         language=Language("system"),
-                        always_run=True,
+                        files=files,
+                        always_run=always_run,
                         pass_filenames=False,
                     )
                 ],
@@ -269,8 +278,12 @@ class DeptryTool(Tool):
                     [
                         BitbucketScriptItemAnchor(name="install-uv"),
                         "uv run deptry src",
+                        "uv cache prune --ci",
                     ]
                 ),
+                condition=get_changeset_condition(
+                    [*PYTHON_PATHS, *PYPROJECT_PATHS, *LOCKFILE_PATHS]
+                ),
             )
         ]
 
@@ -288,6 +301,7 @@ class PreCommitTool(Tool):
         return [Path(".pre-commit-config.yaml")]
 
     def get_bitbucket_steps(self) -> list[BitbucketStep]:
+        # The hooks could check any kind of file, so there's no changeset condition.
         return [
             BitbucketStep(
                 name="Run pre-commit",
@@ -296,6 +310,7 @@ class PreCommitTool(Tool):
                     [
                         BitbucketScriptItemAnchor(name="install-uv"),
                         "uv run pre-commit run --all-files",
+                        "uv cache prune --ci",
                     ]
                 ),
             )
@@ -312,6 +327,8 @@ class PyprojectFmtTool(Tool):
         return [Dependency(name="pyproject-fmt")]
 
     def get_pre_commit_repos(self) -> list[LocalRepo | UriRepo]:
+        # Newer revs are only looked up by `usethis pre-commit update-revs`, so that
+        # adding the tool doesn't depend on the network.
         return [
             UriRepo(
                 repo="https://github.com/tox-dev/pyproject-fmt",
@@ -340,8 +357,10 @@ class PyprojectFmtTool(Tool):
                     [
                         BitbucketScriptItemAnchor(name="install-uv"),
                         "uv run pyproject-fmt pyproject.toml",
+                        "uv cache prune --ci",
                     ]
                 ),
+                condition=get_changeset_condition(PYPROJECT_PATHS),
             )
         ]
 
@@ -425,6 +444,9 @@ class RuffTool(Tool):
         return [Dependency(name="ruff")]
 
     def get_pre_commit_repos(self) -> list[LocalRepo | UriRepo]:
+        # Ruff is given the changed files, so it needn't always run.
+        always_run = None if get_pre_commit_settings().changed_files_only else True
+
         return [
             LocalRepo(
                 repo="local",
@@ -432,28 +454,25 @@ class RuffTool(Tool):
                     HookDefinition(
                         id="ruff-format",
                         name="ruff-format",
-                        entry="uv run --frozen ruff format --force-exclude",
+                        entry=_get_hook_entry("ruff", "format", "--force-exclude"),
                         language=Language("system"),
                         types_or=FileTypes(
                             [FileType("python"), FileType("pyi"), FileType("jupyter")]
                         ),
-                        always_run=True,
+                        always_run=always_run,
                         require_serial=True,
                     ),
-                ],
-            ),
-            LocalRepo(
-                repo="local",
-                hooks=[
                     HookDefinition(
                         id="ruff",
                         name="ruff",
-                        entry="uv run --frozen ruff check --fix --force-exclude",
+                        entry=_get_hook_entry(
+                            "ruff", "check", "--fix", "--force-exclude"
+                        ),
                         language=Language("system"),
                         types_or=FileTypes(
                             [FileType("python"), FileType("pyi"), FileType("jupyter")]
                         ),
-                        always_run=True,
+                        always_run=always_run,
                         require_serial=True,
                     ),
                 ],
@@ -482,18 +501,40 @@ class RuffTool(Tool):
         return [
             BitbucketStep(
                 name="Run Ruff",
-                caches=["uv"],
+                caches=["uv", "ruff"],
                 script=BitbucketScript(
                     [
                         BitbucketScriptItemAnchor(name="install-uv"),
                         "uv run ruff check --fix",
                         "uv run ruff format",
+                        "uv cache prune --ci",
                     ]
                 ),
+                condition=get_changeset_condition([*PYTHON_PATHS, *PYPROJECT_PATHS]),
             )
         ]
 
 
+def _get_hook_entry(executable: str, *args: str) -> str:
+    """The entry for a local hook which runs a tool from the project's environment.
+
+    By default the executable is run with 'uv run'. With the 'direct-venv' pre-commit
+    setting, it's run from '.venv' directly if it's there, which avoids starting uv for
+    every hook, and otherwise it falls back to 'uv run'.
+    """
+    uv_run_args = ["uv", "run", "--frozen", executable]
+    if not get_pre_commit_settings().direct_venv:
+        return shlex.join([*uv_run_args, *args])
+
+    path = shlex.quote(f".venv/bin/{executable}")
+    script = (
+        f'if [ -x {path} ]; then exec {path} "$@"; '
+        f'else exec {shlex.join(uv_run_args)} "$@"; fi'
+    )
+    # The first argument after the script is the shell's $0, so it's a placeholder.
+    return shlex.join(["sh", "-c", script, "--", *args])
+
+
 ALL_TOOLS: list[Tool] = [
     CoverageTool(),
     DeptryTool(),
@@ -6,8 +6,9 @@ from pathlib import Path
 import pytest
 
 from usethis._config import usethis_config
+from usethis._integrations.github.client import get_github_client
 from usethis._integrations.uv.call import call_subprocess, call_uv_subprocess
-from usethis._test import change_cwd, is_offline
+from usethis._test import GitHubStub, change_cwd, is_offline, serve_github_stub
 
 
 @pytest.fixture(scope="session")
@@ -78,11 +79,28 @@ def _vary_network_conn(request: pytest.FixtureRequest) -> Generator[None, None,
 
     offline = request.param is NetworkConn.OFFLINE
 
-    usethis_config.offline = offline
-    yield
-    usethis_config.offline = False
+    with usethis_config.set(offline=offline):
+        yield
 
 
 @pytest.fixture
 def usethis_dev_dir() -> Path:
     return Path(__file__).parent.parent
+
+
+@pytest.fixture
+def github_stub(
+    tmp_path_factory: pytest.TempPathFactory, monkeypatch: pytest.MonkeyPatch
+) -> Generator[GitHubStub, None, None]:
+    """Serve the GitHub API locally, with an empty cache of responses.
+
+    The tests run online against the stub, whatever the network connection is.
+    """
+    with serve_github_stub() as stub, usethis_config.set(offline=False):
+        monkeypatch.setattr("usethis._integrations.github.client._API_URL", stub.url)
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path_factory.mktemp("cache")))
+        get_github_client.cache_clear()
+        try:
+            yield stub
+        finally:
+            get_github_client.cache_clear()
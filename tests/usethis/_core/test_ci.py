@@ -1,3 +1,4 @@
+import subprocess
 from pathlib import Path
 
 import pytest
@@ -56,9 +57,15 @@ pipelines:
                     contents
                     == """\
 image: atlassian/default-image:3
+clone:
+    depth: 1
 definitions:
     caches:
-        uv: ~/.cache/uv
+        uv:
+            key:
+                files:
+                  - uv.lock
+            path: ~/.cache/uv
     script_items:
       - &install-uv |
         curl -LsSf https://astral.sh/uv/install.sh | sh
@@ -174,9 +181,20 @@ pipelines:
                     contents
                     == """\
 image: atlassian/default-image:3
+clone:
+    depth: 1
 definitions:
     caches:
-        uv: ~/.cache/uv
+        uv:
+            key:
+                files:
+                  - uv.lock
+            path: ~/.cache/uv
+        ruff:
+            key:
+                files:
+                  - pyproject.toml
+            path: .ruff_cache
     script_items:
       - &install-uv |
         curl -LsSf https://astral.sh/uv/install.sh | sh
@@ -189,10 +207,12 @@ pipelines:
             name: Run Ruff
             caches:
               - uv
+              - ruff
             script:
               - *install-uv
               - uv run ruff check --fix
               - uv run ruff format
+              - uv cache prune --ci
 """
                 )
 
@@ -201,6 +221,7 @@ pipelines:
                 assert out == (
                     "✔ Writing 'bitbucket-pipelines.yml'.\n"
                     "✔ Adding cache 'uv' definition to 'bitbucket-pipelines.yml'.\n"
+                    "✔ Adding cache 'ruff' definition to 'bitbucket-pipelines.yml'.\n"
                     "✔ Adding 'Run Ruff' to default pipeline in 'bitbucket-pipelines.yml'.\n"
                     "ℹ Consider `usethis tool pytest` to test your code for the pipeline.\n"  # noqa: RUF001
                     "☐ Run your pipeline via the Bitbucket website.\n"
@@ -225,9 +246,15 @@ pipelines:
                     contents
                     == """\
 image: atlassian/default-image:3
+clone:
+    depth: 1
 definitions:
     caches:
-        uv: ~/.cache/uv
+        uv:
+            key:
+                files:
+                  - uv.lock
+            path: ~/.cache/uv
     script_items:
       - &install-uv |
         curl -LsSf https://astral.sh/uv/install.sh | sh
@@ -243,6 +270,7 @@ pipelines:
             script:
               - *install-uv
               - uv run deptry src
+              - uv cache prune --ci
 """
                 )
 
@@ -279,9 +307,20 @@ pipelines:
                 contents
                 == """\
 image: atlassian/default-image:3
+clone:
+    depth: 1
 definitions:
     caches:
-        uv: ~/.cache/uv
+        uv:
+            key:
+                files:
+                  - uv.lock
+            path: ~/.cache/uv
+        ruff:
+            key:
+                files:
+                  - pyproject.toml
+            path: .ruff_cache
     script_items:
       - &install-uv |
         curl -LsSf https://astral.sh/uv/install.sh | sh
@@ -290,28 +329,33 @@ definitions:
         uv --version
 pipelines:
     default:
-      - step:
-            name: Run pyproject-fmt
-            caches:
-              - uv
-            script:
-              - *install-uv
-              - uv run pyproject-fmt pyproject.toml
-      - step:
-            name: Run Ruff
-            caches:
-              - uv
-            script:
-              - *install-uv
-              - uv run ruff check --fix
-              - uv run ruff format
-      - step:
-            name: Run Deptry
-            caches:
-              - uv
-            script:
-              - *install-uv
-              - uv run deptry src
+      - parallel:
+          - step:
+                name: Run pyproject-fmt
+                caches:
+                  - uv
+                script:
+                  - *install-uv
+                  - uv run pyproject-fmt pyproject.toml
+                  - uv cache prune --ci
+          - step:
+                name: Run Ruff
+                caches:
+                  - uv
+                  - ruff
+                script:
+                  - *install-uv
+                  - uv run ruff check --fix
+                  - uv run ruff format
+                  - uv cache prune --ci
+          - step:
+                name: Run Deptry
+                caches:
+                  - uv
+                script:
+                  - *install-uv
+                  - uv run deptry src
+                  - uv cache prune --ci
 """
             )
 
@@ -322,6 +366,7 @@ pipelines:
                 "✔ Writing 'bitbucket-pipelines.yml'.\n"
                 "✔ Adding cache 'uv' definition to 'bitbucket-pipelines.yml'.\n"
                 "✔ Adding 'Run pyproject-fmt' to default pipeline in 'bitbucket-pipelines.yml'.\n"
+                "✔ Adding cache 'ruff' definition to 'bitbucket-pipelines.yml'.\n"
                 "✔ Adding 'Run Ruff' to default pipeline in 'bitbucket-pipelines.yml'.\n"
                 "✔ Adding 'Run Deptry' to default pipeline in 'bitbucket-pipelines.yml'.\n"
                 "ℹ Consider `usethis tool pytest` to test your code for the pipeline.\n"  # noqa: RUF001
@@ -348,6 +393,7 @@ pipelines:
                 assert out == (
                     "✔ Writing 'bitbucket-pipelines.yml'.\n"
                     "✔ Adding cache 'uv' definition to 'bitbucket-pipelines.yml'.\n"
+                    "✔ Adding cache 'pytest' definition to 'bitbucket-pipelines.yml'.\n"
                     "✔ Adding 'Test on 3.12' to default pipeline in 'bitbucket-pipelines.yml'.\n"
                     "✔ Adding 'Test on 3.13' to default pipeline in 'bitbucket-pipelines.yml'.\n"
                     "☐ Run your pipeline via the Bitbucket website.\n"
@@ -362,6 +408,51 @@ pipelines:
                 contents = (uv_init_dir / "bitbucket-pipelines.yml").read_text()
                 assert "pytest" not in contents
 
+            def test_shards(self, uv_init_dir: Path, capfd: pytest.CaptureFixture[str]):
+                # Arrange
+                (uv_init_dir / "tests").mkdir()
+                (uv_init_dir / "tests" / "conftest.py").touch()
+
+                # Act
+                with change_cwd(uv_init_dir):
+                    use_ci_bitbucket(shards=2)
+
+                # Assert
+                contents = (uv_init_dir / "pyproject.toml").read_text()
+                assert "[tool.usethis.bitbucket]\npytest-shards = 2\n" in contents
+                out, _ = capfd.readouterr()
+                assert out.startswith(
+                    "✔ Setting 'tool.usethis.bitbucket.pytest-shards' to 2 in "
+                    "'pyproject.toml'.\n"
+                )
+                assert "(shard 2/2)" in out
+
+            def test_changeset_conditions(self, uv_init_dir: Path):
+                # Arrange
+                (uv_init_dir / "tests").mkdir()
+                (uv_init_dir / "tests" / "conftest.py").touch()
+                with (uv_init_dir / "pyproject.toml").open("a") as f:
+                    f.write("""
+[tool.usethis.bitbucket]
+changeset-conditions = true
+""")
+
+                # Act
+                with change_cwd(uv_init_dir):
+                    use_ci_bitbucket()
+
+                    # Assert
+                    steps = get_steps_in_default()
+                assert steps
+                for step in steps:
+                    assert step.condition is not None
+                    assert step.condition.changesets.includePaths == [
+                        "**.py",
+                        "pyproject.toml",
+                        "uv.lock",
+                        "bitbucket-pipelines.yml",
+                    ]
+
             def test_unsupported_python_version_removed(self, uv_init_dir: Path):
                 # Arrange
                 (uv_init_dir / "tests").mkdir()
@@ -437,9 +528,20 @@ class TestUpdateBitbucketPytestSteps:
             contents
             == """\
 image: atlassian/default-image:3
+clone:
+    depth: 1
 definitions:
     caches:
-        uv: ~/.cache/uv
+        uv:
+            key:
+                files:
+                  - uv.lock
+            path: ~/.cache/uv
+        pytest:
+            key:
+                files:
+                  - pyproject.toml
+            path: .pytest_cache
     script_items:
       - &install-uv |
         curl -LsSf https://astral.sh/uv/install.sh | sh
@@ -448,20 +550,25 @@ definitions:
         uv --version
 pipelines:
     default:
-      - step:
-            name: Test on 3.12
-            caches:
-              - uv
-            script:
-              - *install-uv
-              - uv run --python 3.12 pytest -x --junitxml=test-reports/report.xml
-      - step:
-            name: Test on 3.13
-            caches:
-              - uv
-            script:
-              - *install-uv
-              - uv run --python 3.13 pytest -x --junitxml=test-reports/report.xml
+      - parallel:
+          - step:
+                name: Test on 3.12
+                caches:
+                  - uv
+                  - pytest
+                script:
+                  - *install-uv
+                  - uv run --python 3.12 pytest -x --junitxml=test-reports/report.xml
+                  - uv cache prune --ci
+          - step:
+                name: Test on 3.13
+                caches:
+                  - uv
+                  - pytest
+                script:
+                  - *install-uv
+                  - uv run --python 3.13 pytest -x --junitxml=test-reports/report.xml
+                  - uv cache prune --ci
 """
         )
 
@@ -470,6 +577,7 @@ pipelines:
         assert out == (
             "✔ Writing 'bitbucket-pipelines.yml'.\n"
             "✔ Adding cache 'uv' definition to 'bitbucket-pipelines.yml'.\n"
+            "✔ Adding cache 'pytest' definition to 'bitbucket-pipelines.yml'.\n"
             "✔ Adding 'Test on 3.12' to default pipeline in 'bitbucket-pipelines.yml'.\n"
             "✔ Adding 'Test on 3.13' to default pipeline in 'bitbucket-pipelines.yml'.\n"
         )
@@ -524,3 +632,186 @@ pipelines:
         assert out == (
             "✔ Removing 'Test on 3.11' from default pipeline in 'bitbucket-pipelines.yml'.\n"
         )
+
+    def test_shards(self, uv_init_dir: Path):
+        # Arrange
+        (uv_init_dir / "pyproject.toml").write_text(
+            """\
+[project]
+requires-python = ">=3.12,<3.13"
+
+[tool.usethis.bitbucket]
+pytest-shards = 2
+"""
+        )
+        (uv_init_dir / "tests").mkdir()
+        for name in ["test_a.py", "test_b.py", "c_test.py", "conftest.py"]:
+            (uv_init_dir / "tests" / name).touch()
+
+        # Act
+        with change_cwd(uv_init_dir):
+            update_bitbucket_pytest_steps()
+
+            # Assert
+            steps = get_steps_in_default()
+            assert [step.name for step in steps] == [
+                "Test on 3.12 (shard 1/2)",
+                "Test on 3.12 (shard 2/2)",
+            ]
+            assert all(step.caches == ["uv", "pytest"] for step in steps)
+
+            # Every test file is in exactly one shard
+            shard_files = []
+            for step in steps:
+                select_cmd = step.script.root[1]
+                assert isinstance(select_cmd, str)
+                result = subprocess.run(
+                    ["sh", "-c", f'{select_cmd}\necho "$SHARD_FILES"'],
+                    capture_output=True,
+                    text=True,
+                    check=True,
+                )
+                shard_files.append(result.stdout.split())
+        assert shard_files == [
+            ["tests/c_test.py", "tests/test_b.py"],
+            ["tests/test_a.py"],
+        ]
+
+        contents = (uv_init_dir / "bitbucket-pipelines.yml").read_text()
+        assert "      - parallel:\n" in contents
+
+    def test_change_shards(self, uv_init_dir: Path):
+        # Arrange
+        (uv_init_dir / "pyproject.toml").write_text(
+            """\
+[project]
+requires-python = ">=3.12,<3.13"
+"""
+        )
+        with change_cwd(uv_init_dir):
+            update_bitbucket_pytest_steps()
+        with (uv_init_dir / "pyproject.toml").open("a") as f:
+            f.write("""
+[tool.usethis.bitbucket]
+pytest-shards = 2
+""")
+
+        # Act
+        with change_cwd(uv_init_dir):
+            update_bitbucket_pytest_steps()
+
+            # Assert
+            assert [step.name for step in get_steps_in_default()] == [
+                "Test on 3.12 (shard 1/2)",
+                "Test on 3.12 (shard 2/2)",
+            ]
+
+    def test_timed_shards(self, uv_init_dir: Path):
+        # Arrange
+        (uv_init_dir / "pyproject.toml").write_text(
+            """\
+[project]
+requires-python = ">=3.12,<3.13"
+
+[tool.usethis.bitbucket]
+pytest-shards = 2
+"""
+        )
+        (uv_init_dir / "tests").mkdir()
+        for name in ["test_a.py", "test_b.py", "test_c.py", "test_d.py"]:
+            (uv_init_dir / "tests" / name).touch()
+        (uv_init_dir / "test-reports").mkdir()
+        (uv_init_dir / "test-reports" / "report.xml").write_text(
+            """\
+<testsuites>
+  <testsuite name="pytest">
+    <testcase classname="tests.test_a" name="test_x" time="6.0" />
+    <testcase classname="tests.test_a.TestY" name="test_y" time="4.0" />
+    <testcase classname="tests.test_b" name="test_z" time="3.0" />
+    <testcase classname="tests.test_c" name="test_w" time="4.0" />
+  </testsuite>
+</testsuites>
+"""
+        )
+
+        # Act
+        with change_cwd(uv_init_dir):
+            update_bitbucket_pytest_steps()
+
+            # A new test file after the shards were computed goes in the first shard,
+            # and a deleted test file is skipped.
+            (uv_init_dir / "tests" / "test_e.py").touch()
+            (uv_init_dir / "tests" / "test_b.py").unlink()
+
+            # Assert
+            shard_files = []
+            for step in get_steps_in_default():
+                select_cmd = step.script.root[1]
+                assert isinstance(select_cmd, str)
+                result = subprocess.run(
+                    ["sh", "-c", f'{select_cmd}\necho "$SHARD_FILES"'],
+                    capture_output=True,
+                    text=True,
+                    check=True,
+                )
+                shard_files.append(result.stdout.split())
+
+        # test_d.py has no timings, so it's assumed to take the mean time of ~5.7s
+        assert shard_files == [
+            ["tests/test_a.py", "tests/test_e.py"],
+            ["tests/test_c.py", "tests/test_d.py"],
+        ]
+
+    def test_rebalanced_for_new_timings(
+        self, uv_init_dir: Path, capfd: pytest.CaptureFixture[str]
+    ):
+        # Arrange
+        (uv_init_dir / "pyproject.toml").write_text(
+            """\
+[project]
+requires-python = ">=3.12,<3.13"
+
+[tool.usethis.bitbucket]
+pytest-shards = 2
+"""
+        )
+        (uv_init_dir / "tests").mkdir()
+        for name in ["test_a.py", "test_b.py", "test_c.py"]:
+            (uv_init_dir / "tests" / name).touch()
+        with change_cwd(uv_init_dir):
+            update_bitbucket_pytest_steps()
+        (uv_init_dir / "test-reports").mkdir()
+        (uv_init_dir / "test-reports" / "report.xml").write_text(
+            """\
+<testsuite name="pytest">
+  <testcase classname="tests.test_a" name="test_x" time="1.0" />
+  <testcase classname="tests.test_b" name="test_y" time="1.0" />
+  <testcase classname="tests.test_c" name="test_z" time="5.0" />
+</testsuite>
+"""
+        )
+        capfd.readouterr()
+
+        # Act
+        with change_cwd(uv_init_dir):
+            update_bitbucket_pytest_steps()
+
+            # Assert
+            steps = get_steps_in_default()
+        assert [step.name for step in steps] == [
+            "Test on 3.12 (shard 1/2)",
+            "Test on 3.12 (shard 2/2)",
+        ]
+        assert steps[1].script.root[1] == (
+            "SHARD_FILES=$(find tests -name 'test_*.py' -o -name '*_test.py' | sort "
+            "| grep -xF -e tests/test_a.py -e tests/test_b.py || true)"
+        )
+        out, _ = capfd.readouterr()
+        assert out.count("Removing") == 2
+        assert out.count("Adding 'Test on") == 2
+
+        # Running again with the same timings doesn't change anything
+        with change_cwd(uv_init_dir):
+            update_bitbucket_pytest_steps()
+        out, _ = capfd.readouterr()
+        assert not out
@@ -0,0 +1,93 @@
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+from usethis._config import usethis_config
+from usethis._core.fleet import run_fleet
+
+
+def _write_marker() -> None:
+    print("Writing marker.")
+    (usethis_config.cpd() / "marker.txt").write_text("hello\n")
+
+
+def _fail() -> None:
+    msg = f"Failed in '{usethis_config.cpd().name}'."
+    raise ValueError(msg)
+
+
+def _exit() -> None:
+    sys.exit(1)
+
+
+def _slow_in_first() -> None:
+    if usethis_config.cpd().name == "a":
+        time.sleep(1)
+
+
+class TestRunFleet:
+    def test_runs_in_each_project(self, tmp_path: Path):
+        # Arrange
+        paths = [tmp_path / "a", tmp_path / "b", tmp_path / "c"]
+        for path in paths:
+            path.mkdir()
+
+        # Act
+        results = list(run_fleet(paths, _write_marker, jobs=2))
+
+        # Assert
+        assert sorted(result.path for result in results) == paths
+        assert all(result.success for result in results)
+        assert all(result.output == "Writing marker.\n" for result in results)
+        for path in paths:
+            assert (path / "marker.txt").read_text() == "hello\n"
+        assert not (Path.cwd() / "marker.txt").exists()
+
+    def test_yielded_as_completed(self, tmp_path: Path):
+        # Arrange
+        paths = [tmp_path / "a", tmp_path / "b"]
+        for path in paths:
+            path.mkdir()
+
+        # Act
+        results = list(run_fleet(paths, _slow_in_first, jobs=2))
+
+        # Assert
+        assert [result.path for result in results] == [tmp_path / "b", tmp_path / "a"]
+
+    def test_failure(self, tmp_path: Path):
+        # Arrange
+        (tmp_path / "a").mkdir()
+
+        # Act
+        (result,) = run_fleet([tmp_path / "a"], _fail)
+
+        # Assert
+        assert not result.success
+        assert result.output == "ValueError: Failed in 'a'.\n"
+
+    def test_exit_code(self, tmp_path: Path):
+        # Act
+        (result,) = run_fleet([tmp_path], _exit)
+
+        # Assert
+        assert not result.success
+
+    def test_missing_directory(self, tmp_path: Path):
+        # Act
+        (result,) = run_fleet([tmp_path / "missing"], _write_marker)
+
+        # Assert
+        assert not result.success
+        assert "FileNotFoundError" in result.output
+
+    def test_no_paths(self):
+        # Act, Assert
+        assert list(run_fleet([], _write_marker)) == []
+
+    def test_no_uv_jobs(self, tmp_path: Path):
+        # Act, Assert
+        with pytest.raises(ValueError, match="at least 1"):
+            list(run_fleet([tmp_path], _write_marker, uv_jobs=0))
@@ -0,0 +1,118 @@
+from pathlib import Path
+
+import pytest
+
+from usethis._config import usethis_config
+from usethis._core.pre_commit import update_pre_commit_revs
+from usethis._files import DiskFileSystem, use_filesystem
+from usethis._test import GitHubStub, change_cwd
+
+
+class TestUpdatePreCommitRevs:
+    def test_updates_github_repos(
+        self,
+        tmp_path: Path,
+        github_stub: GitHubStub,
+        capfd: pytest.CaptureFixture[str],
+    ):
+        # Arrange
+        github_stub.tags["tox-dev/pyproject-fmt"] = ["v2.6.0", "v2.5.0"]
+        github_stub.tags["astral-sh/ruff-pre-commit"] = ["v0.9.4"]
+        (tmp_path / ".pre-commit-config.yaml").write_text("""\
+repos:
+  - repo: https://github.com/tox-dev/pyproject-fmt
+    rev: v2.5.0 # pinned
+    hooks:
+      - id: pyproject-fmt
+  - repo: https://github.com/astral-sh/ruff-pre-commit.git
+    rev: v0.9.4
+    hooks:
+      - id: ruff
+  - repo: https://gitlab.com/foo/bar
+    rev: v1.0.0
+    hooks:
+      - id: bar
+  - repo: local
+    hooks:
+      - id: deptry
+        name: deptry
+        entry: uv run --frozen deptry src
+        language: system
+""")
+
+        # Act
+        with change_cwd(tmp_path), use_filesystem(DiskFileSystem()) as fs:
+            update_pre_commit_revs()
+
+        # Assert
+        assert fs.counts["write_text"] == 1
+        assert (
+            (tmp_path / ".pre-commit-config.yaml").read_text()
+            == """\
+repos:
+  - repo: https://github.com/tox-dev/pyproject-fmt
+    rev: v2.6.0 # pinned
+    hooks:
+      - id: pyproject-fmt
+  - repo: https://github.com/astral-sh/ruff-pre-commit.git
+    rev: v0.9.4
+    hooks:
+      - id: ruff
+  - repo: https://gitlab.com/foo/bar
+    rev: v1.0.0
+    hooks:
+      - id: bar
+  - repo: local
+    hooks:
+      - id: deptry
+        name: deptry
+        entry: uv run --frozen deptry src
+        language: system
+"""
+        )
+        assert sorted(github_stub.paths) == [
+            "/repos/astral-sh/ruff-pre-commit/tags",
+            "/repos/tox-dev/pyproject-fmt/tags",
+        ]
+        out, _ = capfd.readouterr()
+        assert out == (
+            "✔ Updating rev of 'https://github.com/tox-dev/pyproject-fmt' to 'v2.6.0'.\n"
+        )
+
+    def test_offline_keeps_pinned(
+        self,
+        tmp_path: Path,
+        github_stub: GitHubStub,
+        capfd: pytest.CaptureFixture[str],
+    ):
+        # Arrange
+        content = """\
+repos:
+  - repo: https://github.com/tox-dev/pyproject-fmt
+    rev: v2.5.0
+    hooks:
+      - id: pyproject-fmt
+"""
+        (tmp_path / ".pre-commit-config.yaml").write_text(content)
+
+        # Act
+        with change_cwd(tmp_path), usethis_config.set(offline=True):
+            update_pre_commit_revs()
+
+        # Assert
+        assert (tmp_path / ".pre-commit-config.yaml").read_text() == content
+        assert not github_stub.paths
+        out, _ = capfd.readouterr()
+        assert (
+            "Keeping rev 'v2.5.0' for 'https://github.com/tox-dev/pyproject-fmt'" in out
+        )
+
+    def test_no_config(self, tmp_path: Path, capfd: pytest.CaptureFixture[str]):
+        # Act
+        with change_cwd(tmp_path):
+            update_pre_commit_revs()
+
+        # Assert
+        out, _ = capfd.readouterr()
+        assert out == "ℹ No GitHub repos to update in '.pre-commit-config.yaml'.\n"  # noqa: RUF001
+        assert not (tmp_path / ".pre-commit-config.yaml").exists()
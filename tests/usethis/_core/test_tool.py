@@ -1,5 +1,6 @@
 import os
 import subprocess
+import threading
 from pathlib import Path
 
 import pytest
@@ -14,7 +15,9 @@ from usethis._core.tool import (
     use_pytest,
     use_requirements_txt,
     use_ruff,
+    use_tools,
 )
+from usethis._files import MemoryFileSystem, use_filesystem
 from usethis._integrations.pre_commit.hooks import (
     _HOOK_ORDER,
     get_hook_names,
@@ -46,6 +49,151 @@ class TestAllHooksList:
                 assert hook_name in _HOOK_ORDER
 
 
+class TestUseTools:
+    def test_in_memory(self, tmp_path: Path):
+        # Arrange
+        project_dir = tmp_path / "virtual"
+        fs = MemoryFileSystem(
+            {project_dir / "pyproject.toml": '[project]\nname = "example"\n'}
+        )
+
+        # Act
+        with (
+            usethis_config.set(project_dir=project_dir, offline=True),
+            use_filesystem(fs),
+        ):
+            use_tools([(use_ruff, False), (use_pytest, False)])
+
+        # Assert
+        assert not project_dir.exists()
+        pyproject = fs.files[project_dir / "pyproject.toml"]
+        assert "[tool.ruff]" in pyproject
+        assert "[tool.pytest.ini_options]" in pyproject
+        assert '"ruff"' in pyproject
+        assert '"pytest"' in pyproject
+        assert project_dir / "tests" / "conftest.py" in fs.files
+
+    def test_pre_commit_hooks_download_overlaps(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ):
+        # Arrange
+        (tmp_path / "pyproject.toml").write_text('[project]\nname = "example"\n')
+        (tmp_path / "uv.lock").write_text(
+            '[[package]]\nname = "pre-commit"\nversion = "4.0.1"\n'
+        )
+        calls = []
+        is_downloading = threading.Event()
+        is_added = threading.Event()
+        overlaps = []
+
+        def mock_call_subprocess(args: list[str], *, cwd: Path | None = None) -> str:
+            if args[-1] == "install-hooks":
+                is_downloading.set()
+                # The download is still going when the dependencies are added.
+                overlaps.append(is_added.wait(timeout=10))
+            elif args[1] == "add":
+                overlaps.append(is_downloading.wait(timeout=10))
+                is_added.set()
+            calls.append(args[1:])
+            return ""
+
+        monkeypatch.setattr(
+            "usethis._integrations.uv.call.call_subprocess", mock_call_subprocess
+        )
+
+        # Act
+        with change_cwd(tmp_path), usethis_config.set(offline=False):
+            use_tools([(use_ruff, False), (use_pre_commit, False)])
+
+        # Assert
+        assert overlaps == [True, True]
+        assert [
+            "tool",
+            "run",
+            "--from",
+            "pre-commit==4.0.1",
+            "pre-commit",
+            "install-hooks",
+        ] in calls
+        assert ["run", "pre-commit", "install"] in calls
+        assert ["run", "pre-commit", "install-hooks"] not in calls
+        assert (tmp_path / ".pre-commit-config.yaml").exists()
+
+    def test_pre_commit_hooks_download_unlocked(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ):
+        # Arrange
+        (tmp_path / "pyproject.toml").write_text('[project]\nname = "example"\n')
+        calls = []
+
+        def mock_call_subprocess(args: list[str], *, cwd: Path | None = None) -> str:
+            calls.append(args[1:])
+            return ""
+
+        monkeypatch.setattr(
+            "usethis._integrations.uv.call.call_subprocess", mock_call_subprocess
+        )
+
+        # Act
+        with change_cwd(tmp_path):
+            use_tools([(use_pre_commit, False)])
+
+        # Assert
+        assert calls[-2:] == [
+            ["run", "pre-commit", "install"],
+            ["run", "pre-commit", "install-hooks"],
+        ]
+
+    def test_files_written_before_uv_runs(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ):
+        # Arrange
+        (tmp_path / "pyproject.toml").write_text('[project]\nname = "example"\n')
+        calls = []
+
+        def mock_call_subprocess(args: list[str], *, cwd: Path | None = None) -> str:
+            pyproject = (tmp_path / "pyproject.toml").read_text()
+            calls.append((args[1], "[tool.ruff]" in pyproject))
+            return ""
+
+        monkeypatch.setattr(
+            "usethis._integrations.uv.call.call_subprocess", mock_call_subprocess
+        )
+
+        # Act
+        with change_cwd(tmp_path):
+            use_tools([(use_ruff, False), (use_requirements_txt, False)])
+
+        # Assert
+        assert calls == [("add", True), ("lock", True), ("export", True)]
+
+    def test_pre_commit_uninstalled_after_files_written(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ):
+        # Arrange
+        (tmp_path / "pyproject.toml").write_text('[project]\nname = "example"\n')
+        (tmp_path / ".pre-commit-config.yaml").write_text("repos: []\n")
+        calls = []
+
+        def mock_call_subprocess(args: list[str], *, cwd: Path | None = None) -> str:
+            is_config = (tmp_path / ".pre-commit-config.yaml").exists()
+            calls.append((args[1:], is_config))
+            return ""
+
+        monkeypatch.setattr(
+            "usethis._integrations.uv.call.call_subprocess", mock_call_subprocess
+        )
+
+        # Act
+        with change_cwd(tmp_path):
+            use_tools([(use_pre_commit, True)])
+
+        # Assert
+        assert calls == [
+            (["run", "--with", "pre-commit", "pre-commit", "uninstall"], False)
+        ]
+
+
 class TestCoverage:
     class TestAdd:
         @pytest.mark.usefixtures("_vary_network_conn")
@@ -719,7 +867,11 @@ pipelines:
 image: atlassian/default-image:3
 definitions:
     caches:
-        uv: ~/.cache/uv
+        uv:
+            key:
+                files:
+                  - uv.lock
+            path: ~/.cache/uv
     script_items:
       - &install-uv |
         curl -LsSf https://astral.sh/uv/install.sh | sh
@@ -1158,7 +1310,11 @@ pipelines:
 image: atlassian/default-image:3
 definitions:
     caches:
-        uv: ~/.cache/uv
+        uv:
+            key:
+                files:
+                  - uv.lock
+            path: ~/.cache/uv
     script_items:
       - &install-uv |
         curl -LsSf https://astral.sh/uv/install.sh | sh
@@ -9,7 +9,7 @@ from usethis._integrations.bitbucket.cache import (
     remove_cache,
 )
 from usethis._integrations.bitbucket.config import add_bitbucket_pipeline_config
-from usethis._integrations.bitbucket.schema import CachePath
+from usethis._integrations.bitbucket.schema import CacheExpanded, CachePath, Key
 from usethis._test import change_cwd
 
 
@@ -26,7 +26,13 @@ class TestAddCaches:
             add_caches(cache_by_name)
 
             # Assert
-            default_cache_by_name = {"uv": Cache(CachePath("~/.cache/uv"))}
+            default_cache_by_name = {
+                "uv": Cache(
+                    CacheExpanded(
+                        key=Key(files=["uv.lock"]), path=CachePath("~/.cache/uv")
+                    )
+                )
+            }
             assert get_cache_by_name() == cache_by_name | default_cache_by_name
             out, err = capfd.readouterr()
             assert not err
@@ -37,7 +43,10 @@ class TestAddCaches:
     def test_already_exists(self, uv_init_dir: Path):
         # Arrange
         cache_by_name = {
-            "uv": Cache(CachePath("~/.cache/uv"))  # uv cache is in the default config
+            # uv cache is in the default config
+            "uv": Cache(
+                CacheExpanded(key=Key(files=["uv.lock"]), path=CachePath("~/.cache/uv"))
+            )
         }
 
         # Act
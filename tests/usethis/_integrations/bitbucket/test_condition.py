@@ -0,0 +1,29 @@
+from pathlib import Path
+
+from usethis._integrations.bitbucket.condition import get_changeset_condition
+from usethis._integrations.bitbucket.schema import Changesets, Condition
+from usethis._test import change_cwd
+
+
+class TestGetChangesetCondition:
+    def test_disabled(self, tmp_path: Path):
+        with change_cwd(tmp_path):
+            assert get_changeset_condition(["pyproject.toml"]) is None
+
+    def test_enabled(self, tmp_path: Path):
+        # Arrange
+        (tmp_path / "pyproject.toml").write_text("""\
+[tool.usethis.bitbucket]
+changeset-conditions = true
+""")
+
+        # Act
+        with change_cwd(tmp_path):
+            condition = get_changeset_condition(["**.py", "pyproject.toml"])
+
+        # Assert
+        assert condition == Condition(
+            changesets=Changesets(
+                includePaths=["**.py", "pyproject.toml", "bitbucket-pipelines.yml"]
+            )
+        )
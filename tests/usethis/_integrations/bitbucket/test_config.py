@@ -24,9 +24,15 @@ class TestAddBitbucketPipelineConfig:
         assert content == (
             """\
 image: atlassian/default-image:3
+clone:
+    depth: 1
 definitions:
     caches:
-        uv: ~/.cache/uv
+        uv:
+            key:
+                files:
+                  - uv.lock
+            path: ~/.cache/uv
     script_items:
       - &install-uv |
         curl -LsSf https://astral.sh/uv/install.sh | sh
@@ -21,6 +21,8 @@ class TestEditBitbucketPipelinesYAML:
             (tmp_path / "bitbucket-pipelines.yml").read_text()
             == """\
 image: atlassian/default-image:3
+clone:
+    depth: 1
 """
         )
         out, err = capfd.readouterr()
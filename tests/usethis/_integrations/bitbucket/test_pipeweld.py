@@ -1,11 +1,13 @@
 from pathlib import Path
-from uuid import UUID
 
 import pytest
 
 from usethis._integrations.bitbucket.errors import UnexpectedImportPipelineError
+from usethis._integrations.bitbucket.io_ import edit_bitbucket_pipelines_yaml
 from usethis._integrations.bitbucket.pipeweld import (
     apply_pipeweld_instruction,
+    apply_pipeweld_move_via_doc,
+    apply_pipeweld_removal_via_doc,
     get_pipeweld_pipeline_from_default,
     get_pipeweld_step,
 )
@@ -31,7 +33,7 @@ from usethis._integrations.bitbucket.schema import (
 )
 from usethis._pipeweld.containers import DepGroup, depgroup, parallel, series
 from usethis._pipeweld.func import _get_instructions_for_insertion
-from usethis._pipeweld.ops import InsertParallel, InsertSuccessor
+from usethis._pipeweld.ops import InsertParallel, InsertSuccessor, Move, Remove
 from usethis._test import change_cwd
 
 
@@ -50,6 +52,8 @@ class TestApplyPipeweldInstruction:
             content
             == """\
 image: atlassian/default-image:3
+clone:
+    depth: 1
 pipelines:
     default:
       - step:
@@ -304,6 +308,380 @@ pipelines:
 """
             )
 
+    class TestInsertParallel:
+        def test_step_item(self, tmp_path: Path):
+            # Arrange
+            (tmp_path / "bitbucket-pipelines.yml").write_text(
+                """\
+image: atlassian/default-image:3
+pipelines:
+    default:
+      - step:
+            name: bar
+            script:
+              - echo bar
+"""
+            )
+
+            # Act
+            with change_cwd(tmp_path):
+                apply_pipeweld_instruction(
+                    InsertParallel(step="foo", after=None),
+                    new_step=Step(name="foo", script=Script(["echo foo"])),
+                )
+
+            # Assert
+            content = (tmp_path / "bitbucket-pipelines.yml").read_text()
+            assert (
+                content
+                == """\
+image: atlassian/default-image:3
+pipelines:
+    default:
+      - parallel:
+          - step:
+                name: bar
+                script:
+                  - echo bar
+          - step:
+                name: foo
+                script:
+                  - echo foo
+"""
+            )
+
+        def test_parallel_item(self, tmp_path: Path):
+            # Arrange
+            (tmp_path / "bitbucket-pipelines.yml").write_text(
+                """\
+image: atlassian/default-image:3
+pipelines:
+    default:
+      - step:
+            name: bar
+            script:
+              - echo bar
+      - parallel:
+          - step:
+                name: baz
+                script:
+                  - echo baz
+          - step:
+                name: qux
+                script:
+                  - echo qux
+"""
+            )
+
+            # Act
+            with change_cwd(tmp_path):
+                apply_pipeweld_instruction(
+                    InsertParallel(step="foo", after="bar"),
+                    new_step=Step(name="foo", script=Script(["echo foo"])),
+                )
+
+            # Assert
+            content = (tmp_path / "bitbucket-pipelines.yml").read_text()
+            assert (
+                content
+                == """\
+image: atlassian/default-image:3
+pipelines:
+    default:
+      - step:
+            name: bar
+            script:
+              - echo bar
+      - parallel:
+          - step:
+                name: baz
+                script:
+                  - echo baz
+          - step:
+                name: qux
+                script:
+                  - echo qux
+          - step:
+                name: foo
+                script:
+                  - echo foo
+"""
+            )
+
+        def test_parallel_expanded(self, tmp_path: Path):
+            # Arrange
+            (tmp_path / "bitbucket-pipelines.yml").write_text(
+                """\
+image: atlassian/default-image:3
+pipelines:
+    default:
+      - parallel:
+            fail-fast: true
+            steps:
+              - step:
+                    name: baz
+                    script:
+                      - echo baz
+"""
+            )
+
+            # Act
+            with change_cwd(tmp_path):
+                apply_pipeweld_instruction(
+                    InsertParallel(step="foo", after=None),
+                    new_step=Step(name="foo", script=Script(["echo foo"])),
+                )
+
+            # Assert
+            content = (tmp_path / "bitbucket-pipelines.yml").read_text()
+            assert (
+                content
+                == """\
+image: atlassian/default-image:3
+pipelines:
+    default:
+      - parallel:
+            fail-fast: true
+            steps:
+              - step:
+                    name: baz
+                    script:
+                      - echo baz
+              - step:
+                    name: foo
+                    script:
+                      - echo foo
+"""
+            )
+
+        def test_stage_item(self, tmp_path: Path):
+            # Arrange
+            (tmp_path / "bitbucket-pipelines.yml").write_text(
+                """\
+image: atlassian/default-image:3
+pipelines:
+    default:
+      - stage:
+            steps:
+              - step:
+                    name: baz
+                    script:
+                      - echo baz
+"""
+            )
+
+            # Act
+            with change_cwd(tmp_path):
+                apply_pipeweld_instruction(
+                    InsertParallel(step="foo", after=None),
+                    new_step=Step(name="foo", script=Script(["echo foo"])),
+                )
+
+            # Assert
+            content = (tmp_path / "bitbucket-pipelines.yml").read_text()
+            assert (
+                content
+                == """\
+image: atlassian/default-image:3
+pipelines:
+    default:
+      - step:
+            name: foo
+            script:
+              - echo foo
+      - stage:
+            steps:
+              - step:
+                    name: baz
+                    script:
+                      - echo baz
+"""
+            )
+
+        def test_no_successor(self, tmp_path: Path):
+            # Arrange
+            (tmp_path / "bitbucket-pipelines.yml").write_text(
+                """\
+image: atlassian/default-image:3
+pipelines:
+    default:
+      - step:
+            name: bar
+            script:
+              - echo bar
+"""
+            )
+
+            # Act
+            with change_cwd(tmp_path):
+                apply_pipeweld_instruction(
+                    InsertParallel(step="foo", after="bar"),
+                    new_step=Step(name="foo", script=Script(["echo foo"])),
+                )
+
+            # Assert
+            content = (tmp_path / "bitbucket-pipelines.yml").read_text()
+            assert (
+                content
+                == """\
+image: atlassian/default-image:3
+pipelines:
+    default:
+      - step:
+            name: bar
+            script:
+              - echo bar
+      - step:
+            name: foo
+            script:
+              - echo foo
+"""
+            )
+
+
+_PIPELINE_WITH_PARALLEL_AND_STAGE = """\
+image: atlassian/default-image:3
+pipelines:
+    default:
+      - step:
+            name: foo
+            script:
+              - echo foo
+      - parallel:
+          - step:
+                name: bar
+                script:
+                  - echo bar
+          - step:
+                name: baz
+                script:
+                  - echo baz
+      - stage:
+            name: qux
+            steps:
+              - step:
+                    name: quux
+                    script:
+                      - echo quux
+"""
+
+
+class TestApplyPipeweldRemovalViaDoc:
+    def test_step_item(self, tmp_path: Path):
+        # Arrange
+        (tmp_path / "bitbucket-pipelines.yml").write_text(
+            _PIPELINE_WITH_PARALLEL_AND_STAGE
+        )
+
+        # Act
+        with change_cwd(tmp_path), edit_bitbucket_pipelines_yaml() as doc:
+            step = apply_pipeweld_removal_via_doc(Remove(step="foo"), doc=doc)
+
+            # Assert
+            assert step is not None
+            assert step.name == "foo"
+            assert get_pipeweld_pipeline_from_default(doc.model) == series(
+                parallel("bar", "baz"), depgroup("quux", config_group="qux")
+            )
+
+    def test_parallel_item_collapses(self, tmp_path: Path):
+        # Arrange
+        (tmp_path / "bitbucket-pipelines.yml").write_text(
+            _PIPELINE_WITH_PARALLEL_AND_STAGE
+        )
+
+        # Act
+        with change_cwd(tmp_path), edit_bitbucket_pipelines_yaml() as doc:
+            apply_pipeweld_removal_via_doc(Remove(step="bar"), doc=doc)
+
+            # Assert
+            assert get_pipeweld_pipeline_from_default(doc.model) == series(
+                "foo", "baz", depgroup("quux", config_group="qux")
+            )
+
+    def test_stage_item_emptied(self, tmp_path: Path):
+        # Arrange
+        (tmp_path / "bitbucket-pipelines.yml").write_text(
+            _PIPELINE_WITH_PARALLEL_AND_STAGE
+        )
+
+        # Act
+        with change_cwd(tmp_path), edit_bitbucket_pipelines_yaml() as doc:
+            step = apply_pipeweld_removal_via_doc(Remove(step="quux"), doc=doc)
+
+            # Assert
+            assert step is not None
+            assert step.name == "quux"
+            assert get_pipeweld_pipeline_from_default(doc.model) == series(
+                "foo", parallel("bar", "baz")
+            )
+
+    def test_missing(self, tmp_path: Path):
+        # Arrange
+        (tmp_path / "bitbucket-pipelines.yml").write_text(
+            _PIPELINE_WITH_PARALLEL_AND_STAGE
+        )
+
+        # Act
+        with change_cwd(tmp_path), edit_bitbucket_pipelines_yaml() as doc:
+            step = apply_pipeweld_removal_via_doc(Remove(step="missing"), doc=doc)
+
+            # Assert
+            assert step is None
+            assert get_pipeweld_pipeline_from_default(doc.model) == series(
+                "foo", parallel("bar", "baz"), depgroup("quux", config_group="qux")
+            )
+
+
+class TestApplyPipeweldMoveViaDoc:
+    def test_successor(self, tmp_path: Path):
+        # Arrange
+        (tmp_path / "bitbucket-pipelines.yml").write_text(
+            _PIPELINE_WITH_PARALLEL_AND_STAGE
+        )
+
+        # Act
+        with change_cwd(tmp_path), edit_bitbucket_pipelines_yaml() as doc:
+            apply_pipeweld_move_via_doc(Move(step="bar", after="foo"), doc=doc)
+
+            # Assert
+            assert get_pipeweld_pipeline_from_default(doc.model) == series(
+                "foo", "bar", "baz", depgroup("quux", config_group="qux")
+            )
+
+    def test_parallel(self, tmp_path: Path):
+        # Arrange
+        (tmp_path / "bitbucket-pipelines.yml").write_text(
+            _PIPELINE_WITH_PARALLEL_AND_STAGE
+        )
+
+        # Act
+        with change_cwd(tmp_path), edit_bitbucket_pipelines_yaml() as doc:
+            apply_pipeweld_move_via_doc(
+                Move(step="foo", after="bar", parallel=True), doc=doc
+            )
+
+            # Assert
+            # The successor of 'bar' is the stage, so 'foo' comes before it instead.
+            assert get_pipeweld_pipeline_from_default(doc.model) == series(
+                parallel("bar", "baz"), "foo", depgroup("quux", config_group="qux")
+            )
+
+    def test_to_start(self, tmp_path: Path):
+        # Arrange
+        (tmp_path / "bitbucket-pipelines.yml").write_text(
+            _PIPELINE_WITH_PARALLEL_AND_STAGE
+        )
+
+        # Act
+        with change_cwd(tmp_path), edit_bitbucket_pipelines_yaml() as doc:
+            apply_pipeweld_move_via_doc(Move(step="quux", after=None), doc=doc)
+
+            # Assert
+            assert get_pipeweld_pipeline_from_default(doc.model) == series(
+                "quux", "foo", parallel("bar", "baz")
+            )
+
 
 class TestGetInstructionsForInsertion:
     class TestStr:
@@ -664,8 +1042,7 @@ class TestGetPipeweldPipelineFromDefault:
             )
         )
         assert dg.config_group.startswith("Unnamed Stage ")
-        uuid = dg.config_group.removeprefix("Unnamed Stage ")
-        UUID(uuid)  # Raises no error
+        assert get_pipeweld_pipeline_from_default(model) == result
 
 
 class TestGetPipeweldStep:
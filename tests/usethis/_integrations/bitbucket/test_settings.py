@@ -0,0 +1,46 @@
+from pathlib import Path
+
+import pytest
+
+from usethis._integrations.bitbucket.errors import InvalidBitbucketSettingsError
+from usethis._integrations.bitbucket.settings import (
+    BitbucketSettings,
+    get_bitbucket_settings,
+)
+from usethis._test import change_cwd
+
+
+class TestGetBitbucketSettings:
+    def test_no_pyproject_toml(self, tmp_path: Path):
+        with change_cwd(tmp_path):
+            assert get_bitbucket_settings() == BitbucketSettings()
+
+    def test_pytest_shards(self, tmp_path: Path):
+        (tmp_path / "pyproject.toml").write_text("""\
+[tool.usethis.bitbucket]
+pytest-shards = 4
+""")
+
+        with change_cwd(tmp_path):
+            assert get_bitbucket_settings().pytest_shards == 4
+
+    def test_invalid_pytest_shards(self, tmp_path: Path):
+        (tmp_path / "pyproject.toml").write_text("""\
+[tool.usethis.bitbucket]
+pytest-shards = 0
+""")
+
+        with (
+            change_cwd(tmp_path),
+            pytest.raises(InvalidBitbucketSettingsError, match="pytest-shards"),
+        ):
+            get_bitbucket_settings()
+
+    def test_changeset_conditions(self, tmp_path: Path):
+        (tmp_path / "pyproject.toml").write_text("""\
+[tool.usethis.bitbucket]
+changeset-conditions = true
+""")
+
+        with change_cwd(tmp_path):
+            assert get_bitbucket_settings().changeset_conditions
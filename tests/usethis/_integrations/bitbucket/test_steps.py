@@ -2,10 +2,13 @@ from pathlib import Path
 
 import pytest
 
+import usethis._integrations.yaml.io_
 from usethis._config import usethis_config
 from usethis._integrations.bitbucket.anchor import ScriptItemAnchor
 from usethis._integrations.bitbucket.io_ import edit_bitbucket_pipelines_yaml
 from usethis._integrations.bitbucket.schema import (
+    Changesets,
+    Condition,
     Parallel,
     ParallelExpanded,
     ParallelItem,
@@ -23,10 +26,13 @@ from usethis._integrations.bitbucket.steps import (
     UnexpectedImportPipelineError,
     _add_step_caches_via_doc,
     add_bitbucket_step_in_default,
+    add_bitbucket_steps_in_default,
     add_placeholder_step_in_default,
     get_defined_script_items_via_doc,
+    get_steps_in_default,
     get_steps_in_pipeline_item,
     remove_bitbucket_step_from_default,
+    update_bitbucket_steps_in_default,
 )
 from usethis._test import change_cwd
 
@@ -58,18 +64,21 @@ pipelines:
         with open(uv_init_dir / "bitbucket-pipelines.yml") as f:
             contents = f.read()
         assert (
-            # N.B. the step is added as soon as possible, i.e. at the top of the pipeline
+            # N.B. the step is added as soon as possible, i.e. in parallel at the top of
+            # the pipeline
             contents
             == """\
 image: atlassian/default-image:3
 pipelines:
     default:
-      - step:
-            name: Greeting
-            script:
-              - echo 'Why, hello!'
-      - step:
-            script: ["echo 'Hello, world!'"]
+      - parallel:
+          - step:
+                script:
+                  - echo 'Hello, world!'
+          - step:
+                name: Greeting
+                script:
+                  - echo 'Why, hello!'
 """
         )
 
@@ -135,7 +144,11 @@ pipelines: {}
 image: atlassian/default-image:3
 definitions:
     caches:
-        uv: ~/.cache/uv
+        uv:
+            key:
+                files:
+                  - uv.lock
+            path: ~/.cache/uv
 pipelines:
     default:
       - step:
@@ -227,6 +240,8 @@ pipelines:
             contents
             == """\
 image: atlassian/default-image:3
+clone:
+    depth: 1
 pipelines:
     default:
       - step:
@@ -270,6 +285,8 @@ pipelines:
                 contents
                 == """\
 image: atlassian/default-image:3
+clone:
+    depth: 1
 definitions:
     script_items:
       - &install-uv |
@@ -343,25 +360,317 @@ definitions:
         source $HOME/.local/bin/env
         export UV_LINK_MODE=copy
         uv --version
+pipelines:
+    default:
+      - parallel:
+          - step:
+                name: Greeting
+                script:
+                  - *install-uv
+                  - echo 'Hello, world!'
+          - step:
+                name: Farewell
+                script:
+                  - *install-uv
+                  - echo 'Goodbye!'
+"""
+        )
+        out, err = capfd.readouterr()
+        assert out == (
+            "✔ Adding 'Farewell' to default pipeline in 'bitbucket-pipelines.yml'.\n"
+        )
+        assert not err
+
+
+class TestAddBitbucketStepsInDefault:
+    def test_single_edit(
+        self,
+        uv_init_dir: Path,
+        capfd: pytest.CaptureFixture[str],
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        with change_cwd(uv_init_dir):
+            # Arrange
+            with usethis_config.set(quiet=True):
+                add_placeholder_step_in_default()
+
+            writes = []
+            write_text = usethis._integrations.yaml.io_.write_text
+
+            def _write_text(path: Path, text: str) -> None:
+                writes.append(path)
+                write_text(path, text)
+
+            monkeypatch.setattr(
+                usethis._integrations.yaml.io_, "write_text", _write_text
+            )
+
+            # Act
+            add_bitbucket_steps_in_default(
+                [
+                    Step(
+                        name="Test on 3.13",
+                        caches=["uv"],
+                        script=Script(
+                            [ScriptItemAnchor(name="install-uv"), "echo 'Two'"]
+                        ),
+                    ),
+                    Step(
+                        name="Run pre-commit",
+                        caches=["uv", "pre-commit"],
+                        script=Script(
+                            [ScriptItemAnchor(name="install-uv"), "echo 'One'"]
+                        ),
+                    ),
+                    Step(name="Run pre-commit", script=Script(["echo 'Again'"])),
+                ]
+            )
+
+            # Assert
+            assert len(writes) == 1
+            assert (uv_init_dir / "bitbucket-pipelines.yml").read_text() == (
+                """\
+image: atlassian/default-image:3
+clone:
+    depth: 1
+definitions:
+    caches:
+        uv:
+            key:
+                files:
+                  - uv.lock
+            path: ~/.cache/uv
+        pre-commit:
+            key:
+                files:
+                  - .pre-commit-config.yaml
+            path: ~/.cache/pre-commit
+    script_items:
+      - &install-uv |
+        curl -LsSf https://astral.sh/uv/install.sh | sh
+        source $HOME/.local/bin/env
+        export UV_LINK_MODE=copy
+        uv --version
 pipelines:
     default:
       - step:
-            name: Farewell
+            name: Run pre-commit
+            caches:
+              - uv
+              - pre-commit
             script:
               - *install-uv
-              - echo 'Goodbye!'
+              - echo 'One'
       - step:
-            name: Greeting
+            name: Test on 3.13
+            caches:
+              - uv
             script:
               - *install-uv
-              - echo 'Hello, world!'
+              - echo 'Two'
 """
-        )
+            )
+            out, err = capfd.readouterr()
+            assert not err
+            assert out == (
+                "✔ Adding 'Test on 3.13' to default pipeline in 'bitbucket-pipelines.yml'.\n"
+                "✔ Adding cache 'pre-commit' definition to 'bitbucket-pipelines.yml'.\n"
+                "✔ Adding 'Run pre-commit' to default pipeline in 'bitbucket-pipelines.yml'.\n"
+            )
+
+    def test_nothing_new(self, uv_init_dir: Path, capfd: pytest.CaptureFixture[str]):
+        # Arrange
+        step = Step(name="Greeting", script=Script(["echo 'Hello, world!'"]))
+        with change_cwd(uv_init_dir):
+            add_bitbucket_steps_in_default([step])
+            capfd.readouterr()
+
+            # Act
+            add_bitbucket_steps_in_default([step, step])
+
+        # Assert
+        out, err = capfd.readouterr()
+        assert not out
+        assert not err
+
+
+class TestUpdateBitbucketStepsInDefault:
+    def test_single_edit(
+        self,
+        uv_init_dir: Path,
+        capfd: pytest.CaptureFixture[str],
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        with change_cwd(uv_init_dir):
+            # Arrange
+            with usethis_config.set(quiet=True):
+                add_bitbucket_steps_in_default(
+                    [
+                        Step(
+                            name="Run pre-commit",
+                            caches=["uv", "pre-commit"],
+                            script=Script(
+                                [ScriptItemAnchor(name="install-uv"), "echo 'One'"]
+                            ),
+                        ),
+                        Step(
+                            name="Test on 3.12",
+                            caches=["uv"],
+                            script=Script(
+                                [ScriptItemAnchor(name="install-uv"), "echo 'Two'"]
+                            ),
+                        ),
+                    ]
+                )
+
+            writes = []
+            write_text = usethis._integrations.yaml.io_.write_text
+
+            def _write_text(path: Path, text: str) -> None:
+                writes.append(path)
+                write_text(path, text)
+
+            monkeypatch.setattr(
+                usethis._integrations.yaml.io_, "write_text", _write_text
+            )
+
+            # Act
+            update_bitbucket_steps_in_default(
+                add=[
+                    Step(
+                        name="Test on 3.13",
+                        caches=["uv"],
+                        script=Script(
+                            [ScriptItemAnchor(name="install-uv"), "echo 'Three'"]
+                        ),
+                    ),
+                ],
+                remove=[
+                    Step(name="Run pre-commit", script=Script(["echo 'One'"])),
+                ],
+            )
+
+            # Assert
+            assert len(writes) == 1
+            assert (uv_init_dir / "bitbucket-pipelines.yml").read_text() == (
+                """\
+image: atlassian/default-image:3
+clone:
+    depth: 1
+definitions:
+    caches:
+        uv:
+            key:
+                files:
+                  - uv.lock
+            path: ~/.cache/uv
+    script_items:
+      - &install-uv |
+        curl -LsSf https://astral.sh/uv/install.sh | sh
+        source $HOME/.local/bin/env
+        export UV_LINK_MODE=copy
+        uv --version
+pipelines:
+    default:
+      - parallel:
+          - step:
+                name: Test on 3.12
+                caches:
+                  - uv
+                script:
+                  - *install-uv
+                  - echo 'Two'
+          - step:
+                name: Test on 3.13
+                caches:
+                  - uv
+                script:
+                  - *install-uv
+                  - echo 'Three'
+"""
+            )
+            out, err = capfd.readouterr()
+            assert not err
+            assert out == (
+                "✔ Removing 'Run pre-commit' from default pipeline in 'bitbucket-pipelines.yml'.\n"
+                "✔ Adding 'Test on 3.13' to default pipeline in 'bitbucket-pipelines.yml'.\n"
+                "✔ Removing cache 'pre-commit' definition from 'bitbucket-pipelines.yml'.\n"
+            )
+
+    def test_remove_last_step(self, uv_init_dir: Path):
+        with change_cwd(uv_init_dir):
+            # Arrange
+            step = Step(name="Greeting", script=Script(["echo 'Hello, world!'"]))
+            add_bitbucket_steps_in_default([step])
+
+            # Act
+            update_bitbucket_steps_in_default(add=[], remove=[step])
+
+            # Assert
+            with edit_bitbucket_pipelines_yaml() as doc:
+                assert doc.model.pipelines is not None
+                assert doc.model.pipelines.default is not None
+                (item,) = doc.model.pipelines.default.root.root
+                assert isinstance(item, StepItem)
+                assert item.step.name == "Placeholder - add your own steps!"
+
+    def test_no_file(self, uv_init_dir: Path):
+        # Act
+        with change_cwd(uv_init_dir):
+            update_bitbucket_steps_in_default(
+                add=[], remove=[Step(name="Greeting", script=Script(["echo hi"]))]
+            )
+
+        # Assert
+        assert not (uv_init_dir / "bitbucket-pipelines.yml").exists()
+
+    def test_condition_set(self, uv_init_dir: Path, capfd: pytest.CaptureFixture[str]):
+        with change_cwd(uv_init_dir):
+            # Arrange
+            step = Step(name="Greeting", script=Script(["echo 'Hello, world!'"]))
+            with usethis_config.set(quiet=True):
+                add_bitbucket_steps_in_default([step])
+            condition = Condition(changesets=Changesets(includePaths=["**.py"]))
+
+            # Act
+            update_bitbucket_steps_in_default(
+                add=[step.model_copy(update={"condition": condition})], remove=[]
+            )
+
+            # Assert
+            (step,) = get_steps_in_default()
+            assert step.condition == condition
+        contents = (uv_init_dir / "bitbucket-pipelines.yml").read_text()
+        assert contents.endswith("""\
+            condition:
+                changesets:
+                    includePaths:
+                      - '**.py'
+""")
         out, err = capfd.readouterr()
+        assert not err
         assert out == (
-            "✔ Adding 'Farewell' to default pipeline in 'bitbucket-pipelines.yml'.\n"
+            "✔ Setting condition for 'Greeting' in 'bitbucket-pipelines.yml'.\n"
         )
-        assert not err
+
+    def test_condition_kept(self, uv_init_dir: Path, capfd: pytest.CaptureFixture[str]):
+        with change_cwd(uv_init_dir):
+            # Arrange
+            condition = Condition(changesets=Changesets(includePaths=["docs/**"]))
+            step = Step(name="Greeting", script=Script(["echo 'Hello, world!'"]))
+            with usethis_config.set(quiet=True):
+                add_bitbucket_steps_in_default(
+                    [step.model_copy(update={"condition": condition})]
+                )
+
+            # Act
+            update_bitbucket_steps_in_default(add=[step], remove=[])
+
+            # Assert
+            (step,) = get_steps_in_default()
+            assert step.condition == condition
+        out, _ = capfd.readouterr()
+        assert not out
 
 
 class TestRemoveBitbucketStepFromDefault:
@@ -640,7 +949,11 @@ pipelines:
 image: atlassian/default-image:3
 definitions:
     caches:
-        uv: ~/.cache/uv
+        uv:
+            key:
+                files:
+                  - uv.lock
+            path: ~/.cache/uv
     script_items:
       - &install-uv |
         curl -LsSf https://astral.sh/uv/install.sh | sh
@@ -842,7 +1155,11 @@ pipelines:
 image: atlassian/default-image:3
 definitions:
     caches:
-        uv: ~/.cache/uv
+        uv:
+            key:
+                files:
+                  - uv.lock
+            path: ~/.cache/uv
     script_items:
       - &install-uv |
         curl -LsSf https://astral.sh/uv/install.sh | sh
@@ -943,9 +1260,15 @@ class TestGetStepsInPipelineItem:
 class TestAddPlaceholderStepInDefault:
     EXPECTED_YML_SIMPLE_PLACEHOLDER = """\
 image: atlassian/default-image:3
+clone:
+    depth: 1
 definitions:
     caches:
-        uv: ~/.cache/uv
+        uv:
+            key:
+                files:
+                  - uv.lock
+            path: ~/.cache/uv
     script_items:
       - &install-uv |
         curl -LsSf https://astral.sh/uv/install.sh | sh
@@ -1110,10 +1433,10 @@ image: atlassian/default-image:3
         )
 
         # Act, Assert
-        assert set(_CACHE_LOOKUP.keys()) == {"uv", "pre-commit"}
+        assert set(_CACHE_LOOKUP.keys()) == {"uv", "pre-commit", "ruff", "pytest"}
         match = (
             "Unrecognized cache name 'unrecognized' in step 'Greeting'. "
-            "Supported caches are 'uv' and 'pre-commit'."
+            "Supported caches are 'uv', 'pre-commit', 'ruff', 'pytest'."
         )
         with (
             change_cwd(tmp_path),
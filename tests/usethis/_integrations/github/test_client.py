@@ -0,0 +1,159 @@
+import time
+from pathlib import Path
+
+import pytest
+
+from usethis._config import usethis_config
+from usethis._integrations.github.client import GitHubClient, _parse_retry_after
+from usethis._integrations.github.errors import GitHubAPIError, GitHubRateLimitError
+from usethis._test import GitHubStub
+
+
+@pytest.fixture
+def client(github_stub: GitHubStub, tmp_path: Path) -> GitHubClient:
+    return GitHubClient(api_url=github_stub.url, cache_dir=tmp_path / "cache")
+
+
+class TestGitHubClient:
+    class TestGetJSON:
+        def test_fetched(self, github_stub: GitHubStub, client: GitHubClient):
+            github_stub.tags["foo/bar"] = ["v1.0.0"]
+
+            assert client.get_json("/repos/foo/bar/tags") == [{"name": "v1.0.0"}]
+            assert github_stub.statuses == [200]
+
+        def test_not_found(self, client: GitHubClient):
+            with pytest.raises(GitHubAPIError, match="404"):
+                client.get_json("/repos/foo/bar/tags")
+
+        def test_fresh_cache_used(self, github_stub: GitHubStub, client: GitHubClient):
+            github_stub.tags["foo/bar"] = ["v1.0.0"]
+
+            client.get_json("/repos/foo/bar/tags")
+            client.get_json("/repos/foo/bar/tags")
+
+            assert github_stub.statuses == [200]
+
+        def test_cache_shared_between_clients(
+            self, github_stub: GitHubStub, client: GitHubClient
+        ):
+            github_stub.tags["foo/bar"] = ["v1.0.0"]
+            client.get_json("/repos/foo/bar/tags")
+
+            other = GitHubClient(api_url=client.api_url, cache_dir=client.cache_dir)
+
+            assert other.get_json("/repos/foo/bar/tags") == [{"name": "v1.0.0"}]
+            assert github_stub.statuses == [200]
+
+        def test_revalidated_when_stale(
+            self,
+            github_stub: GitHubStub,
+            client: GitHubClient,
+            monkeypatch: pytest.MonkeyPatch,
+        ):
+            # Arrange
+            monkeypatch.setattr("usethis._integrations.github.client._CACHE_TTL", 0)
+            github_stub.tags["foo/bar"] = ["v1.0.0"]
+            client.get_json("/repos/foo/bar/tags")
+
+            # Act
+            unchanged = client.get_json("/repos/foo/bar/tags")
+            github_stub.tags["foo/bar"] = ["v2.0.0", "v1.0.0"]
+            changed = client.get_json("/repos/foo/bar/tags")
+
+            # Assert
+            assert unchanged == [{"name": "v1.0.0"}]
+            assert changed == [{"name": "v2.0.0"}, {"name": "v1.0.0"}]
+            assert github_stub.statuses == [200, 304, 200]
+
+        def test_offline(self, github_stub: GitHubStub, client: GitHubClient):
+            github_stub.tags["foo/bar"] = ["v1.0.0"]
+
+            with (
+                usethis_config.set(offline=True),
+                pytest.raises(GitHubAPIError, match="while offline"),
+            ):
+                client.get_json("/repos/foo/bar/tags")
+
+            assert not github_stub.paths
+
+    class TestRateLimit:
+        def test_exhausted(self, github_stub: GitHubStub, client: GitHubClient):
+            github_stub.tags["foo/bar"] = ["v1.0.0"]
+            github_stub.rate_limit = 0
+
+            with pytest.raises(GitHubRateLimitError):
+                client.get_json("/repos/foo/bar/tags")
+
+        def test_no_requests_until_reset(
+            self, github_stub: GitHubStub, client: GitHubClient
+        ):
+            # Arrange
+            github_stub.tags["foo/bar"] = ["v1.0.0"]
+            github_stub.tags["foo/baz"] = ["v1.0.0"]
+            github_stub.rate_limit = 1
+            client.get_json("/repos/foo/bar/tags")
+
+            # Act
+            with pytest.raises(GitHubRateLimitError, match="resets at"):
+                client.get_json("/repos/foo/baz/tags")
+
+            # Assert
+            assert github_stub.paths == ["/repos/foo/bar/tags"]
+
+        def test_stale_cache_used(
+            self,
+            github_stub: GitHubStub,
+            client: GitHubClient,
+            monkeypatch: pytest.MonkeyPatch,
+        ):
+            # Arrange
+            monkeypatch.setattr("usethis._integrations.github.client._CACHE_TTL", 0)
+            github_stub.tags["foo/bar"] = ["v1.0.0"]
+            client.get_json("/repos/foo/bar/tags")
+            github_stub.tags["foo/bar"] = ["v2.0.0"]
+            github_stub.rate_limit = 0
+
+            # Act, Assert
+            assert client.get_json("/repos/foo/bar/tags") == [{"name": "v1.0.0"}]
+
+    class TestGetJSONMany:
+        def test_in_order(self, github_stub: GitHubStub, client: GitHubClient):
+            # Arrange
+            for idx in range(20):
+                github_stub.tags[f"foo/repo-{idx}"] = [f"v{idx}"]
+            paths = [f"/repos/foo/repo-{idx}/tags" for idx in range(20)]
+
+            # Act
+            responses = client.get_json_many([*paths, "/repos/foo/missing/tags"])
+
+            # Assert
+            assert responses[:-1] == [[{"name": f"v{idx}"}] for idx in range(20)]
+            assert isinstance(responses[-1], GitHubAPIError)
+
+        def test_offline_respected(self, github_stub: GitHubStub, client: GitHubClient):
+            with usethis_config.set(offline=True):
+                responses = client.get_json_many(["/repos/foo/bar/tags"])
+
+            assert isinstance(responses[0], GitHubAPIError)
+            assert not github_stub.paths
+
+        def test_empty(self, client: GitHubClient):
+            assert client.get_json_many([]) == []
+
+
+class TestParseRetryAfter:
+    def test_seconds(self):
+        reset = _parse_retry_after("120")
+
+        assert reset is not None
+        assert 0 < reset - time.time() <= 120
+
+    def test_http_date(self):
+        assert _parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 1445412480
+
+    def test_unparsable_ignored(self):
+        assert _parse_retry_after("soon") is None
+
+    def test_missing(self):
+        assert _parse_retry_after(None) is None
@@ -1,55 +1,68 @@
 import pytest
-import requests
 
+from usethis._config import usethis_config
 from usethis._integrations.github.tags import (
     GitHubTagError,
     NoGitHubTagsFoundError,
     get_github_latest_tag,
+    get_github_latest_tags,
 )
+from usethis._test import GitHubStub
 
 
 class TestGetGitHubLatestTag:
-    def test_mock(self, monkeypatch: pytest.MonkeyPatch):
-        def mock_get(*args, **kwargs):
-            class MockResponse:
-                def json(self):
-                    return [{"name": "v1.0.0"}]
+    def test_stub(self, github_stub: GitHubStub):
+        github_stub.tags["foo/bar"] = ["v1.0.0", "v0.9.0"]
 
-                def raise_for_status(self):
-                    pass
+        assert get_github_latest_tag(owner="foo", repo="bar") == "v1.0.0"
 
-            return MockResponse()
+    def test_http_error(self, github_stub: GitHubStub):
+        with pytest.raises(GitHubTagError, match="Failed to fetch tags"):
+            get_github_latest_tag(owner="foo", repo="bar")
 
-        monkeypatch.setattr("requests.get", mock_get)
+    def test_no_tags(self, github_stub: GitHubStub):
+        github_stub.tags["foo/bar"] = []
 
-        assert get_github_latest_tag(owner="foo", repo="bar") == "v1.0.0"
+        with pytest.raises(NoGitHubTagsFoundError):
+            get_github_latest_tag(owner="foo", repo="bar")
 
-    def test_http_error(self, monkeypatch: pytest.MonkeyPatch):
-        def mock_get(*args, **kwargs):
-            class MockResponse:
-                def raise_for_status(self):
-                    msg = "Failed to fetch tags"
-                    raise requests.exceptions.HTTPError(msg)
+    def test_cached(self, github_stub: GitHubStub):
+        github_stub.tags["foo/bar"] = ["v1.0.0"]
 
-            return MockResponse()
+        get_github_latest_tag(owner="foo", repo="bar")
+        github_stub.tags["foo/bar"] = ["v2.0.0"]
 
-        monkeypatch.setattr("requests.get", mock_get)
+        assert get_github_latest_tag(owner="foo", repo="bar") == "v1.0.0"
+        assert len(github_stub.paths) == 1
 
-        with pytest.raises(GitHubTagError, match="Failed to fetch tags"):
-            get_github_latest_tag(owner="foo", repo="bar")
+    def test_offline_uses_cache(self, github_stub: GitHubStub):
+        github_stub.tags["foo/bar"] = ["v1.0.0"]
+        get_github_latest_tag(owner="foo", repo="bar")
+
+        with usethis_config.set(offline=True):
+            assert get_github_latest_tag(owner="foo", repo="bar") == "v1.0.0"
+        assert len(github_stub.paths) == 1
 
-    def test_no_tags(self, monkeypatch: pytest.MonkeyPatch):
-        def mock_get(*args, **kwargs):
-            class MockResponse:
-                def json(self):
-                    return []
+    def test_offline_without_cache(self, github_stub: GitHubStub):
+        with (
+            usethis_config.set(offline=True),
+            pytest.raises(GitHubTagError, match="while offline"),
+        ):
+            get_github_latest_tag(owner="foo", repo="bar")
+        assert not github_stub.paths
 
-                def raise_for_status(self):
-                    pass
 
-            return MockResponse()
+class TestGetGitHubLatestTags:
+    def test_several(self, github_stub: GitHubStub):
+        # Arrange
+        for idx in range(20):
+            github_stub.tags[f"foo/repo-{idx}"] = [f"v{idx}.0.0"]
+        repos = [("foo", f"repo-{idx}") for idx in range(20)]
 
-        monkeypatch.setattr("requests.get", mock_get)
+        # Act
+        tags = get_github_latest_tags([*repos, ("foo", "missing")])
 
-        with pytest.raises(NoGitHubTagsFoundError):
-            get_github_latest_tag(owner="foo", repo="bar")
+        # Assert
+        assert [tags[repo] for repo in repos] == [f"v{idx}.0.0" for idx in range(20)]
+        assert isinstance(tags["foo", "missing"], GitHubTagError)
+        assert len(github_stub.paths) == 21
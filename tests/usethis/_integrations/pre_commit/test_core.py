@@ -1,15 +1,18 @@
+import threading
 from pathlib import Path
 
 import pytest
 
 from usethis._integrations.pre_commit.core import (
     install_pre_commit_hooks,
+    install_pre_commit_hooks_in_background,
     remove_pre_commit_config,
     uninstall_pre_commit_hooks,
 )
 from usethis._integrations.pre_commit.errors import PreCommitInstallationError
 from usethis._integrations.pre_commit.hooks import add_placeholder_hook
 from usethis._integrations.uv.deps import Dependency, add_deps_to_group
+from usethis._integrations.uv.errors import UVSubprocessFailedError
 from usethis._test import change_cwd
 
 
@@ -84,6 +87,100 @@ class TestInstallPreCommitHooks:
             install_pre_commit_hooks()
 
 
+class TestInstallPreCommitHooksInBackground:
+    def test_overlaps_and_joins(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+        # Arrange
+        calls = []
+        started = threading.Event()
+        release = threading.Event()
+
+        def mock_call_uv_subprocess(args: list[str]) -> str:
+            if args[-1] == "install-hooks":
+                started.set()
+                release.wait(timeout=10)
+            calls.append(args)
+            return ""
+
+        monkeypatch.setattr(
+            "usethis._integrations.pre_commit.core.call_uv_subprocess",
+            mock_call_uv_subprocess,
+        )
+
+        # Act
+        with change_cwd(tmp_path), install_pre_commit_hooks_in_background():
+            install_pre_commit_hooks()
+
+            # Assert: the hook environments are still downloading
+            assert started.wait(timeout=10)
+            assert calls == [["run", "pre-commit", "install"]]
+            release.set()
+
+        assert calls[-1] == ["run", "pre-commit", "install-hooks"]
+
+    def test_hook_types(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+        # Arrange
+        (tmp_path / ".pre-commit-config.yaml").write_text("""\
+repos:
+  - repo: local
+    hooks:
+      - id: deptry
+        stages:
+          - pre-push
+default_install_hook_types:
+  - pre-commit
+  - pre-push
+""")
+        calls = []
+
+        def mock_call_uv_subprocess(args: list[str]) -> str:
+            calls.append(args)
+            return ""
+
+        monkeypatch.setattr(
+            "usethis._integrations.pre_commit.core.call_uv_subprocess",
+            mock_call_uv_subprocess,
+        )
+
+        # Act
+        with change_cwd(tmp_path), install_pre_commit_hooks_in_background():
+            install_pre_commit_hooks()
+
+        # Assert
+        assert calls[0] == [
+            "run",
+            "pre-commit",
+            "install",
+            "--hook-type",
+            "pre-commit",
+            "--hook-type",
+            "pre-push",
+        ]
+
+    def test_err_on_exit(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+        # Arrange
+        def mock_call_uv_subprocess(args: list[str]) -> str:
+            if args[-1] == "install-hooks":
+                msg = "Download failed"
+                raise UVSubprocessFailedError(msg)
+            return ""
+
+        monkeypatch.setattr(
+            "usethis._integrations.pre_commit.core.call_uv_subprocess",
+            mock_call_uv_subprocess,
+        )
+
+        def install():
+            with install_pre_commit_hooks_in_background():
+                install_pre_commit_hooks()
+
+        # Act, Assert
+        with (
+            change_cwd(tmp_path),
+            pytest.raises(PreCommitInstallationError, match="Download failed"),
+        ):
+            install()
+
+
 class TestUninstallPreCommitHooks:
     @pytest.mark.usefixtures("_vary_network_conn")
     def test_message_and_file(
@@ -2,13 +2,16 @@ from pathlib import Path
 
 import pytest
 
+from usethis._integrations.pre_commit.errors import DuplicatedHookNameError
 from usethis._integrations.pre_commit.hooks import (
-    DuplicatedHookNameError,
     _get_placeholder_repo_config,
     add_placeholder_hook,
     add_repo,
+    add_repos,
     get_hook_names,
+    get_install_hook_types,
     remove_hook,
+    remove_hooks,
 )
 from usethis._integrations.pre_commit.schema import (
     HookDefinition,
@@ -112,6 +115,246 @@ repos:
         )
 
 
+class TestAddRepos:
+    def test_ordered_in_one_edit(self, tmp_path: Path):
+        # Arrange
+        def _repo(hook_id: str) -> LocalRepo:
+            return LocalRepo(
+                repo="local",
+                hooks=[
+                    HookDefinition(
+                        id=hook_id,
+                        name=hook_id,
+                        entry=f"uv run --frozen {hook_id}",
+                        language=Language("system"),
+                    )
+                ],
+            )
+
+        # Act
+        with change_cwd(tmp_path):
+            add_repos(
+                [_repo("validate-pyproject"), _repo("deptry"), _repo("pyproject-fmt")]
+            )
+            hook_names = get_hook_names()
+
+        # Assert
+        assert hook_names == ["validate-pyproject", "pyproject-fmt", "deptry"]
+
+    def test_existing_skipped(self, tmp_path: Path):
+        # Arrange
+        (tmp_path / ".pre-commit-config.yaml").write_text("""\
+repos:
+  - repo: local
+    hooks:
+      - id: deptry
+        name: deptry
+        entry: uv run --frozen deptry src
+        language: system
+""")
+        repo = LocalRepo(
+            repo="local",
+            hooks=[
+                HookDefinition(
+                    id="deptry",
+                    name="deptry",
+                    entry="uv run --frozen deptry .",
+                    language=Language("system"),
+                )
+            ],
+        )
+
+        # Act
+        with change_cwd(tmp_path):
+            add_repos([repo])
+            hook_names = get_hook_names()
+
+        # Assert
+        assert hook_names == ["deptry"]
+        assert "deptry src" in (tmp_path / ".pre-commit-config.yaml").read_text()
+
+    def test_stages_from_settings(self, tmp_path: Path):
+        # Arrange
+        (tmp_path / "pyproject.toml").write_text("""\
+[tool.usethis.pre-commit.stages]
+deptry = ["pre-push"]
+""")
+        repo = LocalRepo(
+            repo="local",
+            hooks=[HookDefinition(id="ruff"), HookDefinition(id="deptry")],
+        )
+
+        # Act
+        with change_cwd(tmp_path):
+            add_repos([repo])
+            hook_types = get_install_hook_types()
+
+        # Assert
+        assert (
+            (tmp_path / ".pre-commit-config.yaml").read_text()
+            == """\
+repos:
+  - repo: local
+    hooks:
+      - id: ruff
+      - id: deptry
+        stages:
+          - pre-push
+default_install_hook_types:
+  - pre-commit
+  - pre-push
+"""
+        )
+        assert hook_types == ["pre-commit", "pre-push"]
+
+    def test_manual_stage_not_installed(self, tmp_path: Path):
+        # Arrange
+        (tmp_path / "pyproject.toml").write_text("""\
+[tool.usethis.pre-commit.stages]
+deptry = ["manual"]
+""")
+        repo = LocalRepo(repo="local", hooks=[HookDefinition(id="deptry")])
+
+        # Act
+        with change_cwd(tmp_path):
+            add_repos([repo])
+            hook_types = get_install_hook_types()
+
+        # Assert
+        assert (
+            "stages:\n          - manual"
+            in (tmp_path / ".pre-commit-config.yaml").read_text()
+        )
+        assert hook_types == ["pre-commit"]
+
+    def test_same_source_merged(self, tmp_path: Path):
+        # Arrange
+        (tmp_path / ".pre-commit-config.yaml").write_text("""\
+repos:
+  - repo: https://github.com/example/hooks
+    rev: v1.0.0
+    hooks:
+      - id: validate-pyproject
+""")
+        repo = UriRepo(
+            repo="https://github.com/example/hooks",
+            rev="v1.0.0",
+            hooks=[HookDefinition(id="pyproject-fmt")],
+        )
+
+        # Act
+        with change_cwd(tmp_path):
+            add_repos([repo])
+
+        # Assert
+        assert (
+            (tmp_path / ".pre-commit-config.yaml").read_text()
+            == """\
+repos:
+  - repo: https://github.com/example/hooks
+    rev: v1.0.0
+    hooks:
+      - id: validate-pyproject
+      - id: pyproject-fmt
+"""
+        )
+
+    def test_different_rev_not_merged(self, tmp_path: Path):
+        # Arrange
+        (tmp_path / ".pre-commit-config.yaml").write_text("""\
+repos:
+  - repo: https://github.com/example/hooks
+    rev: v1.0.0
+    hooks:
+      - id: validate-pyproject
+""")
+        repo = UriRepo(
+            repo="https://github.com/example/hooks",
+            rev="v2.0.0",
+            hooks=[HookDefinition(id="pyproject-fmt")],
+        )
+
+        # Act
+        with change_cwd(tmp_path):
+            add_repos([repo])
+
+        # Assert
+        assert (
+            (tmp_path / ".pre-commit-config.yaml").read_text()
+            == """\
+repos:
+  - repo: https://github.com/example/hooks
+    rev: v1.0.0
+    hooks:
+      - id: validate-pyproject
+  - repo: https://github.com/example/hooks
+    rev: v2.0.0
+    hooks:
+      - id: pyproject-fmt
+"""
+        )
+
+    def test_merged_into_start_of_next_repo(self, tmp_path: Path):
+        # Arrange
+        (tmp_path / ".pre-commit-config.yaml").write_text("""\
+repos:
+  - repo: https://github.com/example/validate
+    rev: v1.0.0
+    hooks:
+      - id: validate-pyproject
+  - repo: local
+    hooks:
+      - id: ruff
+""")
+        repo = LocalRepo(repo="local", hooks=[HookDefinition(id="pyproject-fmt")])
+
+        # Act
+        with change_cwd(tmp_path):
+            add_repos([repo])
+            hook_names = get_hook_names()
+
+        # Assert
+        assert hook_names == ["validate-pyproject", "pyproject-fmt", "ruff"]
+        assert (tmp_path / ".pre-commit-config.yaml").read_text().count("repo:") == 2
+
+
+class TestRemoveHooks:
+    def test_several(self, tmp_path: Path, capfd: pytest.CaptureFixture[str]):
+        # Arrange
+        (tmp_path / ".pre-commit-config.yaml").write_text("""\
+repos:
+  - repo: local
+    hooks:
+      - id: bar
+        name: bar
+        entry: bar
+        language: python
+      - id: baz
+        name: baz
+        entry: baz
+        language: python
+  - repo: local
+    hooks:
+      - id: qux
+        name: qux
+        entry: qux
+        language: python
+""")
+
+        # Act
+        with change_cwd(tmp_path):
+            remove_hooks(["bar", "qux", "missing"])
+            hook_names = get_hook_names()
+
+        # Assert
+        assert hook_names == ["baz"]
+        out, _ = capfd.readouterr()
+        assert out == (
+            "✔ Removing hook 'bar' from '.pre-commit-config.yaml'.\n"
+            "✔ Removing hook 'qux' from '.pre-commit-config.yaml'.\n"
+        )
+
+
 class TestRemoveHook:
     def test_empty(self, tmp_path: Path):
         with change_cwd(tmp_path):
@@ -0,0 +1,172 @@
+from pathlib import Path
+
+import pytest
+
+from usethis._integrations.pre_commit.errors import DuplicatedHookNameError
+from usethis._integrations.pre_commit.hooks import add_repo, add_repos, get_hook_names
+from usethis._integrations.pre_commit.index import HookIndex
+from usethis._integrations.pre_commit.schema import (
+    HookDefinition,
+    JsonSchemaForPreCommitConfigYaml,
+    LocalRepo,
+    MetaRepo,
+    UriRepo,
+)
+from usethis._test import change_cwd
+
+
+def _model(*repo_hooks: list[str]) -> JsonSchemaForPreCommitConfigYaml:
+    return JsonSchemaForPreCommitConfigYaml(
+        repos=[
+            LocalRepo(repo="local", hooks=[HookDefinition(id=id_) for id_ in hooks])
+            for hooks in repo_hooks
+        ]
+    )
+
+
+class TestHookIndex:
+    def test_positions(self):
+        index = HookIndex(_model(["a", "b"], ["c"]))
+
+        assert "b" in index
+        assert "d" not in index
+        assert len(index) == 3
+        assert index.position("c") == (1, 0)
+        assert index.names() == ["a", "b", "c"]
+
+    def test_duplicated_raises(self):
+        with pytest.raises(
+            DuplicatedHookNameError, match="Hook name 'a' is duplicated"
+        ):
+            HookIndex(_model(["a"], ["b", "a"]))
+
+    def test_insert_repo(self):
+        model = _model(["a"], ["b"])
+        index = HookIndex(model)
+
+        index.insert_repo(LocalRepo(repo="local", hooks=[HookDefinition(id="c")]), at=1)
+
+        assert index.names() == ["a", "c", "b"]
+        assert index.position("b") == (2, 0)
+        assert index.names() == HookIndex(model).names()
+
+    def test_insert_duplicate_raises(self):
+        index = HookIndex(_model(["a"]))
+
+        with pytest.raises(DuplicatedHookNameError):
+            index.insert_repo(
+                LocalRepo(repo="local", hooks=[HookDefinition(id="a")]), at=0
+            )
+
+    def test_insert_hook(self):
+        model = _model(["a", "b"], ["c"])
+        index = HookIndex(model)
+
+        index.insert_hook(HookDefinition(id="d"), repo_idx=0, at=1)
+
+        assert index.names() == ["a", "d", "b", "c"]
+        assert index.position("b") == (0, 2)
+        assert index.position("c") == (1, 0)
+        assert index.names() == HookIndex(model).names()
+
+    def test_names_updated(self):
+        index = HookIndex(_model(["a"], ["b"]))
+        assert index.names() == ["a", "b"]
+
+        index.insert_hook(HookDefinition(id="c"), repo_idx=0, at=0)
+        index.remove_hook("b")
+
+        assert index.names() == ["c", "a"]
+
+    def test_insert_hook_duplicate_raises(self):
+        model = _model(["a"], ["b"])
+        index = HookIndex(model)
+
+        with pytest.raises(DuplicatedHookNameError):
+            index.insert_hook(HookDefinition(id="b"), repo_idx=0, at=1)
+        assert [hook.id for hook in model.repos[0].hooks or []] == ["a"]
+
+    def test_remove_hook(self):
+        model = _model(["a", "b", "c"], ["d"])
+        index = HookIndex(model)
+
+        index.remove_hook("a")
+
+        assert "a" not in index
+        assert index.position("c") == (0, 1)
+        assert [hook.id for hook in model.repos[0].hooks or []] == ["b", "c"]
+
+    def test_remove_last_hook_removes_repo(self):
+        model = _model(["a"], ["b"], ["c"])
+        index = HookIndex(model)
+
+        index.remove_hook("b")
+
+        assert len(model.repos) == 2
+        assert index.position("c") == (1, 0)
+
+    def test_last_repo_with_hooks(self):
+        model = _model(["a"], [])
+        model.repos.append(MetaRepo(hooks=None))
+
+        assert HookIndex(model).last_repo_with_hooks() == 0
+        assert HookIndex(_model()).last_repo_with_hooks() is None
+
+
+def _write_many_hooks_config(path: Path) -> None:
+    # A config with hundreds of hooks, one repo each.
+    hook_ids = ["validate-pyproject", *(f"hook-{idx}" for idx in range(500))]
+    content = "repos:\n" + "".join(
+        f"  - repo: local\n    hooks:\n      - id: {id_}\n" for id_ in hook_ids
+    )
+    (path / ".pre-commit-config.yaml").write_text(content)
+
+
+@pytest.mark.benchmark
+def test_read_many_hooks(tmp_path: Path):
+    # The baseline for the benchmarks below: reading the config without changing it.
+    _write_many_hooks_config(tmp_path)
+
+    with change_cwd(tmp_path):
+        add_repos([])
+
+        assert len(get_hook_names()) == 501
+
+
+@pytest.mark.benchmark
+def test_add_to_many_hooks(tmp_path: Path):
+    _write_many_hooks_config(tmp_path)
+
+    with change_cwd(tmp_path):
+        add_repo(LocalRepo(repo="local", hooks=[HookDefinition(id="ruff")]))
+
+        assert get_hook_names()[:3] == ["validate-pyproject", "ruff", "hook-0"]
+
+
+@pytest.mark.benchmark
+def test_add_several_to_many_hooks(tmp_path: Path):
+    # Repeated inserts in one edit, each shifting the hundreds of repos after it.
+    _write_many_hooks_config(tmp_path)
+    hook_ids = ["deptry", "ruff-format", "uv-export", "ruff", "pyproject-fmt"]
+
+    with change_cwd(tmp_path):
+        add_repos(
+            [
+                UriRepo(
+                    repo=f"https://example.com/{id_}",
+                    rev="v1.0.0",
+                    hooks=[HookDefinition(id=id_)],
+                )
+                for id_ in hook_ids
+            ]
+        )
+
+        assert get_hook_names()[:7] == [
+            "validate-pyproject",
+            "uv-export",
+            "pyproject-fmt",
+            "ruff",
+            "ruff-format",
+            "deptry",
+            "hook-0",
+        ]
@@ -0,0 +1,66 @@
+from pathlib import Path
+
+import pytest
+
+from usethis._integrations.pre_commit.errors import InvalidPreCommitSettingsError
+from usethis._integrations.pre_commit.settings import (
+    PreCommitSettings,
+    get_pre_commit_settings,
+)
+from usethis._test import change_cwd
+
+
+class TestGetPreCommitSettings:
+    def test_no_pyproject_toml(self, tmp_path: Path):
+        with change_cwd(tmp_path):
+            assert get_pre_commit_settings() == PreCommitSettings()
+
+    def test_no_section(self, tmp_path: Path):
+        (tmp_path / "pyproject.toml").write_text("[tool.usethis]\n")
+
+        with change_cwd(tmp_path):
+            assert get_pre_commit_settings() == PreCommitSettings()
+
+    def test_changed_files_only(self, tmp_path: Path):
+        (tmp_path / "pyproject.toml").write_text("""\
+[tool.usethis.pre-commit]
+changed-files-only = true
+""")
+
+        with change_cwd(tmp_path):
+            assert get_pre_commit_settings().changed_files_only
+
+    def test_stages(self, tmp_path: Path):
+        (tmp_path / "pyproject.toml").write_text("""\
+[tool.usethis.pre-commit.stages]
+deptry = ["pre-push", "manual"]
+""")
+
+        with change_cwd(tmp_path):
+            stages = get_pre_commit_settings().stages
+
+        assert [stage.root for stage in stages["deptry"].root] == ["pre-push", "manual"]
+
+    def test_invalid_stage(self, tmp_path: Path):
+        (tmp_path / "pyproject.toml").write_text("""\
+[tool.usethis.pre-commit.stages]
+deptry = ["on-push"]
+""")
+
+        with (
+            change_cwd(tmp_path),
+            pytest.raises(InvalidPreCommitSettingsError, match="on-push"),
+        ):
+            get_pre_commit_settings()
+
+    def test_unknown_setting(self, tmp_path: Path):
+        (tmp_path / "pyproject.toml").write_text("""\
+[tool.usethis.pre-commit]
+changed_files_only = true
+""")
+
+        with (
+            change_cwd(tmp_path),
+            pytest.raises(InvalidPreCommitSettingsError, match="changed_files_only"),
+        ):
+            get_pre_commit_settings()
@@ -0,0 +1,115 @@
+from pathlib import Path
+
+from usethis._integrations.pytest.junit import get_test_file_durations, get_test_files
+from usethis._test import change_cwd
+
+
+class TestGetTestFileDurations:
+    def test_classnames(self, tmp_path: Path):
+        # Arrange
+        (tmp_path / "tests" / "sub").mkdir(parents=True)
+        (tmp_path / "tests" / "test_a.py").touch()
+        (tmp_path / "tests" / "sub" / "test_b.py").touch()
+        (tmp_path / "report.xml").write_text("""\
+<testsuites>
+  <testsuite name="pytest">
+    <testcase classname="tests.test_a" name="test_x" time="1.5" />
+    <testcase classname="tests.test_a.TestY" name="test_y" time="2.0" />
+    <testcase classname="tests.sub.test_b.TestZ.TestW" name="test_z" time="0.5" />
+  </testsuite>
+</testsuites>
+""")
+
+        # Act
+        with change_cwd(tmp_path):
+            durations = get_test_file_durations(["report.xml"])
+
+        # Assert
+        assert durations == {"tests/test_a.py": 3.5, "tests/sub/test_b.py": 0.5}
+
+    def test_file_attribute(self, tmp_path: Path):
+        # Arrange
+        (tmp_path / "tests").mkdir()
+        (tmp_path / "tests" / "test_a.py").touch()
+        (tmp_path / "report.xml").write_text("""\
+<testsuite name="pytest">
+  <testcase classname="unrelated" file="tests/test_a.py" name="test_x" time="1" />
+</testsuite>
+""")
+
+        # Act
+        with change_cwd(tmp_path):
+            durations = get_test_file_durations(["report.xml"])
+
+        # Assert
+        assert durations == {"tests/test_a.py": 1.0}
+
+    def test_deleted_file_ignored(self, tmp_path: Path):
+        # Arrange
+        (tmp_path / "report.xml").write_text("""\
+<testsuite name="pytest">
+  <testcase classname="tests.test_gone" name="test_x" time="1" />
+  <testcase classname="x" file="tests/test_gone.py" name="test_y" time="1" />
+</testsuite>
+""")
+
+        # Act
+        with change_cwd(tmp_path):
+            durations = get_test_file_durations(["report.xml"])
+
+        # Assert
+        assert durations == {}
+
+    def test_directory_summed(self, tmp_path: Path):
+        # Arrange
+        (tmp_path / "tests").mkdir()
+        (tmp_path / "tests" / "test_a.py").touch()
+        (tmp_path / "reports" / "3.12").mkdir(parents=True)
+        for name in ["3.12/report.xml", "report.xml"]:
+            (tmp_path / "reports" / name).write_text("""\
+<testsuite name="pytest">
+  <testcase classname="tests.test_a" name="test_x" time="2" />
+</testsuite>
+""")
+        (tmp_path / "reports" / "notes.txt").write_text("Not a report.")
+
+        # Act
+        with change_cwd(tmp_path):
+            durations = get_test_file_durations(["reports"])
+
+        # Assert
+        assert durations == {"tests/test_a.py": 4.0}
+
+    def test_invalid_and_missing_reports_ignored(self, tmp_path: Path):
+        # Arrange
+        (tmp_path / "report.xml").write_text("<testsuite")
+
+        # Act
+        with change_cwd(tmp_path):
+            durations = get_test_file_durations(["report.xml", "missing.xml"])
+
+        # Assert
+        assert durations == {}
+
+
+class TestGetTestFiles:
+    def test_patterns(self, tmp_path: Path):
+        # Arrange
+        (tmp_path / "tests" / "sub").mkdir(parents=True)
+        for name in ["test_a.py", "b_test.py", "conftest.py", "sub/test_c.py"]:
+            (tmp_path / "tests" / name).touch()
+
+        # Act
+        with change_cwd(tmp_path):
+            files = get_test_files()
+
+        # Assert
+        assert files == ["tests/b_test.py", "tests/sub/test_c.py", "tests/test_a.py"]
+
+    def test_no_tests_dir(self, tmp_path: Path):
+        # Act
+        with change_cwd(tmp_path):
+            files = get_test_files()
+
+        # Assert
+        assert files == []
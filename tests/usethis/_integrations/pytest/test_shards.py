@@ -0,0 +1,38 @@
+from usethis._integrations.pytest.shards import get_balanced_shards
+
+
+class TestGetBalancedShards:
+    def test_longest_first(self):
+        # Arrange
+        durations = {"a": 7.0, "b": 5.0, "c": 4.0, "d": 3.0, "e": 1.0}
+
+        # Act
+        shards = get_balanced_shards(durations, shards=2)
+
+        # Assert
+        assert shards == [["a", "d"], ["b", "c", "e"]]
+
+    def test_more_shards_than_files(self):
+        # Act
+        shards = get_balanced_shards({"a": 1.0}, shards=3)
+
+        # Assert
+        assert shards == [["a"], [], []]
+
+    def test_ties_by_name(self):
+        # Act
+        shards = get_balanced_shards({"b": 1.0, "a": 1.0, "c": 1.0}, shards=2)
+
+        # Assert
+        assert shards == [["a", "c"], ["b"]]
+
+    def test_slowest_shard_bound(self):
+        # Arrange
+        durations = {f"test_{idx}.py": float(idx % 17 + 1) for idx in range(200)}
+
+        # Act
+        shards = get_balanced_shards(durations, shards=7)
+
+        # Assert
+        totals = [sum(durations[file] for file in shard) for shard in shards]
+        assert max(totals) <= sum(durations.values()) / 7 + max(durations.values())
@@ -1,7 +1,10 @@
+from threading import Semaphore
+
 import pytest
 
-from usethis._integrations.uv.call import call_uv_subprocess
-from usethis._integrations.uv.errors import UVSubprocessFailedError
+from usethis._files import staged_files
+from usethis._integrations.uv.call import call_uv_subprocess, limit_uv_concurrency
+from usethis._integrations.uv.errors import UVDryRunError, UVSubprocessFailedError
 
 
 class TestCallUVSubprocess:
@@ -18,3 +21,42 @@ class TestCallUVSubprocess:
         match = ".*error: unrecognized subcommand 'does-not-exist'.*"
         with pytest.raises(UVSubprocessFailedError, match=match):
             call_uv_subprocess(["does-not-exist"])
+
+    def test_staged_files(self):
+        # Act and Assert
+        with staged_files(commit=False), pytest.raises(UVDryRunError):
+            call_uv_subprocess(["lock"])
+
+    def test_limiter_held(self):
+        # Arrange
+        class _Limiter:
+            def __init__(self) -> None:
+                self.entered = 0
+
+            def __enter__(self) -> None:
+                self.entered += 1
+
+            def __exit__(self, *args: object) -> None:
+                pass
+
+        limiter = _Limiter()
+
+        # Act
+        with limit_uv_concurrency(limiter):
+            call_uv_subprocess(["version"])
+        call_uv_subprocess(["version"])
+
+        # Assert
+        assert limiter.entered == 1
+
+    def test_semaphore_released(self):
+        # Arrange
+        semaphore = Semaphore(1)
+
+        # Act
+        with limit_uv_concurrency(semaphore):
+            call_uv_subprocess(["version"])
+            call_uv_subprocess(["version"])
+
+        # Assert
+        assert semaphore.acquire(blocking=False)
@@ -10,6 +10,7 @@ from usethis._integrations.pyproject.core import (
 from usethis._integrations.uv.deps import (
     Dependency,
     add_deps_to_group,
+    defer_dep_changes,
     get_dep_groups,
     get_deps_from_group,
     is_dep_in_any_group,
@@ -391,6 +392,91 @@ class TestRemoveDepsFromGroup:
             assert not out
 
 
+class TestDeferDepChanges:
+    def test_single_uv_call_per_group(
+        self, uv_init_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ):
+        # Arrange
+        calls = []
+
+        def mock_call_uv_subprocess(args: list[str]) -> str:
+            calls.append(args)
+            return ""
+
+        monkeypatch.setattr(
+            "usethis._integrations.uv.deps.call_uv_subprocess", mock_call_uv_subprocess
+        )
+
+        # Act
+        with (
+            change_cwd(uv_init_dir),
+            usethis_config.set(offline=False),
+            defer_dep_changes(),
+        ):
+            add_deps_to_group([Dependency(name="pytest")], "test")
+            add_deps_to_group([Dependency(name="coverage")], "test")
+            add_deps_to_group([Dependency(name="ruff")], "dev")
+            assert not calls
+
+        # Assert
+        assert calls == [
+            ["add", "--group", "test", "--quiet", "pytest", "coverage"],
+            ["add", "--group", "dev", "--quiet", "ruff"],
+        ]
+
+    def test_pending_deps_visible(self, uv_init_dir: Path):
+        with change_cwd(uv_init_dir), defer_dep_changes():
+            # Act
+            add_deps_to_group([Dependency(name="pytest")], "test")
+
+            # Assert
+            assert is_dep_in_any_group(Dependency(name="pytest"))
+            assert "pytest" not in (uv_init_dir / "pyproject.toml").read_text()
+
+        with change_cwd(uv_init_dir):
+            assert get_deps_from_group("test") == [Dependency(name="pytest")]
+
+    def test_remove_pending_dep(
+        self, uv_init_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ):
+        # Arrange
+        calls = []
+
+        def mock_call_uv_subprocess(args: list[str]) -> str:
+            calls.append(args)
+            return ""
+
+        monkeypatch.setattr(
+            "usethis._integrations.uv.deps.call_uv_subprocess", mock_call_uv_subprocess
+        )
+
+        # Act
+        with change_cwd(uv_init_dir), defer_dep_changes():
+            add_deps_to_group([Dependency(name="pytest")], "test")
+            remove_deps_from_group([Dependency(name="pytest")], "test")
+
+            # Assert
+            assert not is_dep_in_any_group(Dependency(name="pytest"))
+
+        assert not calls
+
+    def test_discarded_on_error(self, uv_init_dir: Path):
+        # Arrange
+        def add_then_fail() -> None:
+            with defer_dep_changes():
+                add_deps_to_group([Dependency(name="pytest")], "test")
+                msg = "Oops"
+                raise ValueError(msg)
+
+        # Act
+        with change_cwd(uv_init_dir), pytest.raises(ValueError, match="Oops"):
+            add_then_fail()
+
+        # Assert
+        with change_cwd(uv_init_dir):
+            assert not is_dep_in_any_group(Dependency(name="pytest"))
+
+
 class TestIsDepInAnyGroup:
     def test_no_group(self, uv_init_dir: Path):
         with change_cwd(uv_init_dir):
@@ -0,0 +1,55 @@
+from pathlib import Path
+
+import pytest
+
+from usethis._integrations.uv.export import (
+    defer_requirements_txt_export,
+    export_requirements_txt,
+)
+from usethis._test import change_cwd
+
+
+class TestDeferRequirementsTxtExport:
+    def test_once_on_exit(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+        # Arrange
+        (tmp_path / "uv.lock").touch()
+        calls = []
+
+        def mock_call_uv_subprocess(args: list[str]) -> str:
+            calls.append(args[0])
+            return ""
+
+        monkeypatch.setattr(
+            "usethis._integrations.uv.export.call_uv_subprocess",
+            mock_call_uv_subprocess,
+        )
+
+        # Act
+        with change_cwd(tmp_path), defer_requirements_txt_export():
+            export_requirements_txt()
+            export_requirements_txt()
+
+            # Assert
+            assert not calls
+
+        assert calls == ["export"]
+
+    def test_err_skips(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+        # Arrange
+        calls = []
+        monkeypatch.setattr(
+            "usethis._integrations.uv.export.call_uv_subprocess", calls.append
+        )
+
+        def export():
+            with defer_requirements_txt_export():
+                export_requirements_txt()
+                msg = "Planning failed"
+                raise ValueError(msg)
+
+        # Act
+        with change_cwd(tmp_path), pytest.raises(ValueError, match="Planning failed"):
+            export()
+
+        # Assert
+        assert not calls
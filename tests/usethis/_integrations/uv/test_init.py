@@ -2,6 +2,8 @@ from pathlib import Path
 
 import pytest
 
+from usethis._config import usethis_config
+from usethis._files import staged_files
 from usethis._integrations.uv.init import ensure_pyproject_toml
 from usethis._test import change_cwd
 
@@ -18,6 +20,69 @@ class TestEnsurePyprojectTOML:
         assert not err
         assert out == "✔ Writing 'pyproject.toml'.\n"
 
+    def test_dry_run_staged(self, tmp_path: Path, capfd: pytest.CaptureFixture[str]):
+        # Act
+        with (
+            change_cwd(tmp_path),
+            usethis_config.set(dry_run=True),
+            staged_files(commit=False) as staged,
+        ):
+            ensure_pyproject_toml()
+            diff = staged.diff()
+
+        # Assert
+        assert not (tmp_path / "pyproject.toml").exists()
+        assert "+++ b/pyproject.toml" in diff
+        assert f'+name = "{tmp_path.name.lower().replace("_", "-")}"' in diff
+        out, err = capfd.readouterr()
+        assert not err
+        assert out == "✔ Writing 'pyproject.toml'.\n"
+
+    def test_dry_run_python_version(self, tmp_path: Path):
+        # Arrange
+        (tmp_path / ".python-version").write_text("3.13\n")
+
+        # Act
+        with (
+            change_cwd(tmp_path),
+            usethis_config.set(dry_run=True),
+            staged_files(commit=False) as staged,
+        ):
+            ensure_pyproject_toml()
+            diff = staged.diff()
+
+        # Assert
+        assert '+requires-python = ">=3.13"' in diff
+
+    def test_dry_run_no_python_version(self, tmp_path: Path):
+        # Act
+        with (
+            change_cwd(tmp_path),
+            usethis_config.set(dry_run=True),
+            staged_files(commit=False) as staged,
+        ):
+            ensure_pyproject_toml()
+            diff = staged.diff()
+
+        # Assert
+        assert "requires-python" not in diff
+
+    def test_staged(self, tmp_path: Path):
+        # Arrange
+        (tmp_path / ".python-version").write_text("3.12\n")
+
+        # Act
+        with change_cwd(tmp_path), staged_files():
+            ensure_pyproject_toml()
+
+            # Assert
+            assert not (tmp_path / "pyproject.toml").exists()
+
+        content = (tmp_path / "pyproject.toml").read_text()
+        assert f'name = "{tmp_path.name.lower().replace("_", "-")}"' in content
+        assert 'requires-python = ">=3.12"' in content
+        assert not (tmp_path / "hello.py").exists()
+
     def test_already_exists_unchanged(
         self, tmp_path: Path, capfd: pytest.CaptureFixture[str]
     ):
@@ -0,0 +1,58 @@
+from pathlib import Path
+
+from usethis._integrations.uv.lock import get_locked_version
+from usethis._test import change_cwd
+
+
+class TestGetLockedVersion:
+    def test_locked(self, tmp_path: Path):
+        # Arrange
+        (tmp_path / "uv.lock").write_text("""\
+version = 1
+requires-python = ">=3.12"
+
+[[package]]
+name = "cfgv"
+version = "3.4.0"
+
+[[package]]
+name = "pre-commit"
+version = "4.0.1"
+""")
+
+        # Act
+        with change_cwd(tmp_path):
+            version = get_locked_version("pre-commit")
+
+        # Assert
+        assert version == "4.0.1"
+
+    def test_not_locked(self, tmp_path: Path):
+        # Arrange
+        (tmp_path / "uv.lock").write_text("version = 1\n")
+
+        # Act
+        with change_cwd(tmp_path):
+            version = get_locked_version("pre-commit")
+
+        # Assert
+        assert version is None
+
+    def test_no_lockfile(self, tmp_path: Path):
+        # Act
+        with change_cwd(tmp_path):
+            version = get_locked_version("pre-commit")
+
+        # Assert
+        assert version is None
+
+    def test_invalid(self, tmp_path: Path):
+        # Arrange
+        (tmp_path / "uv.lock").write_text("[[package]\n")
+
+        # Act
+        with change_cwd(tmp_path):
+            version = get_locked_version("pre-commit")
+
+        # Assert
+        assert version is None
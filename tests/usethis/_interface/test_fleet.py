@@ -0,0 +1,77 @@
+from pathlib import Path
+
+import typer
+from typer.testing import CliRunner
+
+from usethis._interface.fleet import fleet
+from usethis._test import change_cwd
+
+app = typer.Typer()
+app.command()(fleet)
+
+
+class TestFleet:
+    def test_tool(self, uv_init_dir: Path, tmp_path_factory):
+        # Arrange
+        other = tmp_path_factory.mktemp("other")
+        (other / "pyproject.toml").write_text(
+            (uv_init_dir / "pyproject.toml").read_text()
+        )
+        repos_file = uv_init_dir / "repos.txt"
+        repos_file.write_text(f"{other}\n")
+
+        # Act
+        runner = CliRunner()
+        with change_cwd(uv_init_dir):
+            result = runner.invoke(
+                app,
+                [
+                    "--repo",
+                    ".",
+                    "--repos-file",
+                    str(repos_file),
+                    "--",
+                    "tool",
+                    "ruff",
+                    "--frozen",
+                ],
+            )
+
+        # Assert
+        assert result.exit_code == 0, result.output
+        assert "2 succeeded, 0 failed" in result.output
+        for path in [uv_init_dir, other]:
+            assert "[tool.ruff]" in (path / "pyproject.toml").read_text()
+
+    def test_failure_reported(self, tmp_path: Path):
+        # Act
+        runner = CliRunner()
+        with change_cwd(tmp_path):
+            result = runner.invoke(
+                app, ["--repo", "missing", "--", "tool", "ruff", "--frozen"]
+            )
+
+        # Assert
+        assert result.exit_code == 1, result.output
+        assert "0 succeeded, 1 failed" in result.output
+
+    def test_no_repos(self, tmp_path: Path):
+        # Act
+        runner = CliRunner()
+        with change_cwd(tmp_path):
+            result = runner.invoke(app, ["--", "tool", "ruff"])
+
+        # Assert
+        assert result.exit_code == 1, result.output
+
+    def test_no_uv_jobs(self, tmp_path: Path):
+        # Act
+        runner = CliRunner()
+        with change_cwd(tmp_path):
+            result = runner.invoke(
+                app, ["--repo", ".", "--uv-jobs", "0", "--", "tool", "ruff"]
+            )
+
+        # Assert
+        assert result.exit_code == 2, result.output
+        assert not (tmp_path / "pyproject.toml").exists()
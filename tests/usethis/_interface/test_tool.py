@@ -81,6 +81,52 @@ class TestPytest:
         assert result.exit_code == 0
 
 
+class TestSeveralTools:
+    def test_add(self, uv_init_dir: Path):
+        # Act
+        runner = CliRunner()
+        with change_cwd(uv_init_dir):
+            result = runner.invoke(app, ["pytest", "coverage", "ruff", "--frozen"])
+
+        # Assert
+        assert result.exit_code == 0, result.output
+        content = (uv_init_dir / "pyproject.toml").read_text()
+        assert "[tool.pytest.ini_options]" in content
+        assert "[tool.coverage.run]" in content
+        assert "[tool.ruff]" in content
+        assert '"PT"' in content
+
+    def test_dry_run(self, uv_init_repo_dir: Path):
+        # Arrange
+        before = (uv_init_repo_dir / "pyproject.toml").read_text()
+
+        # Act
+        runner = CliRunner()
+        with change_cwd(uv_init_repo_dir), usethis_config.set(offline=True):
+            result = runner.invoke(app, ["ruff", "pre-commit", "--dry-run"])
+
+        # Assert
+        assert result.exit_code == 0, result.output
+        assert (uv_init_repo_dir / "pyproject.toml").read_text() == before
+        assert not (uv_init_repo_dir / ".pre-commit-config.yaml").exists()
+        assert "+++ b/pyproject.toml" in result.output
+        assert "+[tool.ruff]" in result.output
+        assert '+dev = ["ruff", "pre-commit"]' in result.output
+        assert "--- /dev/null\n+++ b/.pre-commit-config.yaml" in result.output
+
+    def test_dry_run_without_pyproject_toml(self, tmp_path: Path):
+        # Act
+        runner = CliRunner()
+        with change_cwd(tmp_path), usethis_config.set(offline=True):
+            result = runner.invoke(app, ["ruff", "--dry-run"])
+
+        # Assert
+        assert result.exit_code == 0, result.output
+        assert not list(tmp_path.iterdir())
+        assert "--- /dev/null\n+++ b/pyproject.toml" in result.output
+        assert "+[tool.ruff]" in result.output
+
+
 @pytest.mark.benchmark
 def test_several_tools_add_and_remove(tmp_path: Path):
     runner = CliRunner()
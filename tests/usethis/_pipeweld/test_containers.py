@@ -1,3 +1,7 @@
+import pickle
+
+import pytest
+
 from usethis._pipeweld.containers import (
     DepGroup,
     Parallel,
@@ -21,10 +25,15 @@ class TestSeries:
     def test_getitem(self):
         assert Series(["a", "b"])[0] == "a"
 
-    def test_setitem(self):
+    def test_immutable(self):
         series = Series(["a", "b"])
-        series[0] = "c"
-        assert series == Series(["c", "b"])
+        with pytest.raises(AttributeError):
+            series.root = ("c", "b")  # type: ignore[reportAttributeAccessIssue]
+        with pytest.raises(TypeError):
+            series[0] = "c"  # type: ignore[reportIndexIssue]
+
+    def test_same_object(self):
+        assert Series(["a", parallel("b", "c")]) is Series(["a", parallel("c", "b")])
 
     def test_eq_same(self):
         assert Series(["a", "b"]) == Series(["a", "b"])
@@ -38,6 +47,15 @@ class TestSeries:
     def test_len(self):
         assert len(Series(["a", "b"])) == 2
 
+    def test_repr(self):
+        assert (
+            repr(series("a", parallel("c", "b"))) == "series('a', parallel('b', 'c'))"
+        )
+
+    def test_pickle(self):
+        component = series("a", parallel("b", "c"))
+        assert pickle.loads(pickle.dumps(component)) is component
+
 
 class TestParallel:
     def test_func(self):
@@ -72,6 +90,9 @@ class TestParallel:
     def test_len(self):
         assert len(Parallel(frozenset({"a", "b"}))) == 2
 
+    def test_same_object(self):
+        assert Parallel(["a", "b"]) is Parallel(["b", "a"])
+
 
 class TestDepGroup:
     def test_func(self):
@@ -88,3 +109,37 @@ class TestDepGroup:
         assert hash(DepGroup(series=series("a", "b"), config_group="group")) != hash(
             DepGroup(series=series("b", "a"), config_group="group")
         )
+
+    def test_eq_different_config_group(self):
+        assert DepGroup(series=series("a"), config_group="x") != DepGroup(
+            series=series("a"), config_group="y"
+        )
+
+    def test_repr(self):
+        assert (
+            repr(depgroup("a", "b", config_group="group"))
+            == "depgroup('a', 'b', config_group='group')"
+        )
+
+    def test_pickle(self):
+        component = depgroup("a", "b", config_group="group")
+        assert pickle.loads(pickle.dumps(component)) is component
+
+
+def _get_pipeline_with_1000_steps() -> Series:
+    return series(
+        *[
+            parallel(f"step-{idx}-a", f"step-{idx}-b") if idx % 2 else f"step-{idx}"
+            for idx in range(667)
+        ]
+    )
+
+
+@pytest.mark.benchmark
+def test_compare_1000_step_pipelines():
+    pipeline = _get_pipeline_with_1000_steps()
+    other = _get_pipeline_with_1000_steps()
+
+    for _ in range(100):
+        assert pipeline == other
+        assert hash(pipeline) == hash(other)
@@ -1,14 +1,17 @@
+import random
+
 import pytest
 
-from usethis._pipeweld.containers import depgroup, parallel, series
+from usethis._pipeweld.containers import Series, depgroup, parallel, series
 from usethis._pipeweld.func import (
     Adder,
+    BatchAdder,
     Partition,
     _flatten_partition,
     _op_series_merge_partitions,
     _parallel_merge_partitions,
 )
-from usethis._pipeweld.ops import InsertParallel, InsertSuccessor
+from usethis._pipeweld.ops import InsertParallel, InsertSuccessor, Move, Remove
 from usethis._pipeweld.result import WeldResult
 
 
@@ -98,6 +101,38 @@ class TestAdder:
             assert result.instructions == [InsertParallel(after="A", step="C")]
             assert result.solution == series("A", parallel("B", "C"))
 
+        def test_prerequisite_in_parallel(self):
+            # Arrange
+            adder = Adder(
+                step="D",
+                pipeline=series(parallel("A", "B"), "C"),
+                prerequisites={"A"},
+            )
+
+            # Act
+            result = adder.add()
+
+            # Assert
+            assert isinstance(result, WeldResult)
+            assert result.instructions == [InsertParallel(after="A", step="D")]
+            assert result.solution == series(parallel("A", "B"), parallel("C", "D"))
+
+        def test_prerequisite_in_parallel_at_end(self):
+            # Arrange
+            adder = Adder(
+                step="C",
+                pipeline=series(parallel("A", "B")),
+                prerequisites={"B"},
+            )
+
+            # Act
+            result = adder.add()
+
+            # Assert
+            assert isinstance(result, WeldResult)
+            assert result.instructions == [InsertSuccessor(after="A", step="C")]
+            assert result.solution == series(parallel("A", "B"), "C")
+
         def test_mixed_dependency_parallelism_of_steps(self):
             # Arrange
             adder = Adder(
@@ -346,6 +381,237 @@ class TestAdder:
             assert isinstance(result, WeldResult)
             assert result.solution == series("A", "B", "C")
 
+    class TestPartitionComponent:
+        def test_disjoint_subtree_is_nondependent(self):
+            # Arrange
+            component = series("A", parallel("B", "C"))
+            adder = Adder(
+                step="X", pipeline=series(), prerequisites={"Y"}, postrequisites={"Z"}
+            )
+
+            # Act
+            partition, instructions = adder.partition_component(
+                component, predecessor="Y"
+            )
+
+            # Assert
+            assert partition == Partition(
+                nondependent_component=component, top_ranked_endpoint="B"
+            )
+            assert instructions == []
+
+        def test_disjoint_subtree_shared_between_requirements(self):
+            # Arrange
+            component = series("A", parallel("B", "C"))
+            adder = Adder(step="X", pipeline=series(), prerequisites={"Y"})
+            other_adder = Adder(step="X", pipeline=series(), postrequisites={"Z"})
+
+            # Act
+            partition, _ = adder.partition_component(component, predecessor=None)
+            other_partition, _ = other_adder.partition_component(
+                component, predecessor="Y"
+            )
+
+            # Assert
+            assert partition is other_partition
+
+
+class TestBatchAdder:
+    class TestAdd:
+        def test_empty_pipeline(self):
+            # Act
+            result = BatchAdder(pipeline=series(), steps={"A", "B"}).add()
+
+            # Assert
+            assert result.solution == series(parallel("A", "B"))
+            assert result.instructions == [
+                InsertParallel(after=None, step="A"),
+                InsertParallel(after=None, step="B"),
+            ]
+
+        def test_requirements_between_new_steps(self):
+            # Act
+            result = BatchAdder(
+                pipeline=series("A"),
+                steps={"B", "C", "D"},
+                prerequisites={"B": {"A", "D"}, "D": {"A"}},
+                postrequisites={"C": {"D"}},
+            ).add()
+
+            # Assert
+            assert result.solution == series(parallel("A", "C"), "D", "B")
+            assert result.instructions == [
+                InsertParallel(after=None, step="C"),
+                InsertSuccessor(after="A", step="D"),
+                InsertSuccessor(after="D", step="B"),
+            ]
+
+        def test_order_independent(self):
+            # Arrange
+            steps = ["E", "C", "D"]
+            prerequisites = {"C": {"A"}, "D": {"A"}, "E": {"B"}}
+
+            # Act
+            results = [
+                BatchAdder(
+                    pipeline=series("A", "B"),
+                    steps=set(ordering),
+                    prerequisites=prerequisites,
+                ).add()
+                for ordering in [steps, list(reversed(steps))]
+            ]
+
+            # Assert
+            assert results[0] == results[1]
+            assert results[0].solution == series("A", parallel("B", "C", "D"), "E")
+
+        def test_rearranged(self):
+            # Arrange
+            adder = BatchAdder(
+                pipeline=series(parallel("A", "B")),
+                steps={"C"},
+                prerequisites={"C": {"A"}},
+                postrequisites={"C": {"B"}},
+            )
+
+            # Act
+            result = adder.add()
+
+            # Assert
+            assert result.solution == series("A", "C", "B")
+            assert result.instructions == [
+                Move(after=None, step="A"),
+                Move(after="A", step="B"),
+                InsertSuccessor(after="A", step="C"),
+            ]
+
+        def test_removals(self):
+            # Arrange
+            adder = BatchAdder(
+                pipeline=series(
+                    "A", parallel("B", "C"), depgroup("D", config_group="x")
+                ),
+                steps={"E"},
+                prerequisites={"E": {"A"}},
+                removals={"C", "D", "Z"},
+            )
+
+            # Act
+            result = adder.add()
+
+            # Assert
+            assert result.solution == series("A", parallel("B", "E"))
+            assert result.instructions == [
+                Remove(step="C"),
+                Remove(step="D"),
+                InsertParallel(after="A", step="E"),
+            ]
+
+        def test_existing_step_in_order(self):
+            # Act
+            result = BatchAdder(
+                pipeline=series("A", "B"),
+                steps={"B"},
+                prerequisites={"B": {"A"}},
+            ).add()
+
+            # Assert
+            assert result.solution == series("A", "B")
+            assert result.instructions == []
+
+        def test_existing_step_out_of_order(self):
+            # Act
+            result = BatchAdder(
+                pipeline=series("B", "A", "C"),
+                steps={"B"},
+                prerequisites={"B": {"A"}},
+            ).add()
+
+            # Assert
+            assert result.solution == series("A", parallel("B", "C"))
+            assert result.instructions == [
+                Move(after="A", step="B", parallel=True),
+            ]
+
+        def test_existing_step_in_depgroup_stays(self):
+            # Arrange
+            pipeline = series(depgroup("B", config_group="x"), "A")
+
+            # Act
+            result = BatchAdder(
+                pipeline=pipeline, steps={"B"}, prerequisites={"B": {"A"}}
+            ).add()
+
+            # Assert
+            assert result.solution == pipeline
+            assert result.instructions == []
+
+        def test_cycle(self):
+            # Arrange
+            adder = BatchAdder(
+                pipeline=series(),
+                steps={"A", "B"},
+                prerequisites={"A": {"B"}},
+                postrequisites={"A": {"B"}},
+            )
+
+            # Act, Assert
+            with pytest.raises(ValueError, match="cycle: A, B"):
+                adder.add()
+
+        @pytest.mark.parametrize("seed", range(20))
+        def test_same_as_adder(self, seed: int):
+            # Arrange
+            rng = random.Random(seed)
+            existing = [f"old-{idx}" for idx in range(12)]
+            rng.shuffle(existing)
+            components = []
+            while existing:
+                size = rng.choice([1, 1, 2, 3])
+                group, existing = existing[:size], existing[size:]
+                if len(group) == 1:
+                    components.append(group[0])
+                elif rng.random() < 0.2:
+                    components.append(depgroup(*group, config_group=group[0]))
+                else:
+                    components.append(parallel(*group))
+            pipeline = series(*components)
+
+            old_steps = [f"old-{idx}" for idx in range(12)]
+            new_steps = {f"new-{idx}" for idx in range(6)}
+            prerequisites = {
+                step: set(rng.sample(old_steps, rng.randint(0, 2)))
+                for step in new_steps
+            }
+            postrequisites = {
+                step: set(rng.sample(old_steps, rng.randint(0, 1)))
+                for step in new_steps
+            }
+            adder = BatchAdder(
+                pipeline=pipeline,
+                steps=new_steps,
+                prerequisites=prerequisites,
+                postrequisites=postrequisites,
+            )
+
+            # Act
+            result = adder.add()
+
+            # Assert
+            expected = pipeline
+            instructions = []
+            for step in sorted(new_steps):
+                step_result = Adder(
+                    pipeline=expected,
+                    step=step,
+                    prerequisites=prerequisites[step],
+                    postrequisites=postrequisites[step],
+                ).add()
+                expected = step_result.solution
+                instructions.extend(step_result.instructions)
+            assert result.solution == expected
+            assert result.instructions == instructions
+
 
 class TestParallelMergePartitions:
     def test_basic(self):
@@ -650,3 +916,60 @@ class TestOpSeriesMergePartitions:
             postrequisite_component="B",
             top_ranked_endpoint="B",
         )
+
+
+def _get_long_pipeline() -> tuple[Series, dict[str, set[str]]]:
+    # Hundreds of steps in pairs, and new steps each after a different pair.
+    pipeline = series(*[parallel(f"old-{idx}-a", f"old-{idx}-b") for idx in range(100)])
+    prerequisites = {f"new-{idx}": {f"old-{idx * 10}-a"} for idx in range(10)}
+    return pipeline, prerequisites
+
+
+@pytest.mark.benchmark
+def test_batch_add_to_long_pipeline():
+    pipeline, prerequisites = _get_long_pipeline()
+
+    result = BatchAdder(
+        pipeline=pipeline, steps=set(prerequisites), prerequisites=prerequisites
+    ).add()
+
+    assert len(result.instructions) == 10
+
+
+@pytest.mark.benchmark
+def test_add_one_at_a_time_to_long_pipeline():
+    # The baseline for the benchmark above: a full solve for each step.
+    pipeline, prerequisites = _get_long_pipeline()
+
+    for step in sorted(prerequisites):
+        pipeline = (
+            Adder(pipeline=pipeline, step=step, prerequisites=prerequisites[step])
+            .add()
+            .solution
+        )
+
+    assert len(pipeline) == 100
+
+
+def _get_pipeline_with_1000_steps() -> Series:
+    # A mix of single steps and pairs of steps in parallel.
+    return series(
+        *[
+            parallel(f"step-{idx}-a", f"step-{idx}-b") if idx % 2 else f"step-{idx}"
+            for idx in range(667)
+        ]
+    )
+
+
+@pytest.mark.benchmark
+def test_add_to_1000_step_pipeline():
+    pipeline = _get_pipeline_with_1000_steps()
+
+    result = Adder(
+        pipeline=pipeline,
+        step="new",
+        prerequisites={"step-500"},
+        postrequisites={"step-600"},
+    ).add()
+
+    assert result.solution[501] == parallel("step-501-a", "step-501-b", "new")
@@ -0,0 +1,249 @@
+from graphlib import TopologicalSorter
+from itertools import pairwise
+
+import pytest
+
+from usethis._pipeweld.containers import depgroup, parallel, series
+from usethis._pipeweld.func import Adder
+from usethis._pipeweld.ops import InsertParallel, InsertSuccessor
+from usethis._pipeweld.optimize import Optimizer, get_makespan
+from usethis._pipeweld.result import OptimizeResult
+
+
+class TestOptimizer:
+    class TestOptimize:
+        def test_empty(self):
+            # Act
+            result = Optimizer(steps=set()).optimize()
+
+            # Assert
+            assert isinstance(result, OptimizeResult)
+            assert result.solution == series()
+            assert result.instructions == []
+            assert result.makespan == 0
+
+        def test_independent(self):
+            # Act
+            result = Optimizer(steps={"A", "B", "C"}).optimize()
+
+            # Assert
+            assert result.solution == series(parallel("A", "B", "C"))
+            assert result.makespan == 1
+
+        def test_prerequisites(self):
+            # Act
+            result = Optimizer(
+                steps={"A", "B", "C"},
+                prerequisites={"C": {"A", "B"}},
+            ).optimize()
+
+            # Assert
+            assert result.solution == series(parallel("A", "B"), "C")
+            assert result.instructions == [
+                InsertSuccessor(after=None, step="A"),
+                InsertParallel(after=None, step="B"),
+                InsertSuccessor(after="A", step="C"),
+            ]
+            assert result.makespan == 2
+
+        def test_unknown_prerequisites_ignored(self):
+            # Act
+            result = Optimizer(steps={"A"}, prerequisites={"A": {"Z"}}).optimize()
+
+            # Assert
+            assert result.solution == series("A")
+
+        def test_short_steps_grouped_together(self):
+            # Arrange
+            # Running the two long steps together means the short steps C and D only
+            # add a little to the makespan.
+            optimizer = Optimizer(
+                steps={"A", "B", "C", "D"},
+                prerequisites={"D": {"C"}},
+                durations={"A": 10, "B": 10, "C": 1, "D": 1},
+                max_parallelism=2,
+            )
+
+            # Act
+            result = optimizer.optimize()
+
+            # Assert
+            assert result.solution == series("C", "D", parallel("A", "B"))
+            assert result.makespan == 12
+
+        def test_max_parallelism(self):
+            # Act
+            result = Optimizer(
+                steps={"A", "B", "C", "D", "E"},
+                max_parallelism=2,
+            ).optimize()
+
+            # Assert
+            assert result.solution == series(
+                parallel("A", "B"), parallel("C", "D"), "E"
+            )
+            assert result.makespan == 3
+
+        def test_critical_path_first(self):
+            # Arrange
+            # Only one step can run at a time, so B must come first to unblock the
+            # long step C as early as possible... which makes no difference here, but
+            # the order is still deterministic.
+            optimizer = Optimizer(
+                steps={"A", "B", "C"},
+                prerequisites={"C": {"B"}},
+                durations={"A": 1, "B": 1, "C": 5},
+                max_parallelism=1,
+            )
+
+            # Act
+            result = optimizer.optimize()
+
+            # Assert
+            assert result.solution == series("B", "A", "C")
+            assert result.makespan == 7
+
+        def test_critical_path_with_limited_room(self):
+            # Arrange
+            # There's room for two steps, and B leads to the long step D, so it should
+            # go in the first group instead of C.
+            optimizer = Optimizer(
+                steps={"A", "B", "C", "D"},
+                prerequisites={"D": {"B"}},
+                durations={"A": 1, "B": 1, "C": 1, "D": 5},
+                max_parallelism=2,
+            )
+
+            # Act
+            result = optimizer.optimize()
+
+            # Assert
+            assert result.solution == series(parallel("A", "B"), parallel("C", "D"))
+            assert result.makespan == 6
+
+        def test_long_chain(self):
+            # Arrange
+            steps = [f"step-{idx:04}" for idx in range(2000)]
+            prerequisites = {step: {prev} for prev, step in pairwise(steps)}
+
+            # Act
+            result = Optimizer(steps=set(steps), prerequisites=prerequisites).optimize()
+
+            # Assert
+            assert result.solution == series(*steps)
+            assert result.makespan == 2000
+
+        def test_cycle(self):
+            # Arrange
+            optimizer = Optimizer(
+                steps={"A", "B", "C"},
+                prerequisites={"A": {"B"}, "B": {"A"}},
+            )
+
+            # Act, Assert
+            with pytest.raises(ValueError, match="cycle: A, B"):
+                optimizer.optimize()
+
+        def test_deterministic(self):
+            # Arrange
+            steps = {f"step-{idx}" for idx in range(20)}
+
+            # Act
+            results = [
+                Optimizer(steps=steps, max_parallelism=3).optimize() for _ in range(3)
+            ]
+
+            # Assert
+            assert results[0].instructions == results[1].instructions
+            assert results[1].instructions == results[2].instructions
+
+
+class TestGetMakespan:
+    def test_series(self):
+        assert get_makespan(series("A", "B"), durations={"A": 2}) == 3
+
+    def test_parallel(self):
+        assert get_makespan(parallel("A", "B"), durations={"A": 2}) == 2
+
+    def test_depgroup(self):
+        component = depgroup("A", "B", config_group="x")
+
+        assert get_makespan(component, durations={}) == 2
+
+    def test_nested(self):
+        component = series(parallel(series("A", "B"), "C"), "D")
+
+        assert get_makespan(component, durations={"C": 5}) == 6
+
+
+def _get_ci_steps() -> tuple[set[str], dict[str, set[str]], dict[str, float]]:
+    # Checks, then a build, then tests for each Python version and then a deploy.
+    checks = [f"check-{idx}" for idx in range(6)]
+    tests = [f"test-{idx}" for idx in range(12)]
+    steps = {*checks, "build", *tests, "deploy"}
+    prerequisites = {
+        "build": set(checks[:2]),
+        **{test: {"build"} for test in tests},
+        "deploy": {*checks, *tests},
+    }
+    durations = {
+        **{check: 1 + idx for idx, check in enumerate(checks)},
+        "build": 3,
+        **{test: 2 + idx % 4 for idx, test in enumerate(tests)},
+        "deploy": 1,
+    }
+    return steps, prerequisites, durations
+
+
+def _add_sequentially(
+    steps: set[str], prerequisites: dict[str, set[str]]
+) -> OptimizeResult:
+    # Each step is added after its prerequisites, as callers do.
+    order = TopologicalSorter(
+        {step: prerequisites.get(step, set()) for step in sorted(steps)}
+    ).static_order()
+
+    pipeline = series()
+    instructions = []
+    for step in order:
+        result = Adder(
+            pipeline=pipeline, step=step, prerequisites=prerequisites.get(step, set())
+        ).add()
+        pipeline = result.solution
+        instructions.extend(result.instructions)
+    return OptimizeResult(solution=pipeline, instructions=instructions, makespan=0)
+
+
+class TestAgainstAdder:
+    def test_shorter_makespan(self):
+        # Arrange
+        steps, prerequisites, durations = _get_ci_steps()
+
+        # Act
+        optimized = Optimizer(
+            steps=steps, prerequisites=prerequisites, durations=durations
+        ).optimize()
+        added = _add_sequentially(steps, prerequisites)
+
+        # Assert
+        assert optimized.makespan < get_makespan(added.solution, durations=durations)
+
+
+@pytest.mark.benchmark
+def test_optimize_ci_steps():
+    steps, prerequisites, durations = _get_ci_steps()
+
+    Optimizer(
+        steps=steps,
+        prerequisites=prerequisites,
+        durations=durations,
+        max_parallelism=10,
+    ).optimize()
+
+
+@pytest.mark.benchmark
+def test_add_ci_steps_sequentially():
+    # The baseline for the benchmark above: welding the same steps one at a time.
+    steps, prerequisites, _ = _get_ci_steps()
+
+    _add_sequentially(steps, prerequisites)
@@ -0,0 +1,71 @@
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from usethis._config import usethis_config
+from usethis._integrations.pyproject.core import get_config_value, set_config_value
+
+
+class TestUsethisConfig:
+    def test_set_restores(self):
+        # Arrange
+        before = usethis_config.quiet
+
+        # Act
+        with usethis_config.set(quiet=not before):
+            during = usethis_config.quiet
+
+        # Assert
+        assert during is not before
+        assert usethis_config.quiet is before
+
+    def test_set_restores_on_error(self):
+        # Arrange
+        before = usethis_config.frozen
+
+        def set_then_fail() -> None:
+            with usethis_config.set(frozen=not before):
+                msg = "Oops"
+                raise ValueError(msg)
+
+        # Act
+        with pytest.raises(ValueError, match="Oops"):
+            set_then_fail()
+
+        # Assert
+        assert usethis_config.frozen is before
+
+    def test_cpd_defaults_to_cwd(self):
+        assert usethis_config.cpd() == Path.cwd()
+
+    def test_cpd_project_dir(self, tmp_path: Path):
+        # Act
+        with usethis_config.set(project_dir=tmp_path):
+            cpd = usethis_config.cpd()
+
+        # Assert
+        assert cpd == tmp_path.resolve()
+        assert usethis_config.cpd() == Path.cwd()
+
+    def test_threads_isolated(self, tmp_path: Path):
+        # Arrange
+        paths = [tmp_path / str(idx) for idx in range(8)]
+        for path in paths:
+            path.mkdir()
+            (path / "pyproject.toml").write_text("[project]\n")
+
+        def configure(path: Path) -> str:
+            with usethis_config.set(project_dir=path, quiet=True):
+                set_config_value(["tool", "usethis", "name"], path.name)
+                return get_config_value(["tool", "usethis", "name"])
+
+        # Act
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            names = list(executor.map(configure, paths))
+
+        # Assert
+        assert names == [path.name for path in paths]
+        for path in paths:
+            assert f'name = "{path.name}"' in (path / "pyproject.toml").read_text()
+        assert usethis_config.cpd() == Path.cwd()
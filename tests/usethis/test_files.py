@@ -0,0 +1,268 @@
+from pathlib import Path
+
+import pytest
+
+from usethis._config import usethis_config
+from usethis._files import (
+    DiskFileSystem,
+    MemoryFileSystem,
+    exists,
+    get_generation,
+    has_staged_files,
+    is_dir,
+    is_on_disk,
+    iterdir,
+    mkdir,
+    read_text,
+    rmtree,
+    staged_files,
+    unlink,
+    use_filesystem,
+    write_text,
+)
+from usethis._test import change_cwd
+
+
+class TestMemoryFileSystem:
+    def test_roundtrip(self):
+        # Arrange
+        fs = MemoryFileSystem()
+        path = Path("/project/a/b.txt")
+
+        # Act
+        fs.write_text(path, "hello\n")
+
+        # Assert
+        assert fs.read_text(path) == "hello\n"
+        assert fs.exists(path)
+        assert fs.is_dir(Path("/project/a"))
+        assert fs.iterdir(Path("/project")) == [Path("/project/a")]
+
+    def test_read_missing(self):
+        # Arrange
+        fs = MemoryFileSystem()
+
+        # Act, Assert
+        with pytest.raises(FileNotFoundError):
+            fs.read_text(Path("/missing.txt"))
+
+    def test_rmtree(self):
+        # Arrange
+        fs = MemoryFileSystem(
+            {Path("/p/tests/conftest.py"): "", Path("/p/pyproject.toml"): ""}
+        )
+
+        # Act
+        fs.rmtree(Path("/p/tests"))
+
+        # Assert
+        assert not fs.is_dir(Path("/p/tests"))
+        assert fs.iterdir(Path("/p")) == [Path("/p/pyproject.toml")]
+
+    def test_counts(self):
+        # Arrange
+        fs = MemoryFileSystem({Path("/p/a.txt"): "a"})
+
+        # Act
+        fs.read_text(Path("/p/a.txt"))
+        fs.read_text(Path("/p/a.txt"))
+        fs.exists(Path("/p/b.txt"))
+
+        # Assert
+        assert fs.counts == {"read_text": 2, "exists": 1}
+
+
+class TestUseFilesystem:
+    def test_in_memory(self, tmp_path: Path):
+        # Arrange
+        fs = MemoryFileSystem()
+
+        # Act
+        with usethis_config.set(project_dir=tmp_path), use_filesystem(fs):
+            write_text(Path("a.txt"), "hello\n")
+            on_disk = is_on_disk()
+
+        # Assert
+        assert not on_disk
+        assert fs.files == {tmp_path.resolve() / "a.txt": "hello\n"}
+        assert not (tmp_path / "a.txt").exists()
+        assert is_on_disk()
+
+    def test_disk_counts(self, tmp_path: Path):
+        # Arrange
+        fs = DiskFileSystem()
+
+        # Act
+        with use_filesystem(fs):
+            write_text(tmp_path / "a.txt", "hello\n")
+            read_text(tmp_path / "a.txt")
+
+        # Assert
+        assert fs.counts == {"write_text": 1, "read_text": 1}
+        assert (tmp_path / "a.txt").read_text() == "hello\n"
+
+
+class TestStagedFiles:
+    def test_write_not_on_disk(self, tmp_path: Path):
+        # Arrange
+        path = tmp_path / "a.txt"
+
+        # Act
+        with staged_files(commit=False):
+            write_text(path, "hello\n")
+
+            # Assert
+            assert exists(path)
+            assert read_text(path) == "hello\n"
+            assert not path.exists()
+
+        assert not path.exists()
+
+    def test_commit_on_exit(self, tmp_path: Path):
+        # Arrange
+        path = tmp_path / "a.txt"
+        path.write_text("old\n")
+
+        # Act
+        with staged_files():
+            write_text(path, "new\n")
+            assert path.read_text() == "old\n"
+
+        # Assert
+        assert path.read_text() == "new\n"
+
+    def test_error_discards(self, tmp_path: Path):
+        # Arrange
+        path = tmp_path / "a.txt"
+
+        def write_then_fail() -> None:
+            with staged_files():
+                write_text(path, "hello\n")
+                msg = "Oops"
+                raise ValueError(msg)
+
+        # Act
+        with pytest.raises(ValueError, match="Oops"):
+            write_then_fail()
+
+        # Assert
+        assert not path.exists()
+
+    def test_unlink(self, tmp_path: Path):
+        # Arrange
+        path = tmp_path / "a.txt"
+        path.write_text("hello\n")
+
+        # Act
+        with staged_files():
+            unlink(path)
+            assert not exists(path)
+            assert path.exists()
+
+        # Assert
+        assert not path.exists()
+
+    def test_has_staged_files(self, tmp_path: Path):
+        # Act
+        with staged_files(commit=False):
+            during = has_staged_files()
+
+        # Assert
+        assert during
+        assert not has_staged_files()
+
+    def test_generation_changes(self, tmp_path: Path):
+        # Arrange
+        before = get_generation()
+
+        # Act
+        with staged_files():
+            during = get_generation()
+
+        # Assert
+        assert len({before, during, get_generation()}) == 3
+
+    def test_diff(self, tmp_path: Path):
+        # Arrange
+        (tmp_path / "modified.txt").write_text("a\nb\n")
+        (tmp_path / "deleted.txt").write_text("x\n")
+
+        # Act
+        with change_cwd(tmp_path), staged_files(commit=False) as staged:
+            write_text(tmp_path / "modified.txt", "a\nc\n")
+            unlink(tmp_path / "deleted.txt")
+            write_text(tmp_path / "created.txt", "y")
+            diff = staged.diff()
+
+        # Assert
+        assert diff.splitlines() == [
+            "--- /dev/null",
+            "+++ b/created.txt",
+            "@@ -0,0 +1 @@",
+            "+y",
+            "\\ No newline at end of file",
+            "--- a/deleted.txt",
+            "+++ /dev/null",
+            "@@ -1 +0,0 @@",
+            "-x",
+            "--- a/modified.txt",
+            "+++ b/modified.txt",
+            "@@ -1,2 +1,2 @@",
+            " a",
+            "-b",
+            "+c",
+        ]
+
+    def test_no_diff_when_unchanged(self, tmp_path: Path):
+        # Arrange
+        path = tmp_path / "a.txt"
+        path.write_text("hello\n")
+
+        # Act
+        with staged_files(commit=False) as staged:
+            write_text(path, "hello\n")
+
+            # Assert
+            assert staged.diff() == ""
+
+    def test_relative_to_project_dir(self, tmp_path: Path):
+        # Act
+        with usethis_config.set(project_dir=tmp_path):
+            write_text(Path("a.txt"), "hello\n")
+
+        # Assert
+        assert (tmp_path / "a.txt").read_text() == "hello\n"
+
+    def test_directories(self, tmp_path: Path):
+        # Arrange
+        (tmp_path / "tests").mkdir()
+        (tmp_path / "tests" / "conftest.py").write_text("")
+        (tmp_path / "old").mkdir()
+
+        # Act
+        with staged_files():
+            rmtree(tmp_path / "tests")
+            mkdir(tmp_path / "new")
+
+            # Assert
+            assert not is_dir(tmp_path / "tests")
+            assert is_dir(tmp_path / "new")
+            assert iterdir(tmp_path) == [tmp_path / "new", tmp_path / "old"]
+            assert (tmp_path / "tests").exists()
+
+        assert not (tmp_path / "tests").exists()
+        assert (tmp_path / "new").is_dir()
+
+    def test_over_memory(self):
+        # Arrange
+        fs = MemoryFileSystem({Path("/p/a.txt"): "a"})
+
+        # Act
+        with use_filesystem(fs), staged_files():
+            write_text(Path("/p/a.txt"), "b")
+            read_text(Path("/p/a.txt"))
+            assert fs.files[Path("/p/a.txt")] == "a"
+
+        # Assert
+        assert fs.files[Path("/p/a.txt")] == "b"
+        assert fs.counts["read_text"] == 1
@@ -1,14 +1,24 @@
+import shlex
+import subprocess
 from pathlib import Path
 
 import pytest
 
+from usethis._files import DiskFileSystem, use_filesystem
 from usethis._integrations.pre_commit.hooks import _PLACEHOLDER_ID, get_hook_names
 from usethis._integrations.pre_commit.schema import HookDefinition, LocalRepo, UriRepo
 from usethis._integrations.pyproject.config import PyProjectConfig
 from usethis._integrations.pyproject.core import set_config_value
 from usethis._integrations.uv.deps import Dependency, add_deps_to_group
-from usethis._test import change_cwd
-from usethis._tool import ALL_TOOLS, DeptryTool, Tool
+from usethis._test import GitHubStub, change_cwd
+from usethis._tool import (
+    ALL_TOOLS,
+    DeptryTool,
+    PyprojectFmtTool,
+    RuffTool,
+    Tool,
+    _get_hook_entry,
+)
 
 
 class DefaultTool(Tool):
@@ -310,12 +320,7 @@ class TestTool:
 
             # Act
             with change_cwd(uv_init_dir):
-                # Currently this feature isn't implemented, so when it is this
-                # with-raises block can be removed and the test no longer needs to be
-                # skipped.
-                with pytest.raises(NotImplementedError):
-                    mrt_tool.add_pre_commit_repo_configs()
-                pytest.skip("Multiple hooks in one repo not supported yet.")
+                mrt_tool.add_pre_commit_repo_configs()
 
                 # Assert
                 assert (uv_init_dir / ".pre-commit-config.yaml").exists()
@@ -385,12 +390,7 @@ repos:
 
             # Act
             with change_cwd(tmp_path):
-                # Currently, we are expecting multiple hooks to not be supported.
-                # At the point where we do support it, this with-raises block and
-                # test skip can be removed - the rest of the test becomes valid.
-                with pytest.raises(NotImplementedError):
-                    th_tool.add_pre_commit_repo_configs()
-                pytest.skip("Multiple hooks in one repo not supported yet")
+                th_tool.add_pre_commit_repo_configs()
 
                 # Assert
                 out, err = capfd.readouterr()
@@ -400,16 +400,19 @@ repos:
                 )
                 assert get_hook_names() == ["ruff", "ruff-format"]
 
+            # The existing hook is left alone, and the new one isn't added to a repo
+            # with a different URL.
             assert (
                 (tmp_path / ".pre-commit-config.yaml").read_text()
                 == """\
 repos:
   - repo: local
     hooks:
-      - id: ruff-format
-        entry: ruff format
       - id: ruff
         entry: echo "different now!"
+  - repo: example
+    hooks:
+      - id: ruff-format
 """
             )
 
@@ -423,12 +426,39 @@ repos:
 
             # Act
             with change_cwd(tmp_path):
-                # Currently, multiple hooks are not supported.
-                # If we do ever support it, this with-raises block and
-                # test skip can be removed. Instead, we will need to write this test.
-                with pytest.raises(NotImplementedError):
-                    th_tool.add_pre_commit_repo_configs()
-                pytest.skip("Multiple hooks in one repo not supported yet")
+                th_tool.add_pre_commit_repo_configs()
+
+                # Assert
+                out, err = capfd.readouterr()
+                assert not err
+                assert out == (
+                    "✔ Writing '.pre-commit-config.yaml'.\n"
+                    "✔ Adding hook 'ruff' to '.pre-commit-config.yaml'.\n"
+                    "✔ Adding hook 'ruff-format' to '.pre-commit-config.yaml'.\n"
+                )
+
+            assert (
+                (tmp_path / ".pre-commit-config.yaml").read_text()
+                == """\
+repos:
+  - repo: example
+    hooks:
+      - id: ruff
+      - id: ruff-format
+"""
+            )
+
+        def test_single_write(self, tmp_path: Path):
+            # Arrange
+            (tmp_path / ".pre-commit-config.yaml").write_text("repos: []\n")
+
+            # Act
+            with change_cwd(tmp_path), use_filesystem(DiskFileSystem()) as fs:
+                RuffTool().add_pre_commit_repo_configs()
+
+                # Assert
+                assert get_hook_names() == ["ruff-format", "ruff"]
+            assert fs.counts["write_text"] == 1
 
     class TestRemovePreCommitRepoConfigs:
         def test_no_file_remove_none(self, tmp_path: Path):
@@ -521,6 +551,20 @@ repos:
                 assert (tmp_path / ".pre-commit-config.yaml").exists()
                 assert get_hook_names() == [_PLACEHOLDER_ID]
 
+        def test_single_write(self, tmp_path: Path):
+            # Arrange
+            (tmp_path / ".pre-commit-config.yaml").write_text("repos: []\n")
+            with change_cwd(tmp_path):
+                RuffTool().add_pre_commit_repo_configs()
+
+            # Act
+            with change_cwd(tmp_path), use_filesystem(DiskFileSystem()) as fs:
+                RuffTool().remove_pre_commit_repo_configs()
+
+                # Assert
+                assert get_hook_names() == [_PLACEHOLDER_ID]
+            assert fs.counts["write_text"] == 1
+
         def test_two_repos_remove_same_two(self, tmp_path: Path):
             # Arrange
             class TwoRepoTool(Tool):
@@ -702,6 +746,23 @@ ignore_missing = ["pytest"]
         assert "[tool.deptry]" not in pyproject.read_text()
         assert "ignore_missing" not in pyproject.read_text()
 
+    def test_pre_commit_changed_files_only(self, tmp_path: Path):
+        # Arrange
+        (tmp_path / "pyproject.toml").write_text("""\
+[tool.usethis.pre-commit]
+changed-files-only = true
+""")
+
+        # Act
+        with change_cwd(tmp_path):
+            (repo,) = DeptryTool().get_pre_commit_repos()
+
+        # Assert
+        (hook,) = repo.hooks or []
+        assert hook.always_run is None
+        assert hook.pass_filenames is False
+        assert hook.files == "(^pyproject\\.toml|\\.pyi?)$"
+
     def test_config_keys_are_subkeys_of_id_keys(self):
         """Test that all config keys are subkeys of id keys."""
         # Arrange
@@ -719,6 +780,89 @@ ignore_missing = ["pytest"]
             )
 
 
+class TestRuffTool:
+    class TestGetPreCommitRepos:
+        def test_always_run(self, tmp_path: Path):
+            with change_cwd(tmp_path):
+                (repo,) = RuffTool().get_pre_commit_repos()
+
+            assert [hook.always_run for hook in repo.hooks or []] == [True, True]
+
+        def test_changed_files_only(self, tmp_path: Path):
+            # Arrange
+            (tmp_path / "pyproject.toml").write_text("""\
+[tool.usethis.pre-commit]
+changed-files-only = true
+""")
+
+            # Act
+            with change_cwd(tmp_path):
+                (repo,) = RuffTool().get_pre_commit_repos()
+
+            # Assert
+            for hook in repo.hooks or []:
+                assert hook.always_run is None
+                assert hook.pass_filenames is not False
+                assert hook.types_or is not None
+
+
+class TestGetHookEntry:
+    def test_uv_run(self, tmp_path: Path):
+        with change_cwd(tmp_path):
+            entry = _get_hook_entry("ruff", "check", "--fix")
+
+        assert entry == "uv run --frozen ruff check --fix"
+
+    @pytest.mark.parametrize("is_venv", [True, False])
+    def test_direct_venv(self, tmp_path: Path, is_venv: bool):
+        # Arrange
+        (tmp_path / "pyproject.toml").write_text("""\
+[tool.usethis.pre-commit]
+direct-venv = true
+""")
+        bin_dir = tmp_path / "bin"
+        bin_dir.mkdir()
+        fake_uv = bin_dir / "uv"
+        fake_uv.write_text('#!/bin/sh\necho "uv $*"\n')
+        fake_uv.chmod(0o755)
+        if is_venv:
+            (tmp_path / ".venv" / "bin").mkdir(parents=True)
+            fake_ruff = tmp_path / ".venv" / "bin" / "ruff"
+            fake_ruff.write_text('#!/bin/sh\necho "venv ruff $*"\n')
+            fake_ruff.chmod(0o755)
+
+        with change_cwd(tmp_path):
+            entry = _get_hook_entry("ruff", "check", "--fix")
+
+        # Act: run the entry as pre-commit would, with the filenames appended.
+        result = subprocess.run(
+            [*shlex.split(entry), "a b.py"],
+            cwd=tmp_path,
+            env={"PATH": f"{bin_dir}:/usr/bin:/bin"},
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+
+        # Assert
+        if is_venv:
+            assert result.stdout == "venv ruff check --fix a b.py\n"
+        else:
+            assert result.stdout == "uv run --frozen ruff check --fix a b.py\n"
+
+
+class TestPyprojectFmtTool:
+    class TestGetPreCommitRepos:
+        def test_pinned_without_network(self, github_stub: GitHubStub):
+            github_stub.tags["tox-dev/pyproject-fmt"] = ["v9.9.9", "v2.5.0"]
+
+            (repo,) = PyprojectFmtTool().get_pre_commit_repos()
+
+            assert isinstance(repo, UriRepo)
+            assert repo.rev == "v2.5.0"
+            assert not github_stub.paths
+
+
 @pytest.mark.parametrize("tool", ALL_TOOLS)
 def test_all_tools_config_keys_are_subkeys_of_id_keys(tool: Tool):
     """Test that all tools' config keys are subkeys of their ID keys."""